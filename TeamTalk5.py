@@ -1,11 +1,23 @@
 import sys
 import os
 import ctypes
+import logging
 from ctypes import cdll, c_int, c_char, c_wchar, c_wchar_p, c_char_p, \
                    c_longlong, c_uint, c_float, c_void_p, c_uint16, \
                    Structure, Union, POINTER, byref
 
-if sys.platform == "win32":
+# TEAMTALK_BACKEND=fake swaps the SDK library for the in-process simulator in
+# fake_teamtalk.py, for load testing without a server.
+TEAMTALK_BACKEND = os.environ.get("TEAMTALK_BACKEND", "native")
+
+if TEAMTALK_BACKEND == "fake":
+    import fake_teamtalk
+    dll = fake_teamtalk.FakeLibrary()
+    TTCHAR = c_char
+    TTCHAR_P = c_char_p
+    BOOL = c_int
+    LOADED_TT_LIB = "fake_teamtalk"
+elif sys.platform == "win32":
     if (sys.version_info.major == 3 and sys.version_info.minor >= 8):
         # Path relative to TeamTalk SDK's DLL location
         os.add_dll_directory(os.path.join(os.path.dirname(os.path.abspath(__file__)), "TeamTalk_DLL"))
@@ -33,6 +45,11 @@ else:
     TTCHAR = c_char
     TTCHAR_P = c_char_p
     BOOL = c_int
+
+# Set TEAMTALK_PY_DEBUG=1 to check every structure's size against the DLL on
+# construction and to allocate a fresh TTMessage on each getMessage() call.
+TT_DEBUG = os.environ.get("TEAMTALK_PY_DEBUG", "") not in ("", "0")
+
 INT32 = c_int
 INT64 = c_longlong
 UINT32 = c_uint
@@ -50,7 +67,7 @@ _TTSoundLoop = c_void_p
 # string to and from TeamTalk5.dll are UTF-16.
 def ttstr(ttchar_p_str: TTCHAR_P) -> str:
 
-    if sys.platform == "win32":
+    if TTCHAR is c_wchar:
         return ttchar_p_str
 
     if isinstance(ttchar_p_str, bytes):
@@ -108,8 +125,6 @@ class SoundDevice(Structure):
     ("nDefaultSampleRate", INT32),
     ("uSoundDeviceFeatures", UINT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SOUNDDEVICE) == ctypes.sizeof(SoundDevice))
 
 TT_SOUNDDEVICE_ID_SHARED_FLAG           = 0x00000800
 TT_SOUNDDEVICE_ID_MASK                  = 0x000007FF
@@ -125,8 +140,6 @@ class SoundDeviceEffects(Structure):
     ("bEnableDenoise", BOOL),
     ("bEnableEchoCancellation", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SoundDeviceEffects) == ctypes.sizeof(SoundDeviceEffects))
 
 class SoundLevel(INT32):
     SOUND_VU_MAX = 100
@@ -148,8 +161,6 @@ class AudioBlock(Structure):
     ("uSampleIndex", UINT32),
     ("uStreamTypes", UINT32),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOBLOCK) == ctypes.sizeof(AudioBlock))
 
 TT_LOCAL_USERID     = 0
 TT_LOCAL_TX_USERID  = 0x1002
@@ -181,8 +192,6 @@ class AudioFormat(Structure):
     ("nSampleRate", INT32),
     ("nChannels", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOFORMAT) == ctypes.sizeof(AudioFormat))
 
 class FourCC(INT32):
     FOURCC_NONE =   0
@@ -198,8 +207,6 @@ class VideoFormat(Structure):
     ("nFPS_Denominator", INT32),
     ("picFourCC", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.VIDEOFORMAT) == ctypes.sizeof(VideoFormat))
 
 class VideoFrame(Structure):
     _fields_ = [
@@ -210,8 +217,6 @@ class VideoFrame(Structure):
     ("frameBuffer", c_void_p),
     ("nFrameBufferSize", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.VIDEOFRAME) == ctypes.sizeof(VideoFrame))
 
 class VideoCaptureDevice(Structure):
     _fields_ = [
@@ -221,8 +226,6 @@ class VideoCaptureDevice(Structure):
     ("videoFormats", VideoFormat*TT_VIDEOFORMATS_MAX),
     ("nVideoFormatsCount", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.VIDEOCAPTUREDEVICE) == ctypes.sizeof(VideoCaptureDevice))
 
 class BitmapFormat(INT32):
     BMP_NONE = 0
@@ -245,8 +248,6 @@ class DesktopWindow(Structure):
     ("frameBuffer", c_void_p),
     ("nFrameBufferSize", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.DESKTOPWINDOW) == ctypes.sizeof(DesktopWindow))
 
 class DesktopKeyState(UINT32):
     DESKTOPKEYSTATE_NONE = 0x00000000
@@ -260,8 +261,6 @@ class DesktopInput(Structure):
     ("uKeyCode", UINT32),
     ("uKeyState", UINT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.DESKTOPINPUT) == ctypes.sizeof(DesktopInput))
 
 class SpeexCodec(Structure):
     _fields_ = [
@@ -270,8 +269,6 @@ class SpeexCodec(Structure):
     ("nTxIntervalMSec", INT32),
     ("bStereoPlayback", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SPEEXCODEC) == ctypes.sizeof(SpeexCodec))
 
 class SpeexVBRCodec(Structure):
     _fields_ = [
@@ -283,8 +280,6 @@ class SpeexVBRCodec(Structure):
     ("nTxIntervalMSec", INT32),
     ("bStereoPlayback", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SPEEXVBRCODEC) == ctypes.sizeof(SpeexVBRCodec))
 
 SPEEX_NB_MIN_BITRATE = 2150
 SPEEX_NB_MAX_BITRATE = 24600
@@ -307,8 +302,6 @@ class OpusCodec(Structure):
     ("nTxIntervalMSec", INT32),
     ("nFrameSizeMSec", INT32),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.OPUSCODEC) == ctypes.sizeof(OpusCodec))
 
 OPUS_APPLICATION_VOIP = 2048
 OPUS_APPLICATION_AUDIO = 2049
@@ -331,8 +324,6 @@ class SpeexDSP(Structure):
     ("nEchoSuppress", INT32),
     ("nEchoSuppressActive", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SPEEXDSP) == ctypes.sizeof(SpeexDSP))
 
 class TTAudioPreprocessor(Structure):
     _fields_ = [
@@ -340,8 +331,6 @@ class TTAudioPreprocessor(Structure):
     ("bMuteLeftSpeaker", BOOL),
     ("bMuteRightSpeaker", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.TTAUDIOPREPROCESSOR) == ctypes.sizeof(TTAudioPreprocessor))
 
 class WebRTCAudioPreprocessor(Structure):
     _fields_ = [
@@ -360,8 +349,6 @@ class WebRTCAudioPreprocessor(Structure):
         ("gaincontroller2_adaptivedigital_fMaxOutputNoiseLevelDBFS", FLOAT),
         ("levelestimation_bEnable", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.WEBRTCAUDIOPREPROCESSOR) == ctypes.sizeof(WebRTCAudioPreprocessor))
 
 class AudioPreprocessorType(INT32):
     NO_AUDIOPREPROCESSOR = 0
@@ -382,8 +369,6 @@ class AudioPreprocessor(Structure):
     ("nPreprocessor", INT32),
     ("u", AudioPreprocessorUnion)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOPREPROCESSOR) == ctypes.sizeof(AudioPreprocessor))
 
 class WebMVP8CodecUnion(Union):
     _fields_ = [
@@ -397,8 +382,6 @@ class WebMVP8Codec(Structure):
     ("u", WebMVP8CodecUnion),
     ("nEncodeDeadline", UINT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.WEBMVP8CODEC) == ctypes.sizeof(WebMVP8Codec))
 
 WEBM_VPX_DL_REALTIME = 1
 WEBM_VPX_DL_GOOD_QUALITY = 1000000
@@ -424,16 +407,12 @@ class AudioCodec(Structure):
     ("nCodec", INT32),
     ("u", AudioCodecUnion)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOCODEC) == ctypes.sizeof(AudioCodec))
 
 class AudioConfig(Structure):
     _fields_ = [
     ("bEnableAGC", BOOL),
     ("nGainLevel", INT32),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOCONFIG) == ctypes.sizeof(AudioConfig))
 
 class VideoCodecUnion(Union):
     _fields_ = [
@@ -446,8 +425,6 @@ class VideoCodec(Structure):
     ("nCodec", INT32),
     ("u", VideoCodecUnion)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.VIDEOCODEC) == ctypes.sizeof(VideoCodec))
 
 class MediaFileInfo(Structure):
     _fields_ = [
@@ -458,8 +435,6 @@ class MediaFileInfo(Structure):
     ("uDurationMSec", UINT32),
     ("uElapsedMSec", UINT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.MEDIAFILEINFO) == ctypes.sizeof(MediaFileInfo))
 
 class MediaFilePlayback(Structure):
     _fields_ = [
@@ -467,8 +442,6 @@ class MediaFilePlayback(Structure):
     ("bPaused", BOOL),
     ("audioPreprocessor", AudioPreprocessor)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.MEDIAFILEPLAYBACK) == ctypes.sizeof(MediaFilePlayback))
 
 TT_MEDIAPLAYBACK_OFFSET_IGNORE = 0xFFFFFFFF
 
@@ -478,8 +451,6 @@ class AudioInputProgress(Structure):
     ("uQueueMSec", UINT32),
     ("uElapsedMSec", UINT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.AUDIOINPUTPROGRESS) == ctypes.sizeof(AudioInputProgress))
 
 class UserRight(UINT32):
     USERRIGHT_NONE = 0x00000000
@@ -560,8 +531,6 @@ class ServerProperties(Structure):
     ("szAccessToken", TTCHAR*TT_STRLEN),
     ("uServerLogEvents", UINT32),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SERVERPROPERTIES) == ctypes.sizeof(ServerProperties))
 
 class ServerStatistics(Structure):
     _fields_ = [
@@ -581,8 +550,6 @@ class ServerStatistics(Structure):
     ("nFilesRx", INT64),
     ("nUptimeMSec", INT64)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.SERVERSTATISTICS) == ctypes.sizeof(ServerStatistics))
 
 class BanType(UINT32):
     BANTYPE_NONE = 0x00
@@ -600,8 +567,6 @@ class BannedUser(Structure):
     ("uBanTypes", UINT32),
     ("szOwner", TTCHAR*TT_STRLEN)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.BANNEDUSER) == ctypes.sizeof(BannedUser))
 
 class UserType(UINT32):
     USERTYPE_NONE = 0x0
@@ -613,8 +578,6 @@ class AbusePrevention(Structure):
     ("nCommandsLimit", INT32),
     ("nCommandsIntervalMSec", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.ABUSEPREVENTION) == ctypes.sizeof(AbusePrevention))
 
 class UserAccount(Structure):
     _fields_ = [
@@ -630,8 +593,6 @@ class UserAccount(Structure):
     ("abusePrevent", AbusePrevention),
     ("szLastModified", TTCHAR*TT_STRLEN),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.USERACCOUNT) == ctypes.sizeof(UserAccount))
 
 class Subscription(UINT32):
     SUBSCRIBE_NONE = 0x00000000
@@ -692,8 +653,6 @@ class User(Structure):
     ("nActiveAdaptiveDelayMSec", INT32),
     ("szClientName", TTCHAR * TT_STRLEN)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.USER) == ctypes.sizeof(User))
 
 class UserStatistics(Structure):
     _fields_ = [
@@ -710,8 +669,6 @@ class UserStatistics(Structure):
     ("nMediaFileVideoFramesLost", INT64),
     ("nMediaFileVideoFramesDropped", INT64),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.USERSTATISTICS) == ctypes.sizeof(UserStatistics))
 
 class TextMsgType(INT32):
     MSGTYPE_NONE = 0
@@ -730,8 +687,6 @@ class TextMessage(Structure):
     ("szMessage", TTCHAR*TT_STRLEN),
     ("bMore", BOOL),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.TEXTMESSAGE) == ctypes.sizeof(TextMessage))
 
 class ChannelType(UINT32):
     CHANNEL_DEFAULT = 0x0000
@@ -764,8 +719,6 @@ class Channel(Structure):
     ("nTimeOutTimerVoiceMSec", INT32),
     ("nTimeOutTimerMediaFileMSec", INT32),
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.CHANNEL) == ctypes.sizeof(Channel))
 
 class FileTransferStatus(INT32):
     FILETRANSFER_CLOSED = 0
@@ -784,8 +737,6 @@ class FileTransfer(Structure):
     ("nTransferred", INT64),
     ("bInbound", BOOL)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.FILETRANSFER) == ctypes.sizeof(FileTransfer))
 
 class RemoteFile(Structure):
     _fields_ = [
@@ -796,8 +747,6 @@ class RemoteFile(Structure):
     ("szUsername", TTCHAR*TT_STRLEN),
     ("szUploadTime", TTCHAR*TT_STRLEN)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.REMOTEFILE) == ctypes.sizeof(RemoteFile))
 
 class EncryptionContext(Structure):
     _fields_ = [
@@ -819,8 +768,6 @@ class ClientKeepAlive(Structure):
     ("nUdpConnectRTXMSec", INT32),
     ("nUdpConnectTimeoutMSec", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.CLIENTKEEPALIVE) == ctypes.sizeof(ClientKeepAlive))
 
 class ClientStatistics(Structure):
     _fields_ = [
@@ -842,8 +789,6 @@ class ClientStatistics(Structure):
     ("nUdpServerSilenceSec", INT32),
     ("nSoundInputDeviceDelayMSec", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.CLIENTSTATISTICS) == ctypes.sizeof(ClientStatistics))
 
 class JitterConfig(Structure):
     _fields_ = [
@@ -852,8 +797,6 @@ class JitterConfig(Structure):
     ("nMaxAdaptiveDelayMSec", INT32),
     ("nActiveAdaptiveDelayMSec", INT32)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.JITTERCONFIG) == ctypes.sizeof(JitterConfig))
 
 class ClientError(INT32):
     CMDERR_SUCCESS = 0
@@ -906,8 +849,6 @@ class ClientErrorMsg(Structure):
     ("nErrorNo", INT32),
     ("szErrorMsg", TTCHAR*TT_STRLEN)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.CLIENTERRORMSG) == ctypes.sizeof(ClientErrorMsg))
 
 class ClientEvent(UINT32):
     CLIENTEVENT_NONE = 0
@@ -1049,8 +990,56 @@ class TTMessage(Structure):
     ("uReserved", UINT32),
     ("u", TTMessageUnion)
     ]
-    def __init__(self):
-        assert(DBG_SIZEOF(TTType.TTMESSAGE) == ctypes.sizeof(TTMessage))
+
+# Structures whose layout must match the TeamTalk DLL. Sizes are checked once
+# by verifyStructSizes() instead of on every construction.
+_STRUCT_TTTYPES = [
+    (SoundDevice, TTType.SOUNDDEVICE),
+    (SoundDeviceEffects, TTType.SOUNDDEVICEEFFECTS),
+    (AudioBlock, TTType.AUDIOBLOCK),
+    (AudioFormat, TTType.AUDIOFORMAT),
+    (VideoFormat, TTType.VIDEOFORMAT),
+    (VideoFrame, TTType.VIDEOFRAME),
+    (VideoCaptureDevice, TTType.VIDEOCAPTUREDEVICE),
+    (DesktopWindow, TTType.DESKTOPWINDOW),
+    (DesktopInput, TTType.DESKTOPINPUT),
+    (SpeexCodec, TTType.SPEEXCODEC),
+    (SpeexVBRCodec, TTType.SPEEXVBRCODEC),
+    (OpusCodec, TTType.OPUSCODEC),
+    (SpeexDSP, TTType.SPEEXDSP),
+    (TTAudioPreprocessor, TTType.TTAUDIOPREPROCESSOR),
+    (WebRTCAudioPreprocessor, TTType.WEBRTCAUDIOPREPROCESSOR),
+    (AudioPreprocessor, TTType.AUDIOPREPROCESSOR),
+    (WebMVP8Codec, TTType.WEBMVP8CODEC),
+    (AudioCodec, TTType.AUDIOCODEC),
+    (AudioConfig, TTType.AUDIOCONFIG),
+    (VideoCodec, TTType.VIDEOCODEC),
+    (MediaFileInfo, TTType.MEDIAFILEINFO),
+    (MediaFilePlayback, TTType.MEDIAFILEPLAYBACK),
+    (AudioInputProgress, TTType.AUDIOINPUTPROGRESS),
+    (ServerProperties, TTType.SERVERPROPERTIES),
+    (ServerStatistics, TTType.SERVERSTATISTICS),
+    (BannedUser, TTType.BANNEDUSER),
+    (AbusePrevention, TTType.ABUSEPREVENTION),
+    (UserAccount, TTType.USERACCOUNT),
+    (User, TTType.USER),
+    (UserStatistics, TTType.USERSTATISTICS),
+    (TextMessage, TTType.TEXTMESSAGE),
+    (Channel, TTType.CHANNEL),
+    (FileTransfer, TTType.FILETRANSFER),
+    (RemoteFile, TTType.REMOTEFILE),
+    (ClientKeepAlive, TTType.CLIENTKEEPALIVE),
+    (ClientStatistics, TTType.CLIENTSTATISTICS),
+    (JitterConfig, TTType.JITTERCONFIG),
+    (ClientErrorMsg, TTType.CLIENTERRORMSG),
+    (TTMessage, TTType.TTMESSAGE),
+]
+
+# The structures the bot reads or passes to the DLL (events, users, channels,
+# text messages, account, bans, server properties). A size mismatch in one of
+# these corrupts data, so it is an error; in the others it is only logged.
+_REQUIRED_STRUCTS = (TTMessage, TextMessage, User, Channel, UserAccount, AbusePrevention,
+                     ClientErrorMsg, BannedUser, ServerProperties)
 
 class ClientFlags(UINT32):
     CLIENT_CLOSED = 0x00000000
@@ -1082,150 +1071,176 @@ def function_factory(func, signature):
         pass
     return func
 
-_GetVersion = function_factory(dll.TT_GetVersion, [TTCHAR_P])
-_InitTeamTalkPoll = function_factory(dll.TT_InitTeamTalkPoll, [_TTInstance])
-_CloseTeamTalk = function_factory(dll.TT_CloseTeamTalk, [BOOL, [_TTInstance]])
-_GetMessage = function_factory(dll.TT_GetMessage, [BOOL, [_TTInstance, POINTER(TTMessage), POINTER(INT32)]])
-_PumpMessage = function_factory(dll.TT_PumpMessage, [BOOL, [_TTInstance, ClientEvent, INT32]])
-_GetFlags = function_factory(dll.TT_GetFlags, [UINT32, [_TTInstance]])
-_SetLicenseInformation = function_factory(dll.TT_SetLicenseInformation, [BOOL, [TTCHAR_P, TTCHAR_P]])
-_GetDefaultSoundDevices = function_factory(dll.TT_GetDefaultSoundDevices, [BOOL, [POINTER(INT32), POINTER(INT32)]])
-_GetDefaultSoundDevicesEx = function_factory(dll.TT_GetDefaultSoundDevicesEx, [BOOL, [SoundSystem, POINTER(INT32), POINTER(INT32)]])
-_GetSoundDevices = function_factory(dll.TT_GetSoundDevices, [BOOL, [POINTER(SoundDevice), POINTER(INT32)]])
-_RestartSoundSystem = function_factory(dll.TT_RestartSoundSystem, [BOOL])
-_StartSoundLoopbackTest = function_factory(dll.TT_StartSoundLoopbackTest, [_TTSoundLoop, [INT32, INT32, INT32, INT32, BOOL, POINTER(SpeexDSP)]])
-_StartSoundLoopbackTestEx = function_factory(dll.TT_StartSoundLoopbackTestEx, [_TTSoundLoop, [INT32, INT32, INT32, INT32, BOOL, POINTER(AudioPreprocessor), POINTER(SoundDeviceEffects)]])
-_CloseSoundLoopbackTest = function_factory(dll.TT_CloseSoundLoopbackTest, [BOOL, [_TTSoundLoop]])
-_InitSoundInputDevice = function_factory(dll.TT_InitSoundInputDevice, [BOOL, [_TTInstance, INT32]])
-_InitSoundInputSharedDevice = function_factory(dll.TT_InitSoundInputSharedDevice, [BOOL, [INT32, INT32, INT32]])
-_InitSoundOutputDevice = function_factory(dll.TT_InitSoundOutputDevice, [BOOL, [_TTInstance, INT32]])
-_InitSoundOutputSharedDevice = function_factory(dll.TT_InitSoundOutputSharedDevice, [BOOL, [INT32, INT32, INT32]])
-_InitSoundDuplexDevices = function_factory(dll.TT_InitSoundDuplexDevices, [BOOL, [_TTInstance, INT32, INT32]])
-_CloseSoundInputDevice = function_factory(dll.TT_CloseSoundInputDevice, [BOOL, [_TTInstance]])
-_CloseSoundOutputDevice = function_factory(dll.TT_CloseSoundOutputDevice, [BOOL, [_TTInstance]])
-_CloseSoundDuplexDevices = function_factory(dll.TT_CloseSoundDuplexDevices, [BOOL, [_TTInstance]])
-_SetSoundDeviceEffects = function_factory(dll.TT_SetSoundDeviceEffects, [BOOL, [_TTInstance, POINTER(SoundDeviceEffects)]])
-_GetSoundDeviceEffects = function_factory(dll.TT_GetSoundDeviceEffects, [BOOL, [_TTInstance, POINTER(SoundDeviceEffects)]])
-_GetSoundInputLevel = function_factory(dll.TT_GetSoundInputLevel, [INT32, [_TTInstance]])
-_SetSoundInputGainLevel = function_factory(dll.TT_SetSoundInputGainLevel, [BOOL, [_TTInstance, INT32]])
-_GetSoundInputGainLevel = function_factory(dll.TT_GetSoundInputGainLevel, [INT32, [_TTInstance]])
-_SetSoundInputPreprocess = function_factory(dll.TT_SetSoundInputPreprocess, [BOOL, [_TTInstance, POINTER(SpeexDSP)]])
-_GetSoundInputPreprocess = function_factory(dll.TT_GetSoundInputPreprocess, [BOOL, [_TTInstance, POINTER(SpeexDSP)]])
-_SetSoundInputPreprocessEx = function_factory(dll.TT_SetSoundInputPreprocessEx, [BOOL, [_TTInstance, POINTER(AudioPreprocessor)]])
-_GetSoundInputPreprocessEx = function_factory(dll.TT_GetSoundInputPreprocessEx, [BOOL, [_TTInstance, POINTER(AudioPreprocessor)]])
-_SetSoundOutputVolume = function_factory(dll.TT_SetSoundOutputVolume, [BOOL, [_TTInstance, INT32]])
-_GetSoundOutputVolume = function_factory(dll.TT_GetSoundOutputVolume, [INT32, [_TTInstance]])
-_SetSoundOutputMute = function_factory(dll.TT_SetSoundOutputMute, [BOOL, [_TTInstance, BOOL]])
-_Enable3DSoundPositioning = function_factory(dll.TT_Enable3DSoundPositioning, [BOOL, [_TTInstance, BOOL]])
-_AutoPositionUsers = function_factory(dll.TT_AutoPositionUsers, [BOOL, [_TTInstance]])
-_EnableAudioBlockEvent = function_factory(dll.TT_EnableAudioBlockEvent, [BOOL, [_TTInstance, INT32, INT32, BOOL]])
-_EnableAudioBlockEventEx = function_factory(dll.TT_EnableAudioBlockEventEx, [BOOL, [_TTInstance, INT32, INT32, POINTER(AudioFormat), BOOL]])
-_InsertAudioBlock = function_factory(dll.TT_InsertAudioBlock, [BOOL, [_TTInstance, POINTER(AudioBlock)]])
-_EnableVoiceTransmission = function_factory(dll.TT_EnableVoiceTransmission, [BOOL, [_TTInstance, BOOL]])
-_EnableVoiceActivation = function_factory(dll.TT_EnableVoiceActivation, [BOOL, [_TTInstance, BOOL]])
-_SetVoiceActivationLevel = function_factory(dll.TT_SetVoiceActivationLevel, [BOOL, [_TTInstance, INT32]])
-_GetVoiceActivationLevel = function_factory(dll.TT_GetVoiceActivationLevel, [INT32, [_TTInstance]])
-_SetVoiceActivationStopDelay = function_factory(dll.TT_SetVoiceActivationStopDelay, [BOOL, [_TTInstance, INT32]])
-_GetVoiceActivationStopDelay = function_factory(dll.TT_GetVoiceActivationStopDelay, [INT32, [_TTInstance]])
-_StartRecordingMuxedAudioFile = function_factory(dll.TT_StartRecordingMuxedAudioFile, [BOOL, [_TTInstance, POINTER(AudioCodec), TTCHAR_P, UINT32]])
-_StartRecordingMuxedAudioFileEx = function_factory(dll.TT_StartRecordingMuxedAudioFileEx, [BOOL, [_TTInstance, INT32, TTCHAR_P, UINT32]])
-_StartRecordingMuxedStreams = function_factory(dll.TT_StartRecordingMuxedStreams, [BOOL, [_TTInstance, UINT32, POINTER(AudioCodec), TTCHAR_P, UINT32]])
-_StopRecordingMuxedAudioFile = function_factory(dll.TT_StopRecordingMuxedAudioFile, [BOOL, [_TTInstance]])
-_StopRecordingMuxedAudioFileEx = function_factory(dll.TT_StopRecordingMuxedAudioFileEx, [BOOL, [_TTInstance, INT32]])
-_StartVideoCaptureTransmission = function_factory(dll.TT_StartVideoCaptureTransmission, [BOOL, [_TTInstance, POINTER(VideoCodec)]])
-_StopVideoCaptureTransmission = function_factory(dll.TT_StopVideoCaptureTransmission, [BOOL, [_TTInstance]])
-_GetVideoCaptureDevices = function_factory(dll.TT_GetVideoCaptureDevices, [BOOL, [POINTER(VideoCaptureDevice), POINTER(INT32)]])
-_InitVideoCaptureDevice = function_factory(dll.TT_InitVideoCaptureDevice, [BOOL, [_TTInstance, TTCHAR_P, POINTER(VideoFormat)]])
-_CloseVideoCaptureDevice = function_factory(dll.TT_CloseVideoCaptureDevice, [BOOL, [_TTInstance]])
-_StartStreamingMediaFileToChannel = function_factory(dll.TT_StartStreamingMediaFileToChannel, [BOOL, [_TTInstance, TTCHAR_P, POINTER(VideoCodec)]])
-_StartStreamingMediaFileToChannelEx = function_factory(dll.TT_StartStreamingMediaFileToChannelEx, [BOOL, [_TTInstance, TTCHAR_P, POINTER(MediaFilePlayback), POINTER(VideoCodec)]])
-_UpdateStreamingMediaFileToChannel = function_factory(dll.TT_UpdateStreamingMediaFileToChannel, [BOOL, [_TTInstance, POINTER(MediaFilePlayback), POINTER(VideoCodec)]])
-_StopStreamingMediaFileToChannel = function_factory(dll.TT_StopStreamingMediaFileToChannel, [BOOL, [_TTInstance]])
-_InitLocalPlayback = function_factory(dll.TT_InitLocalPlayback, [INT32, [_TTInstance, TTCHAR_P, POINTER(MediaFilePlayback)]])
-_UpdateLocalPlayback = function_factory(dll.TT_UpdateLocalPlayback, [BOOL, [_TTInstance, INT32, POINTER(MediaFilePlayback)]])
-_StopLocalPlayback = function_factory(dll.TT_StopLocalPlayback, [BOOL, [_TTInstance, INT32]])
-_GetMediaFileInfo = function_factory(dll.TT_GetMediaFileInfo, [BOOL, [_TTInstance, TTCHAR_P, POINTER(MediaFileInfo)]])
-_SetEncryptionContext = function_factory(dll.TT_SetEncryptionContext, [BOOL, [_TTInstance, POINTER(EncryptionContext)]])
-_Connect = function_factory(dll.TT_Connect, [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, INT32, INT32, BOOL]])
-_ConnectSysID = function_factory(dll.TT_ConnectSysID, [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, INT32, INT32, BOOL, TTCHAR_P]])
-_ConnectEx = function_factory(dll.TT_ConnectEx, [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, TTCHAR_P, INT32, INT32, BOOL]])
-_Disconnect = function_factory(dll.TT_Disconnect, [BOOL, [_TTInstance]])
-_QueryMaxPayload = function_factory(dll.TT_QueryMaxPayload, [BOOL, [_TTInstance, INT32]])
-_GetClientStatistics = function_factory(dll.TT_GetClientStatistics, [BOOL, [_TTInstance, POINTER(ClientStatistics)]])
-_SetClientKeepAlive = function_factory(dll.TT_SetClientKeepAlive, [BOOL, [_TTInstance, POINTER(ClientKeepAlive)]])
-_GetClientKeepAlive = function_factory(dll.TT_GetClientKeepAlive, [BOOL, [_TTInstance, POINTER(ClientKeepAlive)]])
-_DoPing = function_factory(dll.TT_DoPing, [INT32, [_TTInstance]])
-_DoLogin = function_factory(dll.TT_DoLogin, [INT32, [_TTInstance, TTCHAR_P, TTCHAR_P, TTCHAR_P]])
-_DoLoginEx = function_factory(dll.TT_DoLoginEx, [INT32, [_TTInstance, TTCHAR_P, TTCHAR_P, TTCHAR_P, TTCHAR_P]])
-_DoLogout = function_factory(dll.TT_DoLogout, [INT32, [_TTInstance]])
-_DoJoinChannel = function_factory(dll.TT_DoJoinChannel, [INT32, [_TTInstance, POINTER(Channel)]])
-_DoJoinChannelByID = function_factory(dll.TT_DoJoinChannelByID, [INT32, [_TTInstance, INT32, TTCHAR_P]])
-_DoLeaveChannel = function_factory(dll.TT_DoLeaveChannel, [INT32, [_TTInstance]])
-_DoChangeNickname = function_factory(dll.TT_DoChangeNickname, [INT32, [_TTInstance, TTCHAR_P]])
-_DoChangeStatus = function_factory(dll.TT_DoChangeStatus, [INT32, [_TTInstance, INT32, TTCHAR_P]])
-_DoTextMessage = function_factory(dll.TT_DoTextMessage, [INT32, [_TTInstance, POINTER(TextMessage)]])
-_DoChannelOp = function_factory(dll.TT_DoChannelOp, [INT32, [_TTInstance, INT32, INT32, BOOL]])
-_DoChannelOpEx = function_factory(dll.TT_DoChannelOpEx, [INT32, [_TTInstance, INT32, INT32, TTCHAR_P, BOOL]])
-_DoKickUser = function_factory(dll.TT_DoKickUser, [INT32, [_TTInstance, INT32, INT32]])
-_DoSendFile = function_factory(dll.TT_DoSendFile, [INT32, [_TTInstance, INT32, TTCHAR_P]])
-_DoRecvFile = function_factory(dll.TT_DoRecvFile, [INT32, [_TTInstance, INT32, INT32, TTCHAR_P]])
-_DoDeleteFile = function_factory(dll.TT_DoDeleteFile, [INT32, [_TTInstance, INT32, INT32]])
-_DoSubscribe = function_factory(dll.TT_DoSubscribe, [INT32, [_TTInstance, INT32, UINT32]])
-_DoUnsubscribe = function_factory(dll.TT_DoUnsubscribe, [INT32, [_TTInstance, INT32, UINT32]])
-_DoMakeChannel = function_factory(dll.TT_DoMakeChannel, [INT32, [_TTInstance, POINTER(Channel)]])
-_DoUpdateChannel = function_factory(dll.TT_DoUpdateChannel, [INT32, [_TTInstance, POINTER(Channel)]])
-_DoRemoveChannel = function_factory(dll.TT_DoRemoveChannel, [INT32, [_TTInstance, INT32]])
-_DoMoveUser = function_factory(dll.TT_DoMoveUser, [INT32, [_TTInstance, INT32, INT32]])
-_DoUpdateServer = function_factory(dll.TT_DoUpdateServer, [INT32, [_TTInstance, POINTER(ServerProperties)]])
-_DoListUserAccounts = function_factory(dll.TT_DoListUserAccounts, [INT32, [_TTInstance, INT32, INT32]])
-_DoNewUserAccount = function_factory(dll.TT_DoNewUserAccount, [INT32, [_TTInstance, POINTER(UserAccount)]])
-_DoDeleteUserAccount = function_factory(dll.TT_DoDeleteUserAccount, [INT32, [_TTInstance, TTCHAR_P]])
-_DoBanUser = function_factory(dll.TT_DoBanUser, [INT32, [_TTInstance, INT32, INT32]])
-_DoBanUserEx = function_factory(dll.TT_DoBanUserEx, [INT32, [_TTInstance, INT32, UINT32]])
-_DoBan = function_factory(dll.TT_DoBan, [INT32, [_TTInstance, POINTER(BannedUser)]])
-_DoBanIPAddress = function_factory(dll.TT_DoBanIPAddress, [INT32, [_TTInstance, TTCHAR_P, INT32]])
-_DoUnBanUser = function_factory(dll.TT_DoUnBanUser, [INT32, [_TTInstance, TTCHAR_P, INT32]])
-_DoUnBanUserEx = function_factory(dll.TT_DoUnBanUserEx, [INT32, [_TTInstance, POINTER(BannedUser)]])
-_DoListBans = function_factory(dll.TT_DoListBans, [INT32, [_TTInstance, INT32, INT32, INT32]])
-_DoSaveConfig = function_factory(dll.TT_DoSaveConfig, [INT32, [_TTInstance]])
-_DoQueryServerStats = function_factory(dll.TT_DoQueryServerStats, [INT32, [_TTInstance]])
-_DoQuit = function_factory(dll.TT_DoQuit, [INT32, [_TTInstance]])
-_GetServerProperties = function_factory(dll.TT_GetServerProperties, [BOOL, [_TTInstance, POINTER(ServerProperties)]])
-_GetServerUsers = function_factory(dll.TT_GetServerUsers, [BOOL, [_TTInstance, POINTER(User), POINTER(INT32)]])
-_GetRootChannelID = function_factory(dll.TT_GetRootChannelID, [INT32, [_TTInstance]])
-_GetMyChannelID = function_factory(dll.TT_GetMyChannelID, [INT32, [_TTInstance]])
-_GetChannel = function_factory(dll.TT_GetChannel, [BOOL, [_TTInstance, INT32, POINTER(Channel)]])
-_GetChannelPath = function_factory(dll.TT_GetChannelPath, [BOOL, [_TTInstance, INT32, POINTER(TTCHAR*TT_STRLEN)]])
-_GetChannelIDFromPath = function_factory(dll.TT_GetChannelIDFromPath, [INT32, [_TTInstance, TTCHAR_P]])
-_GetChannelUsers = function_factory(dll.TT_GetChannelUsers, [BOOL, [_TTInstance, INT32, POINTER(User), POINTER(INT32)]])
-_GetChannelFiles = function_factory(dll.TT_GetChannelFiles, [BOOL, [_TTInstance, INT32, POINTER(RemoteFile), POINTER(INT32)]])
-_GetChannelFile = function_factory(dll.TT_GetChannelFile, [BOOL, [_TTInstance, INT32, INT32, POINTER(RemoteFile)]])
-_IsChannelOperator = function_factory(dll.TT_IsChannelOperator, [BOOL, [_TTInstance, INT32, INT32]])
-_GetServerChannels = function_factory(dll.TT_GetServerChannels, [BOOL, [_TTInstance, POINTER(Channel), POINTER(INT32)]])
-_GetMyUserID = function_factory(dll.TT_GetMyUserID, [INT32, [_TTInstance]])
-_GetMyUserAccount = function_factory(dll.TT_GetMyUserAccount, [BOOL, [_TTInstance, POINTER(UserAccount)]])
-_GetMyUserType = function_factory(dll.TT_GetMyUserType, [UINT32, [_TTInstance]])
-_GetMyUserRights = function_factory(dll.TT_GetMyUserRights, [UINT32, [_TTInstance]])
-_GetMyUserData = function_factory(dll.TT_GetMyUserData, [INT32, [_TTInstance]])
-_GetUser = function_factory(dll.TT_GetUser, [BOOL, [_TTInstance, INT32, POINTER(User)]])
-_GetUserStatistics = function_factory(dll.TT_GetUserStatistics, [BOOL, [_TTInstance, INT32, POINTER(UserStatistics)]])
-_GetUserByUsername = function_factory(dll.TT_GetUserByUsername, [BOOL, [_TTInstance, TTCHAR_P, POINTER(User)]])
-_SetUserVolume = function_factory(dll.TT_SetUserVolume, [BOOL, [_TTInstance, INT32, INT32, INT32]])
-_SetUserMute = function_factory(dll.TT_SetUserMute, [BOOL, [_TTInstance, INT32, INT32, BOOL, INT32]])
-_SetUserStoppedPlaybackDelay = function_factory(dll.TT_SetUserStoppedPlaybackDelay, [BOOL, [_TTInstance, INT32, INT32, INT32]])
-_SetUserJitterControl = function_factory(dll.TT_SetUserJitterControl, [BOOL, [_TTInstance, INT32, INT32, POINTER(JitterConfig)]])
-_GetUserJitterControl = function_factory(dll.TT_GetUserJitterControl, [BOOL, [_TTInstance, INT32, INT32, POINTER(JitterConfig)]])
-_SetUserPosition = function_factory(dll.TT_SetUserPosition, [BOOL, [_TTInstance, INT32, INT32, c_float, c_float, c_float]])
-_SetUserStereo = function_factory(dll.TT_SetUserStereo, [BOOL, [_TTInstance, INT32, INT32, BOOL, BOOL]])
-_SetUserMediaStorageDir = function_factory(dll.TT_SetUserMediaStorageDir, [BOOL, [_TTInstance, INT32, TTCHAR_P, TTCHAR_P, UINT32]])
-_SetUserMediaStorageDirEx = function_factory(dll.TT_SetUserMediaStorageDirEx, [BOOL, [_TTInstance, INT32, TTCHAR_P, TTCHAR_P, UINT32, UINT32]])
-_SetUserAudioStreamBufferSize = function_factory(dll.TT_SetUserAudioStreamBufferSize, [BOOL, [_TTInstance, INT32, UINT32, INT32]])
-_AcquireUserAudioBlock = function_factory(dll.TT_AcquireUserAudioBlock, [POINTER(AudioBlock), [_TTInstance, StreamType, INT32]])
-_ReleaseUserAudioBlock = function_factory(dll.TT_ReleaseUserAudioBlock, [BOOL, [_TTInstance, POINTER(AudioBlock)]])
-_GetFileTransferInfo = function_factory(dll.TT_GetFileTransferInfo, [BOOL, [_TTInstance, INT32, POINTER(FileTransfer)]])
-_CancelFileTransfer = function_factory(dll.TT_CancelFileTransfer, [BOOL, [_TTInstance, INT32]])
-_GetErrorMessage = function_factory(dll.TT_GetErrorMessage, [c_void_p, [INT32, POINTER(TTCHAR*TT_STRLEN)]])
-_DBG_SIZEOF = function_factory(dll.TT_DBG_SIZEOF, [INT32, [TTType]])
+class _LazyFunction:
+    """Stands in for a TT_* function until its first call, which looks the
+    symbol up in the DLL, applies the signature and puts the real function
+    in its place, so importing this module only binds what gets used."""
+    __slots__ = ("name", "signature", "func")
+
+    def __init__(self, name, signature):
+        self.name = name
+        self.signature = signature
+        self.func = None
+
+    def bind(self):
+        if self.func is None:
+            self.func = function_factory(getattr(dll, self.name), self.signature)
+            globals()["_" + self.name[3:]] = self.func
+        return self.func
+
+    def __call__(self, *args):
+        return self.bind()(*args)
+
+def _bind_all():
+    """Binds every TT_* function now; a symbol missing from the DLL raises AttributeError."""
+    for value in list(globals().values()):
+        if isinstance(value, _LazyFunction):
+            value.bind()
+
+_GetVersion = _LazyFunction("TT_GetVersion", [TTCHAR_P])
+_InitTeamTalkPoll = _LazyFunction("TT_InitTeamTalkPoll", [_TTInstance])
+_CloseTeamTalk = _LazyFunction("TT_CloseTeamTalk", [BOOL, [_TTInstance]])
+_GetMessage = _LazyFunction("TT_GetMessage", [BOOL, [_TTInstance, POINTER(TTMessage), POINTER(INT32)]])
+_PumpMessage = _LazyFunction("TT_PumpMessage", [BOOL, [_TTInstance, ClientEvent, INT32]])
+_GetFlags = _LazyFunction("TT_GetFlags", [UINT32, [_TTInstance]])
+_SetLicenseInformation = _LazyFunction("TT_SetLicenseInformation", [BOOL, [TTCHAR_P, TTCHAR_P]])
+_GetDefaultSoundDevices = _LazyFunction("TT_GetDefaultSoundDevices", [BOOL, [POINTER(INT32), POINTER(INT32)]])
+_GetDefaultSoundDevicesEx = _LazyFunction("TT_GetDefaultSoundDevicesEx", [BOOL, [SoundSystem, POINTER(INT32), POINTER(INT32)]])
+_GetSoundDevices = _LazyFunction("TT_GetSoundDevices", [BOOL, [POINTER(SoundDevice), POINTER(INT32)]])
+_RestartSoundSystem = _LazyFunction("TT_RestartSoundSystem", [BOOL])
+_StartSoundLoopbackTest = _LazyFunction("TT_StartSoundLoopbackTest", [_TTSoundLoop, [INT32, INT32, INT32, INT32, BOOL, POINTER(SpeexDSP)]])
+_StartSoundLoopbackTestEx = _LazyFunction("TT_StartSoundLoopbackTestEx", [_TTSoundLoop, [INT32, INT32, INT32, INT32, BOOL, POINTER(AudioPreprocessor), POINTER(SoundDeviceEffects)]])
+_CloseSoundLoopbackTest = _LazyFunction("TT_CloseSoundLoopbackTest", [BOOL, [_TTSoundLoop]])
+_InitSoundInputDevice = _LazyFunction("TT_InitSoundInputDevice", [BOOL, [_TTInstance, INT32]])
+_InitSoundInputSharedDevice = _LazyFunction("TT_InitSoundInputSharedDevice", [BOOL, [INT32, INT32, INT32]])
+_InitSoundOutputDevice = _LazyFunction("TT_InitSoundOutputDevice", [BOOL, [_TTInstance, INT32]])
+_InitSoundOutputSharedDevice = _LazyFunction("TT_InitSoundOutputSharedDevice", [BOOL, [INT32, INT32, INT32]])
+_InitSoundDuplexDevices = _LazyFunction("TT_InitSoundDuplexDevices", [BOOL, [_TTInstance, INT32, INT32]])
+_CloseSoundInputDevice = _LazyFunction("TT_CloseSoundInputDevice", [BOOL, [_TTInstance]])
+_CloseSoundOutputDevice = _LazyFunction("TT_CloseSoundOutputDevice", [BOOL, [_TTInstance]])
+_CloseSoundDuplexDevices = _LazyFunction("TT_CloseSoundDuplexDevices", [BOOL, [_TTInstance]])
+_SetSoundDeviceEffects = _LazyFunction("TT_SetSoundDeviceEffects", [BOOL, [_TTInstance, POINTER(SoundDeviceEffects)]])
+_GetSoundDeviceEffects = _LazyFunction("TT_GetSoundDeviceEffects", [BOOL, [_TTInstance, POINTER(SoundDeviceEffects)]])
+_GetSoundInputLevel = _LazyFunction("TT_GetSoundInputLevel", [INT32, [_TTInstance]])
+_SetSoundInputGainLevel = _LazyFunction("TT_SetSoundInputGainLevel", [BOOL, [_TTInstance, INT32]])
+_GetSoundInputGainLevel = _LazyFunction("TT_GetSoundInputGainLevel", [INT32, [_TTInstance]])
+_SetSoundInputPreprocess = _LazyFunction("TT_SetSoundInputPreprocess", [BOOL, [_TTInstance, POINTER(SpeexDSP)]])
+_GetSoundInputPreprocess = _LazyFunction("TT_GetSoundInputPreprocess", [BOOL, [_TTInstance, POINTER(SpeexDSP)]])
+_SetSoundInputPreprocessEx = _LazyFunction("TT_SetSoundInputPreprocessEx", [BOOL, [_TTInstance, POINTER(AudioPreprocessor)]])
+_GetSoundInputPreprocessEx = _LazyFunction("TT_GetSoundInputPreprocessEx", [BOOL, [_TTInstance, POINTER(AudioPreprocessor)]])
+_SetSoundOutputVolume = _LazyFunction("TT_SetSoundOutputVolume", [BOOL, [_TTInstance, INT32]])
+_GetSoundOutputVolume = _LazyFunction("TT_GetSoundOutputVolume", [INT32, [_TTInstance]])
+_SetSoundOutputMute = _LazyFunction("TT_SetSoundOutputMute", [BOOL, [_TTInstance, BOOL]])
+_Enable3DSoundPositioning = _LazyFunction("TT_Enable3DSoundPositioning", [BOOL, [_TTInstance, BOOL]])
+_AutoPositionUsers = _LazyFunction("TT_AutoPositionUsers", [BOOL, [_TTInstance]])
+_EnableAudioBlockEvent = _LazyFunction("TT_EnableAudioBlockEvent", [BOOL, [_TTInstance, INT32, INT32, BOOL]])
+_EnableAudioBlockEventEx = _LazyFunction("TT_EnableAudioBlockEventEx", [BOOL, [_TTInstance, INT32, INT32, POINTER(AudioFormat), BOOL]])
+_InsertAudioBlock = _LazyFunction("TT_InsertAudioBlock", [BOOL, [_TTInstance, POINTER(AudioBlock)]])
+_EnableVoiceTransmission = _LazyFunction("TT_EnableVoiceTransmission", [BOOL, [_TTInstance, BOOL]])
+_EnableVoiceActivation = _LazyFunction("TT_EnableVoiceActivation", [BOOL, [_TTInstance, BOOL]])
+_SetVoiceActivationLevel = _LazyFunction("TT_SetVoiceActivationLevel", [BOOL, [_TTInstance, INT32]])
+_GetVoiceActivationLevel = _LazyFunction("TT_GetVoiceActivationLevel", [INT32, [_TTInstance]])
+_SetVoiceActivationStopDelay = _LazyFunction("TT_SetVoiceActivationStopDelay", [BOOL, [_TTInstance, INT32]])
+_GetVoiceActivationStopDelay = _LazyFunction("TT_GetVoiceActivationStopDelay", [INT32, [_TTInstance]])
+_StartRecordingMuxedAudioFile = _LazyFunction("TT_StartRecordingMuxedAudioFile", [BOOL, [_TTInstance, POINTER(AudioCodec), TTCHAR_P, UINT32]])
+_StartRecordingMuxedAudioFileEx = _LazyFunction("TT_StartRecordingMuxedAudioFileEx", [BOOL, [_TTInstance, INT32, TTCHAR_P, UINT32]])
+_StartRecordingMuxedStreams = _LazyFunction("TT_StartRecordingMuxedStreams", [BOOL, [_TTInstance, UINT32, POINTER(AudioCodec), TTCHAR_P, UINT32]])
+_StopRecordingMuxedAudioFile = _LazyFunction("TT_StopRecordingMuxedAudioFile", [BOOL, [_TTInstance]])
+_StopRecordingMuxedAudioFileEx = _LazyFunction("TT_StopRecordingMuxedAudioFileEx", [BOOL, [_TTInstance, INT32]])
+_StartVideoCaptureTransmission = _LazyFunction("TT_StartVideoCaptureTransmission", [BOOL, [_TTInstance, POINTER(VideoCodec)]])
+_StopVideoCaptureTransmission = _LazyFunction("TT_StopVideoCaptureTransmission", [BOOL, [_TTInstance]])
+_GetVideoCaptureDevices = _LazyFunction("TT_GetVideoCaptureDevices", [BOOL, [POINTER(VideoCaptureDevice), POINTER(INT32)]])
+_InitVideoCaptureDevice = _LazyFunction("TT_InitVideoCaptureDevice", [BOOL, [_TTInstance, TTCHAR_P, POINTER(VideoFormat)]])
+_CloseVideoCaptureDevice = _LazyFunction("TT_CloseVideoCaptureDevice", [BOOL, [_TTInstance]])
+_StartStreamingMediaFileToChannel = _LazyFunction("TT_StartStreamingMediaFileToChannel", [BOOL, [_TTInstance, TTCHAR_P, POINTER(VideoCodec)]])
+_StartStreamingMediaFileToChannelEx = _LazyFunction("TT_StartStreamingMediaFileToChannelEx", [BOOL, [_TTInstance, TTCHAR_P, POINTER(MediaFilePlayback), POINTER(VideoCodec)]])
+_UpdateStreamingMediaFileToChannel = _LazyFunction("TT_UpdateStreamingMediaFileToChannel", [BOOL, [_TTInstance, POINTER(MediaFilePlayback), POINTER(VideoCodec)]])
+_StopStreamingMediaFileToChannel = _LazyFunction("TT_StopStreamingMediaFileToChannel", [BOOL, [_TTInstance]])
+_InitLocalPlayback = _LazyFunction("TT_InitLocalPlayback", [INT32, [_TTInstance, TTCHAR_P, POINTER(MediaFilePlayback)]])
+_UpdateLocalPlayback = _LazyFunction("TT_UpdateLocalPlayback", [BOOL, [_TTInstance, INT32, POINTER(MediaFilePlayback)]])
+_StopLocalPlayback = _LazyFunction("TT_StopLocalPlayback", [BOOL, [_TTInstance, INT32]])
+_GetMediaFileInfo = _LazyFunction("TT_GetMediaFileInfo", [BOOL, [_TTInstance, TTCHAR_P, POINTER(MediaFileInfo)]])
+_SetEncryptionContext = _LazyFunction("TT_SetEncryptionContext", [BOOL, [_TTInstance, POINTER(EncryptionContext)]])
+_Connect = _LazyFunction("TT_Connect", [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, INT32, INT32, BOOL]])
+_ConnectSysID = _LazyFunction("TT_ConnectSysID", [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, INT32, INT32, BOOL, TTCHAR_P]])
+_ConnectEx = _LazyFunction("TT_ConnectEx", [BOOL, [_TTInstance, TTCHAR_P, INT32, INT32, TTCHAR_P, INT32, INT32, BOOL]])
+_Disconnect = _LazyFunction("TT_Disconnect", [BOOL, [_TTInstance]])
+_QueryMaxPayload = _LazyFunction("TT_QueryMaxPayload", [BOOL, [_TTInstance, INT32]])
+_GetClientStatistics = _LazyFunction("TT_GetClientStatistics", [BOOL, [_TTInstance, POINTER(ClientStatistics)]])
+_SetClientKeepAlive = _LazyFunction("TT_SetClientKeepAlive", [BOOL, [_TTInstance, POINTER(ClientKeepAlive)]])
+_GetClientKeepAlive = _LazyFunction("TT_GetClientKeepAlive", [BOOL, [_TTInstance, POINTER(ClientKeepAlive)]])
+_DoPing = _LazyFunction("TT_DoPing", [INT32, [_TTInstance]])
+_DoLogin = _LazyFunction("TT_DoLogin", [INT32, [_TTInstance, TTCHAR_P, TTCHAR_P, TTCHAR_P]])
+_DoLoginEx = _LazyFunction("TT_DoLoginEx", [INT32, [_TTInstance, TTCHAR_P, TTCHAR_P, TTCHAR_P, TTCHAR_P]])
+_DoLogout = _LazyFunction("TT_DoLogout", [INT32, [_TTInstance]])
+_DoJoinChannel = _LazyFunction("TT_DoJoinChannel", [INT32, [_TTInstance, POINTER(Channel)]])
+_DoJoinChannelByID = _LazyFunction("TT_DoJoinChannelByID", [INT32, [_TTInstance, INT32, TTCHAR_P]])
+_DoLeaveChannel = _LazyFunction("TT_DoLeaveChannel", [INT32, [_TTInstance]])
+_DoChangeNickname = _LazyFunction("TT_DoChangeNickname", [INT32, [_TTInstance, TTCHAR_P]])
+_DoChangeStatus = _LazyFunction("TT_DoChangeStatus", [INT32, [_TTInstance, INT32, TTCHAR_P]])
+_DoTextMessage = _LazyFunction("TT_DoTextMessage", [INT32, [_TTInstance, POINTER(TextMessage)]])
+_DoChannelOp = _LazyFunction("TT_DoChannelOp", [INT32, [_TTInstance, INT32, INT32, BOOL]])
+_DoChannelOpEx = _LazyFunction("TT_DoChannelOpEx", [INT32, [_TTInstance, INT32, INT32, TTCHAR_P, BOOL]])
+_DoKickUser = _LazyFunction("TT_DoKickUser", [INT32, [_TTInstance, INT32, INT32]])
+_DoSendFile = _LazyFunction("TT_DoSendFile", [INT32, [_TTInstance, INT32, TTCHAR_P]])
+_DoRecvFile = _LazyFunction("TT_DoRecvFile", [INT32, [_TTInstance, INT32, INT32, TTCHAR_P]])
+_DoDeleteFile = _LazyFunction("TT_DoDeleteFile", [INT32, [_TTInstance, INT32, INT32]])
+_DoSubscribe = _LazyFunction("TT_DoSubscribe", [INT32, [_TTInstance, INT32, UINT32]])
+_DoUnsubscribe = _LazyFunction("TT_DoUnsubscribe", [INT32, [_TTInstance, INT32, UINT32]])
+_DoMakeChannel = _LazyFunction("TT_DoMakeChannel", [INT32, [_TTInstance, POINTER(Channel)]])
+_DoUpdateChannel = _LazyFunction("TT_DoUpdateChannel", [INT32, [_TTInstance, POINTER(Channel)]])
+_DoRemoveChannel = _LazyFunction("TT_DoRemoveChannel", [INT32, [_TTInstance, INT32]])
+_DoMoveUser = _LazyFunction("TT_DoMoveUser", [INT32, [_TTInstance, INT32, INT32]])
+_DoUpdateServer = _LazyFunction("TT_DoUpdateServer", [INT32, [_TTInstance, POINTER(ServerProperties)]])
+_DoListUserAccounts = _LazyFunction("TT_DoListUserAccounts", [INT32, [_TTInstance, INT32, INT32]])
+_DoNewUserAccount = _LazyFunction("TT_DoNewUserAccount", [INT32, [_TTInstance, POINTER(UserAccount)]])
+_DoDeleteUserAccount = _LazyFunction("TT_DoDeleteUserAccount", [INT32, [_TTInstance, TTCHAR_P]])
+_DoBanUser = _LazyFunction("TT_DoBanUser", [INT32, [_TTInstance, INT32, INT32]])
+_DoBanUserEx = _LazyFunction("TT_DoBanUserEx", [INT32, [_TTInstance, INT32, UINT32]])
+_DoBan = _LazyFunction("TT_DoBan", [INT32, [_TTInstance, POINTER(BannedUser)]])
+_DoBanIPAddress = _LazyFunction("TT_DoBanIPAddress", [INT32, [_TTInstance, TTCHAR_P, INT32]])
+_DoUnBanUser = _LazyFunction("TT_DoUnBanUser", [INT32, [_TTInstance, TTCHAR_P, INT32]])
+_DoUnBanUserEx = _LazyFunction("TT_DoUnBanUserEx", [INT32, [_TTInstance, POINTER(BannedUser)]])
+_DoListBans = _LazyFunction("TT_DoListBans", [INT32, [_TTInstance, INT32, INT32, INT32]])
+_DoSaveConfig = _LazyFunction("TT_DoSaveConfig", [INT32, [_TTInstance]])
+_DoQueryServerStats = _LazyFunction("TT_DoQueryServerStats", [INT32, [_TTInstance]])
+_DoQuit = _LazyFunction("TT_DoQuit", [INT32, [_TTInstance]])
+_GetServerProperties = _LazyFunction("TT_GetServerProperties", [BOOL, [_TTInstance, POINTER(ServerProperties)]])
+_GetServerUsers = _LazyFunction("TT_GetServerUsers", [BOOL, [_TTInstance, POINTER(User), POINTER(INT32)]])
+_GetRootChannelID = _LazyFunction("TT_GetRootChannelID", [INT32, [_TTInstance]])
+_GetMyChannelID = _LazyFunction("TT_GetMyChannelID", [INT32, [_TTInstance]])
+_GetChannel = _LazyFunction("TT_GetChannel", [BOOL, [_TTInstance, INT32, POINTER(Channel)]])
+_GetChannelPath = _LazyFunction("TT_GetChannelPath", [BOOL, [_TTInstance, INT32, POINTER(TTCHAR*TT_STRLEN)]])
+_GetChannelIDFromPath = _LazyFunction("TT_GetChannelIDFromPath", [INT32, [_TTInstance, TTCHAR_P]])
+_GetChannelUsers = _LazyFunction("TT_GetChannelUsers", [BOOL, [_TTInstance, INT32, POINTER(User), POINTER(INT32)]])
+_GetChannelFiles = _LazyFunction("TT_GetChannelFiles", [BOOL, [_TTInstance, INT32, POINTER(RemoteFile), POINTER(INT32)]])
+_GetChannelFile = _LazyFunction("TT_GetChannelFile", [BOOL, [_TTInstance, INT32, INT32, POINTER(RemoteFile)]])
+_IsChannelOperator = _LazyFunction("TT_IsChannelOperator", [BOOL, [_TTInstance, INT32, INT32]])
+_GetServerChannels = _LazyFunction("TT_GetServerChannels", [BOOL, [_TTInstance, POINTER(Channel), POINTER(INT32)]])
+_GetMyUserID = _LazyFunction("TT_GetMyUserID", [INT32, [_TTInstance]])
+_GetMyUserAccount = _LazyFunction("TT_GetMyUserAccount", [BOOL, [_TTInstance, POINTER(UserAccount)]])
+_GetMyUserType = _LazyFunction("TT_GetMyUserType", [UINT32, [_TTInstance]])
+_GetMyUserRights = _LazyFunction("TT_GetMyUserRights", [UINT32, [_TTInstance]])
+_GetMyUserData = _LazyFunction("TT_GetMyUserData", [INT32, [_TTInstance]])
+_GetUser = _LazyFunction("TT_GetUser", [BOOL, [_TTInstance, INT32, POINTER(User)]])
+_GetUserStatistics = _LazyFunction("TT_GetUserStatistics", [BOOL, [_TTInstance, INT32, POINTER(UserStatistics)]])
+_GetUserByUsername = _LazyFunction("TT_GetUserByUsername", [BOOL, [_TTInstance, TTCHAR_P, POINTER(User)]])
+_SetUserVolume = _LazyFunction("TT_SetUserVolume", [BOOL, [_TTInstance, INT32, INT32, INT32]])
+_SetUserMute = _LazyFunction("TT_SetUserMute", [BOOL, [_TTInstance, INT32, INT32, BOOL, INT32]])
+_SetUserStoppedPlaybackDelay = _LazyFunction("TT_SetUserStoppedPlaybackDelay", [BOOL, [_TTInstance, INT32, INT32, INT32]])
+_SetUserJitterControl = _LazyFunction("TT_SetUserJitterControl", [BOOL, [_TTInstance, INT32, INT32, POINTER(JitterConfig)]])
+_GetUserJitterControl = _LazyFunction("TT_GetUserJitterControl", [BOOL, [_TTInstance, INT32, INT32, POINTER(JitterConfig)]])
+_SetUserPosition = _LazyFunction("TT_SetUserPosition", [BOOL, [_TTInstance, INT32, INT32, c_float, c_float, c_float]])
+_SetUserStereo = _LazyFunction("TT_SetUserStereo", [BOOL, [_TTInstance, INT32, INT32, BOOL, BOOL]])
+_SetUserMediaStorageDir = _LazyFunction("TT_SetUserMediaStorageDir", [BOOL, [_TTInstance, INT32, TTCHAR_P, TTCHAR_P, UINT32]])
+_SetUserMediaStorageDirEx = _LazyFunction("TT_SetUserMediaStorageDirEx", [BOOL, [_TTInstance, INT32, TTCHAR_P, TTCHAR_P, UINT32, UINT32]])
+_SetUserAudioStreamBufferSize = _LazyFunction("TT_SetUserAudioStreamBufferSize", [BOOL, [_TTInstance, INT32, UINT32, INT32]])
+_AcquireUserAudioBlock = _LazyFunction("TT_AcquireUserAudioBlock", [POINTER(AudioBlock), [_TTInstance, StreamType, INT32]])
+_ReleaseUserAudioBlock = _LazyFunction("TT_ReleaseUserAudioBlock", [BOOL, [_TTInstance, POINTER(AudioBlock)]])
+_GetFileTransferInfo = _LazyFunction("TT_GetFileTransferInfo", [BOOL, [_TTInstance, INT32, POINTER(FileTransfer)]])
+_CancelFileTransfer = _LazyFunction("TT_CancelFileTransfer", [BOOL, [_TTInstance, INT32]])
+_GetErrorMessage = _LazyFunction("TT_GetErrorMessage", [c_void_p, [INT32, POINTER(TTCHAR*TT_STRLEN)]])
+_DBG_SIZEOF = _LazyFunction("TT_DBG_SIZEOF", [INT32, [TTType]])
 
 # main code
 
@@ -1238,6 +1253,31 @@ def setLicense(name, key):
 def DBG_SIZEOF(t):
     return _DBG_SIZEOF(t)
 
+_structSizesVerified = False
+
+def verifyStructSizes():
+    global _structSizesVerified
+    if _structSizesVerified:
+        return
+    for struct, tttype in _STRUCT_TTTYPES:
+        if DBG_SIZEOF(tttype) != ctypes.sizeof(struct):
+            error = "%s size mismatch: %d (Python) != %d (DLL)" % (struct.__name__, ctypes.sizeof(struct), DBG_SIZEOF(tttype))
+            if struct in _REQUIRED_STRUCTS:
+                raise TeamTalkError(error)
+            logging.warning(error + "; the bot doesn't use it")
+    _structSizesVerified = True
+
+def _installDebugSizeChecks():
+    for struct, tttype in _STRUCT_TTTYPES:
+        def __init__(self, *args, _struct=struct, _tttype=tttype, **kwargs):
+            assert(DBG_SIZEOF(_tttype) == ctypes.sizeof(_struct))
+            super(_struct, self).__init__(*args, **kwargs)
+        struct.__init__ = __init__
+
+if TT_DEBUG:
+    _bind_all()
+    _installDebugSizeChecks()
+
 class TeamTalkError(Exception):
     pass
 
@@ -1262,9 +1302,76 @@ def buildTextMessage(content: str, nMsgType: TextMsgType,
     return result
 
 
+def _noArgs(msg):
+    return ()
+
+def _sourceArg(msg):
+    return (msg.nSource,)
+
+def _memberArg(member):
+    return lambda msg: (getattr(msg, member),)
+
+def _sourceAndMemberArgs(member):
+    return lambda msg: (msg.nSource, getattr(msg, member))
+
+# ClientEvent -> (TeamTalk callback name, function reading the callback's
+# arguments from the TTMessage union member it uses)
+_EVENT_DISPATCH = {
+    ClientEvent.CLIENTEVENT_CON_SUCCESS: ("onConnectSuccess", _noArgs),
+    ClientEvent.CLIENTEVENT_CON_CRYPT_ERROR: ("onConnectCryptError", _memberArg("clienterrormsg")),
+    ClientEvent.CLIENTEVENT_CON_FAILED: ("onConnectFailed", _noArgs),
+    ClientEvent.CLIENTEVENT_CON_LOST: ("onConnectionLost", _noArgs),
+    ClientEvent.CLIENTEVENT_CMD_PROCESSING: ("onCmdProcessing", lambda msg: (msg.nSource, not msg.bActive)),
+    ClientEvent.CLIENTEVENT_CMD_ERROR: ("onCmdError", _sourceAndMemberArgs("clienterrormsg")),
+    ClientEvent.CLIENTEVENT_CMD_SUCCESS: ("onCmdSuccess", _sourceArg),
+    ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDIN: ("onCmdMyselfLoggedIn", _sourceAndMemberArgs("useraccount")),
+    ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDOUT: ("onCmdMyselfLoggedOut", _noArgs),
+    ClientEvent.CLIENTEVENT_CMD_MYSELF_KICKED: ("onCmdMyselfKickedFromChannel", _sourceAndMemberArgs("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN: ("onCmdUserLoggedIn", _memberArg("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDOUT: ("onCmdUserLoggedOut", _memberArg("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_UPDATE: ("onCmdUserUpdate", _memberArg("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_JOINED: ("onCmdUserJoinedChannel", _memberArg("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_LEFT: ("onCmdUserLeftChannel", _sourceAndMemberArgs("user")),
+    ClientEvent.CLIENTEVENT_CMD_USER_TEXTMSG: ("onCmdUserTextMessage", _memberArg("textmessage")),
+    ClientEvent.CLIENTEVENT_CMD_CHANNEL_NEW: ("onCmdChannelNew", _memberArg("channel")),
+    ClientEvent.CLIENTEVENT_CMD_CHANNEL_UPDATE: ("onCmdChannelUpdate", _memberArg("channel")),
+    ClientEvent.CLIENTEVENT_CMD_CHANNEL_REMOVE: ("onCmdChannelRemove", _memberArg("channel")),
+    ClientEvent.CLIENTEVENT_CMD_SERVER_UPDATE: ("onCmdServerUpdate", _memberArg("serverproperties")),
+    ClientEvent.CLIENTEVENT_CMD_FILE_NEW: ("onCmdFileNew", _memberArg("remotefile")),
+    ClientEvent.CLIENTEVENT_CMD_FILE_REMOVE: ("onCmdFileRemove", _memberArg("remotefile")),
+    ClientEvent.CLIENTEVENT_USER_RECORD_MEDIAFILE: ("onUserRecordMediaFile", _sourceAndMemberArgs("mediafileinfo")),
+    ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_NEW: ("onUserAccountNew", _memberArg("useraccount")),
+    ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_REMOVE: ("onUserAccountRemove", _memberArg("useraccount")),
+    ClientEvent.CLIENTEVENT_USER_STATECHANGE: ("onUserStateChange", _memberArg("user")),
+    ClientEvent.CLIENTEVENT_USER_AUDIOBLOCK: ("onUserAudioBlock", _sourceAndMemberArgs("nStreamType")),
+    ClientEvent.CLIENTEVENT_STREAM_MEDIAFILE: ("onStreamMediaFile", _memberArg("mediafileinfo")),
+    ClientEvent.CLIENTEVENT_CMD_USERACCOUNT: ("onUserAccount", _memberArg("useraccount")),
+    ClientEvent.CLIENTEVENT_CMD_BANNEDUSER: ("onBannedUser", _memberArg("banneduser")),
+    ClientEvent.CLIENTEVENT_CMD_SERVERSTATISTICS: ("onServerStatistics", _memberArg("serverstatistics")),
+    ClientEvent.CLIENTEVENT_INTERNAL_ERROR: ("onInternalError", _memberArg("clienterrormsg")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_ADDED: ("onSoundDeviceAdded", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_REMOVED: ("onSoundDeviceRemoved", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_UNPLUGGED: ("onSoundDeviceUnplugged", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT: ("onSoundDeviceNewDefaultInput", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT: ("onSoundDeviceNewDefaultOutput", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT_COMDEVICE: ("onSoundDeviceNewDefaultInputComDevice", _memberArg("sounddevice")),
+    ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT_COMDEVICE: ("onSoundDeviceNewDefaultOutputComDevice", _memberArg("sounddevice")),
+}
+
+
 class TeamTalk(object):
 
     def __init__(self):
+        self._tt = None  # set before anything can raise, so __del__ doesn't hide the error
+        verifyStructSizes()
+        self._eventHandlers = self._buildEventHandlers()
+        # Receive buffer reused by getMessage(). Structures reached through the
+        # returned message (msg.user, msg.channel...) are only valid until the
+        # next call; copy them with from_buffer_copy() to keep them.
+        self._msg = TTMessage()
+        self._msgRef = byref(self._msg)
+        self._waitMS = INT32()
+        self._waitMSRef = byref(self._waitMS)
         self._tt = _InitTeamTalkPoll()
         if not self._tt:
             raise TeamTalkError("failed to initialize")
@@ -1273,96 +1380,48 @@ class TeamTalk(object):
         return _CloseTeamTalk(self._tt)
 
     def __del__(self):
-        self.closeTeamTalk()
+        if self._tt:
+            self.closeTeamTalk()
 
     def runEventLoop(self, nWaitMSec = -1):
         msg = self.getMessage(nWaitMS = nWaitMSec)
-        event = msg.nClientEvent
-        if event == ClientEvent.CLIENTEVENT_CON_SUCCESS:
-            self.onConnectSuccess()
-        if event == ClientEvent.CLIENTEVENT_CON_CRYPT_ERROR:
-            self.onConnectCryptError(msg.clienterrormsg)
-        if event == ClientEvent.CLIENTEVENT_CON_FAILED:
-            self.onConnectFailed()
-        if event == ClientEvent.CLIENTEVENT_CON_LOST:
-            self.onConnectionLost()
-        if event == ClientEvent.CLIENTEVENT_CMD_PROCESSING:
-            self.onCmdProcessing(msg.nSource, not msg.bActive)
-        if event == ClientEvent.CLIENTEVENT_CMD_ERROR:
-            self.onCmdError(msg.nSource, msg.clienterrormsg)
-        if event == ClientEvent.CLIENTEVENT_CMD_SUCCESS:
-            self.onCmdSuccess(msg.nSource)
-        if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDIN:
-            self.onCmdMyselfLoggedIn(msg.nSource, msg.useraccount)
-        if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDOUT:
-            self.onCmdMyselfLoggedOut()
-        if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_KICKED:
-            self.onCmdMyselfKickedFromChannel(msg.nSource, msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN:
-            self.onCmdUserLoggedIn(msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDOUT:
-            self.onCmdUserLoggedOut(msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_UPDATE:
-            self.onCmdUserUpdate(msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_JOINED:
-            self.onCmdUserJoinedChannel(msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_LEFT:
-            self.onCmdUserLeftChannel(msg.nSource, msg.user)
-        if event == ClientEvent.CLIENTEVENT_CMD_USER_TEXTMSG:
-            self.onCmdUserTextMessage(msg.textmessage)
-        if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_NEW:
-            self.onCmdChannelNew(msg.channel)
-        if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_UPDATE:
-            self.onCmdChannelUpdate(msg.channel)
-        if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_REMOVE:
-            self.onCmdChannelRemove(msg.channel)
-        if event == ClientEvent.CLIENTEVENT_CMD_SERVER_UPDATE:
-            self.onCmdServerUpdate(msg.serverproperties)
-        if event == ClientEvent.CLIENTEVENT_CMD_FILE_NEW:
-            self.onCmdFileNew(msg.remotefile)
-        if event == ClientEvent.CLIENTEVENT_CMD_FILE_REMOVE:
-            self.onCmdFileRemove(msg.remotefile)
-        if event == ClientEvent.CLIENTEVENT_USER_RECORD_MEDIAFILE:
-            self.onUserRecordMediaFile(msg.nSource, msg.mediafileinfo)
-        if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_NEW:
-            self.onUserAccountNew(msg.useraccount)
-        if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_REMOVE:
-            self.onUserAccountRemove(msg.useraccount)
-        if event == ClientEvent.CLIENTEVENT_USER_STATECHANGE:
-            self.onUserStateChange(msg.user)
-        if event == ClientEvent.CLIENTEVENT_USER_AUDIOBLOCK:
-            self.onUserAudioBlock(msg.nSource, msg.nStreamType)
-        if event == ClientEvent.CLIENTEVENT_STREAM_MEDIAFILE:
-            self.onStreamMediaFile(msg.mediafileinfo)
-        if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT:
-            self.onUserAccount(msg.useraccount)
-        if event == ClientEvent.CLIENTEVENT_CMD_BANNEDUSER:
-            self.onBannedUser(msg.banneduser)
-        if event == ClientEvent.CLIENTEVENT_CMD_SERVERSTATISTICS:
-            self.onServerStatistics(msg.serverstatistics)
-        if event == ClientEvent.CLIENTEVENT_INTERNAL_ERROR:
-            self.onInternalError(msg.clienterrormsg)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_ADDED:
-            self.onSoundDeviceAdded(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_REMOVED:
-            self.onSoundDeviceRemoved(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_UNPLUGGED:
-            self.onSoundDeviceUnplugged(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT:
-            self.onSoundDeviceNewDefaultInput(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT:
-            self.onSoundDeviceNewDefaultOutput(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT_COMDEVICE:
-            self.onSoundDeviceNewDefaultInputComDevice(msg.sounddevice)
-        if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT_COMDEVICE:
-            self.onSoundDeviceNewDefaultOutputComDevice(msg.sounddevice)
+        self.dispatchMessage(msg)
+
+    def dispatchMessage(self, msg: TTMessage):
+        entry = self._eventHandlers.get(msg.nClientEvent)
+        if entry is not None:
+            handler, getArgs = entry
+            handler(self, *getArgs(msg))
+
+    @classmethod
+    def _buildEventHandlers(cls):
+        # Only events whose callback is overridden by the subclass are
+        # registered, so unhandled events cost a single dict lookup.
+        handlers = cls.__dict__.get("_eventHandlerTable")
+        if handlers is None:
+            handlers = {}
+            for event, (name, getArgs) in _EVENT_DISPATCH.items():
+                callback = getattr(cls, name)
+                if callback is not getattr(TeamTalk, name):
+                    handlers[event] = (callback, getArgs)
+            cls._eventHandlerTable = handlers
+        return handlers
 
     def getMessage(self, nWaitMS: int = -1):
-        msg = TTMessage()
-        nWaitMS = INT32(nWaitMS)
-        _GetMessage(self._tt, byref(msg), byref(nWaitMS))
+        if TT_DEBUG:
+            msg = TTMessage()
+            nWaitMS = INT32(nWaitMS)
+            _GetMessage(self._tt, byref(msg), byref(nWaitMS))
+            return msg
+        msg = self._msg
+        self._waitMS.value = nWaitMS
+        if not _GetMessage(self._tt, self._msgRef, self._waitMSRef):
+            msg.nClientEvent = ClientEvent.CLIENTEVENT_NONE
         return msg
 
+    def pumpMessage(self, nClientEvent: ClientEvent, nIdentifier: int) -> bool:
+        return _PumpMessage(self._tt, nClientEvent, nIdentifier)
+
     def getFlags(self):
         return _GetFlags(self._tt)
 
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import threading
+import time
+from TeamTalk5 import TTMessage, ClientEvent
+from handlers.executor import call_async
+from metrics import RollingStats
+from services import async_http
+
+class AsyncBotRuntime:
+    """Runs a MyTeamTalkBot on an asyncio event loop (Bot.runtime = "asyncio").
+
+    A pump thread blocks in getMessage() and hands batches of copied messages to
+    the loop, which dispatches them and runs background handlers as tasks. Async
+    handlers await their service calls on the loop; plain ones go to a thread.
+    """
+    def __init__(self, bot, max_inflight: int = 500):
+        self.bot = bot
+        self.max_inflight = max_inflight
+        self.loop = None
+        self._queue = None
+        self._tasks = set()
+        self._key_locks = {}
+        self._key_jobs = {}
+        self._housekeeping_timer = None
+        self.rejected = 0
+        self.run_times = RollingStats()
+
+    @property
+    def inflight(self):
+        return len(self._tasks)
+
+    def run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        bot = self.bot
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        bot._event_thread_ident = threading.get_ident()
+        await async_http.open_session()
+        pump = threading.Thread(target=self._pump, name="TeamTalkPump", daemon=True)
+        pump.start()
+        try:
+            while bot._running:
+                batch = await self._queue.get()
+                if batch is None: break
+                batch_start = time.perf_counter()
+                for msg in batch:
+                    bot.dispatchMessage(msg)
+                bot.event_batch_stats.record(len(batch), time.perf_counter() - batch_start, len(batch) >= bot.event_batch_max)
+                self._housekeeping()
+        finally:
+            bot._running = False
+            if self._housekeeping_timer: self._housekeeping_timer.cancel()
+            await asyncio.to_thread(pump.join)
+            for task in list(self._tasks): task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            await async_http.close_session()
+            self.loop = None
+
+    def _pump(self):
+        # Messages are copied because getMessage() reuses one receive buffer.
+        bot = self.bot
+        try:
+            while bot._running:
+                msg = bot.getMessage(bot.event_wait_msec)
+                if msg.nClientEvent == ClientEvent.CLIENTEVENT_NONE: continue
+                batch = [TTMessage.from_buffer_copy(msg)]
+                while len(batch) < bot.event_batch_max:
+                    msg = bot.getMessage(0)
+                    if msg.nClientEvent == ClientEvent.CLIENTEVENT_NONE: break
+                    batch.append(TTMessage.from_buffer_copy(msg))
+                self.loop.call_soon_threadsafe(self._queue.put_nowait, batch)
+        except Exception as e:
+            logging.error(f"TeamTalk message pump stopped: {e}", exc_info=True)
+        finally:
+            try: self.loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            except RuntimeError: pass
+
+    def wake(self):
+        """Makes the loop run the bot's housekeeping (queued calls, outbound queue). Safe from any thread."""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._housekeeping)
+
+    def _housekeeping(self):
+        next_due = self.bot._housekeeping()
+        if next_due is None: return
+        timer = self._housekeeping_timer
+        if timer is not None and timer.when() > self.loop.time() + next_due:
+            timer.cancel(); timer = None  # something (e.g. bot.call_later) is due sooner
+        if timer is None:
+            self._housekeeping_timer = self.loop.call_later(next_due, self._on_housekeeping_timer)
+
+    def _on_housekeeping_timer(self):
+        self._housekeeping_timer = None
+        self._housekeeping()
+
+    def submit(self, key, func, *args, **kwargs) -> bool:
+        """Schedules func as a task behind earlier jobs for key. Must be called on the loop thread."""
+        if self.loop is None or len(self._tasks) >= self.max_inflight:
+            self.rejected += 1
+            return False
+        task = self.loop.create_task(self._run(key, func, args, kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run(self, key, func, args, kwargs):
+        lock = self._key_locks.get(key)
+        if lock is None: lock = self._key_locks[key] = asyncio.Lock()
+        self._key_jobs[key] = self._key_jobs.get(key, 0) + 1
+        try:
+            async with lock:
+                started = time.perf_counter()
+                try:
+                    await call_async(func, *args, **kwargs)
+                except Exception as e:
+                    logging.error(f"Error in background handler {getattr(func, '__name__', func)}: {e}", exc_info=True)
+                finally:
+                    self.run_times.add(time.perf_counter() - started)
+        finally:
+            self._key_jobs[key] -= 1
+            if not self._key_jobs[key]:
+                del self._key_jobs[key]; del self._key_locks[key]
+
+    def format_lines(self) -> list[str]:
+        runs = self.run_times.summary()
+        return [
+            f"Async Runtime: {len(self._tasks)}/{self.max_inflight} in flight, {self.rejected} rejected",
+            f"  - Run: {runs['count']} jobs, avg {runs['avg'] * 1000:.0f}ms, p95 {runs['p95'] * 1000:.0f}ms, max {runs['max'] * 1000:.0f}ms",
+        ]
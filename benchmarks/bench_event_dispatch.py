@@ -0,0 +1,176 @@
+"""Micro-benchmark for TeamTalk event dispatch.
+
+Compares the original chain of `if event == ClientEvent.X` checks with the
+dispatch table used by `TeamTalk.dispatchMessage` on a synthetic stream of
+messages shaped like a busy server (logins, joins, updates, text messages
+and events the bot does not handle).
+
+Usage: python benchmarks/bench_event_dispatch.py [--events N] [--rounds R]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TeamTalk5 import TeamTalk, TTMessage, ClientEvent
+
+# Weighted mix of events seen by the bot on a busy server
+EVENT_MIX = [
+    (ClientEvent.CLIENTEVENT_CMD_USER_UPDATE, 30),
+    (ClientEvent.CLIENTEVENT_CMD_USER_TEXTMSG, 20),
+    (ClientEvent.CLIENTEVENT_CMD_USER_JOINED, 10),
+    (ClientEvent.CLIENTEVENT_CMD_USER_LEFT, 10),
+    (ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN, 8),
+    (ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDOUT, 8),
+    (ClientEvent.CLIENTEVENT_USER_STATECHANGE, 6),
+    (ClientEvent.CLIENTEVENT_CMD_PROCESSING, 4),
+    (ClientEvent.CLIENTEVENT_CMD_SUCCESS, 2),
+    (ClientEvent.CLIENTEVENT_NONE, 2),
+]
+
+
+class BenchBot(TeamTalk):
+    """Handles the same events as MyTeamTalkBot, with empty bodies."""
+    def onConnectSuccess(self): pass
+    def onConnectFailed(self): pass
+    def onConnectionLost(self): pass
+    def onCmdError(self, cmd_id, err): pass
+    def onCmdMyselfLoggedIn(self, user_id, user_acc): pass
+    def onCmdMyselfLoggedOut(self): pass
+    def onCmdMyselfKickedFromChannel(self, channelid, user): pass
+    def onCmdUserLoggedIn(self, user): pass
+    def onCmdUserLoggedOut(self, user): pass
+    def onCmdUserUpdate(self, user): pass
+    def onCmdUserJoinedChannel(self, user): pass
+    def onCmdUserLeftChannel(self, chan_id, user): pass
+    def onCmdUserTextMessage(self, textmessage): pass
+    def onCmdChannelNew(self, channel): pass
+    def onCmdChannelUpdate(self, channel): pass
+    def onCmdChannelRemove(self, channel): pass
+
+
+def legacy_dispatch(self, msg):
+    """The original runEventLoop body, minus the getMessage call."""
+    event = msg.nClientEvent
+    if event == ClientEvent.CLIENTEVENT_CON_SUCCESS:
+        self.onConnectSuccess()
+    if event == ClientEvent.CLIENTEVENT_CON_CRYPT_ERROR:
+        self.onConnectCryptError(msg.clienterrormsg)
+    if event == ClientEvent.CLIENTEVENT_CON_FAILED:
+        self.onConnectFailed()
+    if event == ClientEvent.CLIENTEVENT_CON_LOST:
+        self.onConnectionLost()
+    if event == ClientEvent.CLIENTEVENT_CMD_PROCESSING:
+        self.onCmdProcessing(msg.nSource, not msg.bActive)
+    if event == ClientEvent.CLIENTEVENT_CMD_ERROR:
+        self.onCmdError(msg.nSource, msg.clienterrormsg)
+    if event == ClientEvent.CLIENTEVENT_CMD_SUCCESS:
+        self.onCmdSuccess(msg.nSource)
+    if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDIN:
+        self.onCmdMyselfLoggedIn(msg.nSource, msg.useraccount)
+    if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDOUT:
+        self.onCmdMyselfLoggedOut()
+    if event == ClientEvent.CLIENTEVENT_CMD_MYSELF_KICKED:
+        self.onCmdMyselfKickedFromChannel(msg.nSource, msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN:
+        self.onCmdUserLoggedIn(msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDOUT:
+        self.onCmdUserLoggedOut(msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_UPDATE:
+        self.onCmdUserUpdate(msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_JOINED:
+        self.onCmdUserJoinedChannel(msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_LEFT:
+        self.onCmdUserLeftChannel(msg.nSource, msg.user)
+    if event == ClientEvent.CLIENTEVENT_CMD_USER_TEXTMSG:
+        self.onCmdUserTextMessage(msg.textmessage)
+    if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_NEW:
+        self.onCmdChannelNew(msg.channel)
+    if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_UPDATE:
+        self.onCmdChannelUpdate(msg.channel)
+    if event == ClientEvent.CLIENTEVENT_CMD_CHANNEL_REMOVE:
+        self.onCmdChannelRemove(msg.channel)
+    if event == ClientEvent.CLIENTEVENT_CMD_SERVER_UPDATE:
+        self.onCmdServerUpdate(msg.serverproperties)
+    if event == ClientEvent.CLIENTEVENT_CMD_FILE_NEW:
+        self.onCmdFileNew(msg.remotefile)
+    if event == ClientEvent.CLIENTEVENT_CMD_FILE_REMOVE:
+        self.onCmdFileRemove(msg.remotefile)
+    if event == ClientEvent.CLIENTEVENT_USER_RECORD_MEDIAFILE:
+        self.onUserRecordMediaFile(msg.nSource, msg.mediafileinfo)
+    if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_NEW:
+        self.onUserAccountNew(msg.useraccount)
+    if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT_REMOVE:
+        self.onUserAccountRemove(msg.useraccount)
+    if event == ClientEvent.CLIENTEVENT_USER_STATECHANGE:
+        self.onUserStateChange(msg.user)
+    if event == ClientEvent.CLIENTEVENT_USER_AUDIOBLOCK:
+        self.onUserAudioBlock(msg.nSource, msg.nStreamType)
+    if event == ClientEvent.CLIENTEVENT_STREAM_MEDIAFILE:
+        self.onStreamMediaFile(msg.mediafileinfo)
+    if event == ClientEvent.CLIENTEVENT_CMD_USERACCOUNT:
+        self.onUserAccount(msg.useraccount)
+    if event == ClientEvent.CLIENTEVENT_CMD_BANNEDUSER:
+        self.onBannedUser(msg.banneduser)
+    if event == ClientEvent.CLIENTEVENT_CMD_SERVERSTATISTICS:
+        self.onServerStatistics(msg.serverstatistics)
+    if event == ClientEvent.CLIENTEVENT_INTERNAL_ERROR:
+        self.onInternalError(msg.clienterrormsg)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_ADDED:
+        self.onSoundDeviceAdded(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_REMOVED:
+        self.onSoundDeviceRemoved(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_UNPLUGGED:
+        self.onSoundDeviceUnplugged(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT:
+        self.onSoundDeviceNewDefaultInput(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT:
+        self.onSoundDeviceNewDefaultOutput(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_INPUT_COMDEVICE:
+        self.onSoundDeviceNewDefaultInputComDevice(msg.sounddevice)
+    if event == ClientEvent.CLIENTEVENT_SOUNDDEVICE_NEW_DEFAULT_OUTPUT_COMDEVICE:
+        self.onSoundDeviceNewDefaultOutputComDevice(msg.sounddevice)
+
+
+def build_stream(count):
+    events, weights = zip(*EVENT_MIX)
+    rng = random.Random(1234)
+    stream = []
+    for event in rng.choices(events, weights=weights, k=count):
+        msg = TTMessage()
+        msg.nClientEvent = event
+        msg.nSource = rng.randint(1, 500)
+        stream.append(msg)
+    return stream
+
+
+def run(label, dispatch, stream, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for msg in stream:
+            dispatch(msg)
+        best = min(best, time.perf_counter() - start)
+    rate = len(stream) / best
+    print(f"{label:<16} {rate:>14,.0f} events/s  ({best * 1000:.1f} ms per {len(stream)} events)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    bot = BenchBot()
+    stream = build_stream(args.events)
+    before = run("if-chain", lambda msg: legacy_dispatch(bot, msg), stream, args.rounds)
+    after = run("dispatch table", bot.dispatchMessage, stream, args.rounds)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
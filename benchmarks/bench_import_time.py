@@ -0,0 +1,56 @@
+"""Benchmark for importing TeamTalk5.py with lazy vs eager function binding.
+
+Each sample runs in a fresh interpreter and times `import TeamTalk5` on its
+own (lazy: TT_* symbols are bound on first call) and followed by
+`_bind_all()` (what the import used to cost when every symbol was resolved
+and typed at load time).
+
+Usage: python benchmarks/bench_import_time.py [--runs N] [--backend native|fake]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = """
+import sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+import TeamTalk5
+imported = time.perf_counter()
+lazy = sum(isinstance(v, TeamTalk5._LazyFunction) for v in vars(TeamTalk5).values())
+resumed = time.perf_counter()
+TeamTalk5._bind_all()
+bound = time.perf_counter()
+print(imported - started, bound - resumed + imported - started, lazy)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--backend", choices=("native", "fake"), default="native")
+    args = parser.parse_args()
+
+    env = dict(os.environ, TEAMTALK_BACKEND=args.backend)
+    env.pop("TEAMTALK_PY_DEBUG", None)
+    # The first run writes __pycache__ so later runs time the import, not the compile.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    lazy_times, eager_times = [], []
+    for run in range(args.runs + 1):
+        out = subprocess.run([sys.executable, "-c", SAMPLE.format(root=REPO_ROOT)], env=env, capture_output=True, text=True, check=True).stdout
+        lazy, eager, symbols = out.split()
+        if run: lazy_times.append(float(lazy)); eager_times.append(float(eager))
+
+    lazy_ms, eager_ms = statistics.median(lazy_times) * 1000, statistics.median(eager_times) * 1000
+    print(f"{int(symbols)} TT_* functions, {args.runs} runs, {args.backend} backend (median)")
+    print(f"  lazy import:             {lazy_ms:8.2f} ms")
+    print(f"  import + bind all (old): {eager_ms:8.2f} ms")
+    print(f"  saved:                   {eager_ms - lazy_ms:8.2f} ms ({(eager_ms - lazy_ms) / eager_ms:.0%})")
+
+
+if __name__ == "__main__":
+    main()
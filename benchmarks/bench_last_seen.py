@@ -0,0 +1,61 @@
+"""Cost of last-seen updates on the event thread: write-through vs write-behind.
+
+Feeds --updates DataService.update_last_seen calls spread over --users users
+into a database file (so commits really reach the disk). "Write-through" flushes
+after every update, which is what every call did before the write-behind buffer:
+one UPSERT and one commit. "Write-behind" only buffers; the flusher thread
+writes the latest state per user in one transaction per flush. Reported are the
+time spent in the calling thread, the number of commits, and whether
+get_last_seen returned the newest action while it was still pending and again
+after close().
+
+Usage: python benchmarks/bench_last_seen.py [--updates N] [--users N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.data_service import DataService
+
+
+def run(db_file, updates, users, write_through):
+    service = DataService(db_file)
+    commits = []
+    service.conn.set_trace_callback(lambda sql: commits.append(1) if sql == "COMMIT" else None)
+    times = []
+    for i in range(updates):
+        started = time.perf_counter()
+        service.update_last_seen(i % users, f"User {i % users}", f"event {i}")
+        if write_through: service.flush()
+        times.append(time.perf_counter() - started)
+    last = updates - 1
+    newest = service.get_last_seen(f"user {last % users}")
+    read_through = newest is not None and newest['action'] == f"event {last}"
+    service.close()
+    reopened = DataService(db_file)
+    persisted = reopened.get_last_seen(f"User {last % users}")
+    reopened.close()
+    return times, len(commits), read_through, persisted is not None and persisted['action'] == f"event {last}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{args.updates} last-seen updates over {args.users} users")
+    for name, write_through in (("write-through (old)", True), ("write-behind", False)):
+        with tempfile.TemporaryDirectory() as tmp:
+            times, commits, read_through, persisted = run(os.path.join(tmp, "bot_data.db"), args.updates, args.users, write_through)
+        print(f"  {name:<20} {sum(times) * 1000:8.1f} ms in caller (median {statistics.median(times) * 1e6:6.1f} us, max {max(times) * 1000:6.2f} ms), "
+              f"{commits} commits; newest read back: {read_through}, after close: {persisted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark of the bot's initial login sync on a busy server.
+
+Fills the fake TeamTalk server (TEAMTALK_BACKEND=fake) with --users users,
+then logs MyTeamTalkBot in. The server replays a USER_LOGGEDIN and
+USER_JOINED for every user, and the time until the bot's user cache is
+complete is reported. This is done twice: with per-event admin tracking and
+with the old _update_admin_ids rescan of the whole cache on every login.
+
+Usage: python benchmarks/bench_login_sync.py [--users N] [--admins N]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from config_manager import DEFAULT_CONFIG
+from bot import MyTeamTalkBot
+
+
+class LegacyAdminBot(MyTeamTalkBot):
+    """Rebuilds the admin set from the whole cache on every event, as before."""
+    def _track_admin(self, user):
+        self._update_admin_ids()
+
+
+def run_sync(bot_class, config, expected_users):
+    bot = bot_class(config)
+    logging.getLogger().setLevel(logging.WARNING)  # the bot resets it to INFO
+    thread = threading.Thread(target=bot.start, daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    while len(bot._user_cache) < expected_users or not bot._in_channel:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    handled = bot.event_batch_stats.sizes.total
+    admins = len(bot.admin_user_ids)
+    bot._mark_stopped_intentionally(); bot.stop()
+    thread.join(5)
+    return elapsed, handled, admins
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--admins", type=int, default=50)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = TeamTalk5.dll.server
+    channel_ids = [server.add_channel(f"/Room{i}/") for i in range(20)]
+    for i in range(args.users):
+        server.add_user(f"User {i}", f"user{i}", channel_id=channel_ids[i % len(channel_ids)])
+
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    config['Database']['file'] = ':memory:'
+    config['Bot']['admin_usernames'] = ",".join(f"user{i}" for i in range(0, args.users, max(1, args.users // max(1, args.admins))))
+    print(f"Login sync with {args.users} users already on the server")
+    for name, bot_class in (("per-event admin tracking", MyTeamTalkBot), ("rescan on every event (old)", LegacyAdminBot)):
+        elapsed, handled, admins = run_sync(bot_class, config, args.users + 1)
+        print(f"  {name:<28} {elapsed:7.2f} s  ({handled:,.0f} events, {admins} admins online)")
+
+
+if __name__ == "__main__":
+    main()
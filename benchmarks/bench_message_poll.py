@@ -0,0 +1,45 @@
+"""Micro-benchmark for the TeamTalk receive path and structure construction.
+
+Times idle `getMessage(0)` polls and `TextMessage()`/`User()` construction.
+Run it once normally and once with TEAMTALK_PY_DEBUG=1 to compare the reused
+receive buffer against a fresh TTMessage per poll plus a DLL size check on
+every structure construction.
+
+Usage: python benchmarks/bench_message_poll.py [--iterations N] [--rounds R]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from TeamTalk5 import TeamTalk, TextMessage, User
+
+
+def run(label, func, iterations, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<20} {iterations / best:>14,.0f} ops/s  ({best / iterations * 1e9:.0f} ns/op)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"TEAMTALK_PY_DEBUG: {'on' if TeamTalk5.TT_DEBUG else 'off'}")
+    tt = TeamTalk()
+    run("getMessage(0)", lambda: tt.getMessage(0), args.iterations, args.rounds)
+    run("TextMessage()", TextMessage, args.iterations, args.rounds)
+    run("User()", User, args.iterations, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
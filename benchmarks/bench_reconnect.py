@@ -0,0 +1,87 @@
+"""Time to reconnect after the server goes away, on the fake TeamTalk backend.
+
+Logs MyTeamTalkBot in to the fake server (TEAMTALK_BACKEND=fake) with
+--users users, then --outages times drops the connection and keeps the
+server down for --downtime seconds. The bot reconnects in-session with
+backoff; reported are its reconnect metrics (loss until logged in again),
+how long it stays responsive to queued event-thread calls during the
+outage, and whether the TeamTalk instance and services survived.
+
+Usage: python benchmarks/bench_reconnect.py [--users N] [--outages N] [--downtime S] [--runtime threaded|asyncio]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from config_manager import DEFAULT_CONFIG
+from metrics import RollingStats
+from bot import MyTeamTalkBot
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--outages", type=int, default=3)
+    parser.add_argument("--downtime", type=float, default=2.0)
+    parser.add_argument("--runtime", choices=("threaded", "asyncio"), default="threaded")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = TeamTalk5.dll.server
+    lobby = server.add_channel("/Lobby/")
+    for i in range(args.users):
+        server.add_user(f"User {i}", f"user{i}", channel_id=lobby)
+
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    config['Database']['file'] = ':memory:'
+    config['Bot']['initial_channel_path'] = "/Lobby/"
+    config['Bot']['runtime'] = args.runtime
+    config['Bot']['reconnect_delay_min'], config['Bot']['reconnect_delay_max'] = 1, 4
+    bot = MyTeamTalkBot(config)
+    logging.getLogger().setLevel(logging.WARNING)  # the bot resets it to INFO
+    thread = threading.Thread(target=bot.start, daemon=True)
+    thread.start()
+    if not wait_for(lambda: bot._in_channel, 10): sys.exit("Bot did not log in to the fake server.")
+    tt_instance, data_service = bot._tt, bot.data_service
+
+    call_latency = RollingStats()
+    for _ in range(args.outages):
+        server.accepting_connections = False
+        server.drop_clients()
+        outage_end = time.monotonic() + args.downtime
+        while time.monotonic() < outage_end:
+            done = threading.Event()
+            queued = time.perf_counter()
+            bot.call_on_event_thread(lambda: (call_latency.add(time.perf_counter() - queued), done.set()))
+            done.wait(1)
+            time.sleep(0.05)
+        server.accepting_connections = True
+        if not wait_for(lambda: bot._in_channel and len(bot._user_cache) > args.users, 30):
+            sys.exit("Bot did not reconnect.")
+
+    calls = call_latency.summary()
+    print(f"{args.outages} outages of {args.downtime:.1f}s, {args.users} users, {args.runtime} runtime")
+    for line in bot.reconnect_stats.format_lines(): print(f"  {line}")
+    print(f"  Event-thread calls during outages: {calls['count']}, p95 {calls['p95'] * 1000:.1f}ms, max {calls['max'] * 1000:.1f}ms")
+    print(f"  Same TeamTalk instance: {bot._tt is tt_instance}, same database service: {bot.data_service is data_service}")
+    bot._mark_stopped_intentionally(); bot._running = False
+    thread.join(5)
+
+
+if __name__ == "__main__":
+    main()
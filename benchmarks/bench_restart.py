@@ -0,0 +1,96 @@
+"""Restart-to-ready time of a bot session, with and without a shared service registry.
+
+Runs MyTeamTalkBot on the fake TeamTalk backend (TEAMTALK_BACKEND=fake) and
+restarts it --restarts times the way ApplicationController does: stop the
+session, join its thread, build a new bot and wait until it is back in its
+channel with every service usable. "Fresh services" gives each bot its own
+registry (the database is reopened, the Gemini model and scheduler
+rebuilt); "shared services" passes the controller's long-lived registry.
+Reported separately is the part spent building the bot and getting its
+services ready (the rest is stopping, connecting and the login sync), and
+whether conversation history survived the restarts. Without the optional
+libraries (google.generativeai, apscheduler, requests, pytz) installed the
+services are cheap to build, so the difference is mostly the database.
+
+Usage: python benchmarks/bench_restart.py [--restarts N] [--users N]
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from config_manager import DEFAULT_CONFIG
+from service_registry import ServiceRegistry
+from bot import MyTeamTalkBot
+
+
+def start_session(config, services):
+    started = time.perf_counter()
+    bot = MyTeamTalkBot(config, services=services)
+    setup_time = time.perf_counter() - started
+    logging.getLogger().setLevel(logging.WARNING)  # the bot resets it to INFO
+    thread = threading.Thread(target=bot.start, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not bot._in_channel and time.monotonic() < deadline:
+        time.sleep(0.001)
+    started = time.perf_counter()
+    for name in bot.SERVICE_NAMES: bot.services.get(name)  # ready means the first command finds its service
+    return bot, thread, setup_time + time.perf_counter() - started
+
+
+def stop_session(bot, thread):
+    bot._mark_stopped_intentionally(); bot.stop()
+    thread.join(5)
+
+
+def run(config, restarts, shared):
+    services = ServiceRegistry() if shared else None
+    bot, thread, _ = start_session(config, services)
+    bot.context_history_manager.add_message("1", "remember me", is_bot=False)
+    times, service_times = [], []
+    for _ in range(restarts):
+        started = time.perf_counter()
+        stop_session(bot, thread)
+        bot, thread, service_time = start_session(config, services)
+        times.append(time.perf_counter() - started); service_times.append(service_time)
+    history_kept = bool(bot.context_history_manager.get_history("1"))
+    stop_session(bot, thread)
+    if services: services.close()
+    return times, service_times, history_kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--restarts", type=int, default=10)
+    parser.add_argument("--users", type=int, default=500)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = TeamTalk5.dll.server
+    lobby = server.add_channel("/Lobby/")
+    for i in range(args.users):
+        server.add_user(f"User {i}", f"user{i}", channel_id=lobby)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = json.loads(json.dumps(DEFAULT_CONFIG))
+        config['Database']['file'] = os.path.join(tmp, "bot_data.db")
+        config['Database']['reminders_file'] = os.path.join(tmp, "reminders.sqlite")
+        config['Bot']['initial_channel_path'] = "/Lobby/"
+        print(f"{args.restarts} restarts, {args.users} users on the server (median restart-to-ready)")
+        for name, shared in (("fresh services (old)", False), ("shared services", True)):
+            times, service_times, history_kept = run(config, args.restarts, shared)
+            print(f"  {name:<21} {statistics.median(times) * 1000:7.1f} ms, of which bot setup + services {statistics.median(service_times) * 1000:6.2f} ms; conversation history kept: {history_kept}")
+
+
+if __name__ == "__main__":
+    main()
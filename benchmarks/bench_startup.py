@@ -0,0 +1,69 @@
+"""Startup time and memory of the headless (main.py) and GUI (main_gui.py) entry points.
+
+Each sample runs in a fresh interpreter: it imports the entry module, then
+constructs a MyTeamTalkBot (no connection is made), and reports the elapsed
+time, peak RSS and whether wx got imported. Services are created on first
+use; the "all services" mode also touches every one of them, which is what
+each start used to cost. The GUI mode needs wxPython and is skipped when it
+is not installed.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--backend native|fake]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "headless": ("import main", ""),
+    "headless, all services": ("import main", "for name in list(bot.services._factories): bot.services.get(name)"),
+    "gui": ("import main_gui, main; from gui.wx_ui_sink import WxUISink", ""),
+}
+
+SAMPLE = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{imports}
+config = json.loads(json.dumps(main.DEFAULT_CONFIG))
+config['Database']['file'] = ':memory:'
+bot = main.MyTeamTalkBot(config)
+{after}
+elapsed = time.perf_counter() - started
+try:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+except ImportError:
+    rss_kb = 0
+print(elapsed, rss_kb, 'wx' in sys.modules)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--backend", choices=("native", "fake"), default="native")
+    args = parser.parse_args()
+
+    env = dict(os.environ, TEAMTALK_BACKEND=args.backend)
+    # The first run writes __pycache__ so later runs time the import, not the compile.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    print(f"{args.runs} runs per mode, {args.backend} backend (median)")
+    for mode, (imports, after) in MODES.items():
+        times, rss = [], []
+        for run in range(args.runs + 1):
+            proc = subprocess.run([sys.executable, "-c", SAMPLE.format(root=REPO_ROOT, imports=imports, after=after)], env=env, cwd=REPO_ROOT, capture_output=True, text=True)
+            if proc.returncode:
+                print(f"  {mode:<23} skipped: {proc.stderr.strip().splitlines()[-1]}")
+                break
+            elapsed, rss_kb, wx_loaded = proc.stdout.split()
+            if run: times.append(float(elapsed)); rss.append(int(rss_kb))
+        else:
+            print(f"  {mode:<23} startup {statistics.median(times) * 1000:7.1f} ms, peak RSS {statistics.median(rss) / 1024:6.1f} MiB, wx imported: {wx_loaded}")
+
+
+if __name__ == "__main__":
+    main()
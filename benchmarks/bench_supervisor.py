@@ -0,0 +1,110 @@
+"""Several bot sessions in one process under supervisor.py, with one server crash-looping.
+
+Runs BotSupervisor on the fake TeamTalk backend (TEAMTALK_BACKEND=fake) with
+--sessions healthy servers (all on the one fake server, with --users users)
+plus a "broken" one whose port is invalid, so its bot fails on every start and
+is restarted with backoff. Reported are the time until every healthy session is
+in its channel, the process's peak RSS after the first and after all sessions,
+how many instances of each shared service exist, how often the broken session
+was restarted, and event-thread call latency of the healthy sessions meanwhile
+(threaded runtime; each call wakes the loop out of getMessage).
+
+Usage: python benchmarks/bench_supervisor.py [--sessions N] [--users N] [--seconds S]
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from config_manager import DEFAULT_CONFIG
+from metrics import RollingStats
+from bot import MyTeamTalkBot
+from supervisor import BotSupervisor
+
+
+def peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def in_channel(session):
+    return session.bot_instance is not None and session.bot_instance._in_channel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=6)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = TeamTalk5.dll.server
+    lobby = server.add_channel("/Lobby/")
+    for i in range(args.users):
+        server.add_user(f"User {i}", f"user{i}", channel_id=lobby)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = json.loads(json.dumps(DEFAULT_CONFIG))
+        config['Database']['file'] = os.path.join(tmp, "bot_data.db")
+        config['Database']['reminders_file'] = os.path.join(tmp, "reminders.sqlite")
+        config['Bot']['initial_channel_path'] = "/Lobby/"
+        servers = {f"s{i}": {"Connection": {"nickname": f"PyBot {i}"}} for i in range(args.sessions)}
+        servers["broken"] = {"Connection": {"port": "not-a-port"}}
+        supervisor = BotSupervisor(config, servers, os.path.join(tmp, "config.json"), os.path.join(tmp, "servers.json"))
+        supervisor.restart_delay_min, supervisor.restart_delay_max = 0.05, 0.5
+        *healthy, broken = supervisor.sessions
+        logging.disable(logging.CRITICAL)  # the bots reset the level to INFO and the broken one logs every failure
+
+        started = time.perf_counter()
+        broken.start(); healthy[0].start()
+        if not wait_for(lambda: in_channel(healthy[0]), 10): sys.exit("First session did not log in.")
+        first_rss = peak_rss_mib()
+        for session in healthy[1:]: session.start()
+        if not wait_for(lambda: all(in_channel(s) for s in healthy), 30): sys.exit("Not every session logged in.")
+        ready_time = time.perf_counter() - started
+        all_rss = peak_rss_mib()
+
+        for session in healthy:
+            for name in MyTeamTalkBot.SHARED_SERVICE_NAMES: session.bot_instance.services.get(name)
+        instances = {name: len({id(s.bot_instance.services.get(name)) for s in healthy}) for name in MyTeamTalkBot.SHARED_SERVICE_NAMES}
+        databases = len({id(s.bot_instance.data_service) for s in healthy})
+
+        call_latency = RollingStats()
+        end = time.monotonic() + args.seconds
+        while time.monotonic() < end:
+            for session in healthy:
+                done = threading.Event()
+                queued = time.perf_counter()
+                session.bot_instance.call_on_event_thread(lambda: (call_latency.add(time.perf_counter() - queued), done.set()))
+                done.wait(1)
+            time.sleep(0.02)
+        calls = call_latency.summary()
+        still_in = sum(in_channel(s) for s in healthy)
+
+        print(f"{args.sessions} sessions + 1 crash-looping, {args.users} users on the server")
+        print(f"  All sessions in channel after {ready_time * 1000:.0f}ms")
+        print(f"  Peak RSS: {first_rss:.1f} MiB with one session, {all_rss:.1f} MiB with {args.sessions} (+{(all_rss - first_rss) / max(1, args.sessions - 1):.2f} MiB per extra session)")
+        print(f"  Shared service instances: {', '.join(f'{name} {count}' for name, count in instances.items())}; databases: {databases}")
+        print(f"  Broken session failures in a row: {broken.failures}; healthy sessions still in channel: {still_in}/{args.sessions}")
+        print(f"  Event-thread calls on healthy sessions: {calls['count']}, p95 {calls['p95'] * 1000:.1f}ms, max {calls['max'] * 1000:.1f}ms")
+        supervisor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
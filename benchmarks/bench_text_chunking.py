@@ -0,0 +1,98 @@
+"""Benchmark for splitting outgoing text into TextMessage chunks.
+
+Compares the original character slicing (TT_STRLEN - 1 characters per chunk,
+a new TextMessage and a ttstr() encode per chunk) with text_chunker.chunk_text
+on synthetic replies shaped like Gemini output: markdown paragraphs, bullet
+lists, and some non-ASCII text. Reports chunks per reply (= doTextMessage
+calls), chunks that overflow szMessage, and time per reply.
+
+Usage: python benchmarks/bench_text_chunking.py [--replies N] [--rounds R]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TeamTalk5 import TextMessage, TT_STRLEN, ttstr
+from text_chunker import chunk_text
+
+SENTENCES = [
+    "Sure! Here is a short overview of the topic you asked about.",
+    "The main idea is simple, but there are a few details worth knowing.",
+    "Keep in mind that results can vary depending on your setup.",
+    "Selamat pagi, semoga harimu menyenangkan dan penuh semangat.",
+    "Café, naïve and façade are common examples of borrowed words.",
+    "東京は日本の首都で、人口が非常に多い都市です。",
+    "Let me know if you would like more examples 😊",
+    "In short: test early, measure often, and keep things readable.",
+]
+
+
+def build_replies(count):
+    rng = random.Random(42)
+    replies = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.3:
+                parts.append("\n".join(f"- **{rng.choice(SENTENCES)[:30]}** {rng.choice(SENTENCES)}" for _ in range(rng.randint(2, 5))))
+            else:
+                parts.append(" ".join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 8))))
+        replies.append("\n\n".join(parts))
+    return replies
+
+
+def legacy_chunks(message):
+    chunk_size = TT_STRLEN - 1
+    sent, overflow = 0, 0
+    chunks = [message[i:i + chunk_size] for i in range(0, len(message), chunk_size)]
+    for i, chunk in enumerate(chunks):
+        textmsg = TextMessage()
+        try:
+            textmsg.szMessage = ttstr(chunk)
+        except ValueError:
+            overflow += 1
+        textmsg.bMore = (i < len(chunks) - 1)
+        sent += 1
+    return sent, overflow
+
+
+def new_chunks(message, textmsg=TextMessage()):
+    chunks = chunk_text(message)
+    for i, chunk in enumerate(chunks):
+        textmsg.szMessage = chunk
+        textmsg.bMore = (i < len(chunks) - 1)
+    return len(chunks), 0
+
+
+def run(label, func, replies, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        totals = [func(reply) for reply in replies]
+        best = min(best, time.perf_counter() - start)
+    sent = sum(t[0] for t in totals)
+    overflow = sum(t[1] for t in totals)
+    print(f"{label:<12} {sent / len(replies):6.2f} chunks/reply, {overflow} overflowing chunks, "
+          f"{best / len(replies) * 1e6:.1f} us/reply")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replies", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    replies = build_replies(args.replies)
+    avg_len = sum(len(r) for r in replies) / len(replies)
+    lower_bound = sum(-(-len(ttstr(r)) // (TT_STRLEN - 1)) for r in replies) / len(replies)
+    print(f"{len(replies)} replies, avg {avg_len:.0f} characters, at least {lower_bound:.2f} chunks/reply when fully packed")
+    run("slicing", legacy_chunks, replies, args.rounds)
+    run("chunk_text", new_chunks, replies, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Memory and access cost of the bot's user cache: ctypes User copies vs UserRecords.
+
+Builds a cache of --users users both ways, the old one holding
+User.from_buffer_copy() structs and the new one holding UserRecords built
+once from the same structs, and reports the memory each holds (tracemalloc)
+and the time to read every cached nickname and username, which for a struct
+means a ttstr() decode per field.
+
+Usage: python benchmarks/bench_user_cache_memory.py [--users N]
+"""
+import argparse
+import ctypes
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("TEAMTALK_BACKEND", "fake")  # only the struct definitions are needed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TeamTalk5 import User, ttstr
+from user_record import UserRecord
+
+
+def make_users(count):
+    users = []
+    for i in range(count):
+        user = User()
+        user.nUserID, user.nChannelID = i + 1, i % 20 + 1
+        user.szNickname, user.szUsername = ttstr(f"User {i}"), ttstr(f"user{i}")
+        user.szStatusMsg, user.szClientName = ttstr("Available"), ttstr("TeamTalk 5.8")
+        users.append(user)
+    return users
+
+
+def measure(build, users):
+    tracemalloc.start()
+    cache = build(users)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return cache, size
+
+
+def read_ctypes(cache):
+    return sum(len(ttstr(u.szNickname)) + len(ttstr(u.szUsername)) for u in cache.values())
+
+
+def read_records(cache):
+    return sum(len(u.nickname) + len(u.username) for u in cache.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10000)
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    cases = (
+        ("ctypes User copies (old)", lambda us: {u.nUserID: User.from_buffer_copy(u) for u in us}, read_ctypes),
+        ("UserRecord", lambda us: {u.nUserID: UserRecord.from_user(u) for u in us}, read_records),
+    )
+    print(f"User cache with {args.users} users (sizeof(User) = {ctypes.sizeof(User)} bytes)")
+    for name, build, read in cases:
+        cache, size = measure(build, users)
+        started = time.perf_counter()
+        read(cache)
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<26} {size / 1024 / 1024:7.2f} MiB  ({size / args.users:6.0f} B/user), read all names {elapsed * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
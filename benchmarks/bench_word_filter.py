@@ -0,0 +1,82 @@
+"""Word filter cost per channel message: one regex per word vs WordFilter.
+
+Builds a --words word filter list (mostly single words, some phrases and words
+with punctuation) and --messages channel messages of about 15 words, a tenth of
+them containing a filtered word. The old check ran re.search(r'\\b' + word +
+r'\\b') for each word on each message; with more words than the re module's
+pattern cache holds, every search also compiles its pattern, so it is timed on
+the first --old-messages messages only. WordFilter is timed on all of them,
+plus the rebuild after a change to the list. Both must flag the same messages.
+
+Usage: python benchmarks/bench_word_filter.py [--words N] [--messages N] [--old-messages N]
+"""
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_filter import WordFilter
+
+
+def old_check(words, message):
+    msg_lower = message.lower()
+    return next((word for word in words if re.search(r'\b' + re.escape(word) + r'\b', msg_lower, re.IGNORECASE)), None)
+
+
+def random_word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--old-messages", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = set()
+    while len(words) < args.words:
+        kind = rng.random()
+        if kind < 0.9: words.add(random_word(rng))
+        elif kind < 0.95: words.add(f"{random_word(rng)} {random_word(rng)}")
+        else: words.add(f"{random_word(rng)}{rng.choice('*-.')}{random_word(rng)}")
+    word_list = sorted(words)
+    vocabulary = [random_word(rng) for _ in range(5000)]
+    messages = []
+    for i in range(args.messages):
+        text = [rng.choice(vocabulary).capitalize() if j == 0 else rng.choice(vocabulary) for j in range(15)]
+        if i % 10 == 0: text[rng.randrange(15)] = rng.choice(word_list).upper()
+        messages.append(" ".join(text) + rng.choice(".!?"))
+
+    old_messages = messages[:args.old_messages]
+    started = time.perf_counter()
+    old_hits = [old_check(words, message) is not None for message in old_messages]
+    old_time = (time.perf_counter() - started) / max(1, len(old_messages))
+
+    word_filter = WordFilter(words)
+    started = time.perf_counter()
+    word_filter.find("")  # first check after a change builds the matcher
+    build_time = time.perf_counter() - started
+    started = time.perf_counter()
+    hits = [word_filter.find(message) is not None for message in messages]
+    new_time = (time.perf_counter() - started) / len(messages)
+    word_filter.add("freshly added")
+    started = time.perf_counter()
+    word_filter.find("")
+    rebuild_time = time.perf_counter() - started
+
+    print(f"{len(words)} filtered words, {len(messages)} messages ({sum(hits)} flagged)")
+    print(f"  re.search per word (old): {old_time * 1000:9.2f} ms per message (first {len(old_messages)} messages)")
+    print(f"  WordFilter:               {new_time * 1000:9.4f} ms per message, {new_time * len(messages) * 1000:.1f} ms in total")
+    print(f"  WordFilter build {build_time * 1000:.1f} ms, rebuild after !filter add {rebuild_time * 1000:.1f} ms")
+    print(f"  Same messages flagged: {hits[:len(old_messages)] == old_hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""End-to-end load test of MyTeamTalkBot against the fake TeamTalk backend.
+
+Runs the real bot on TEAMTALK_BACKEND=fake (see fake_teamtalk.py), logs in
+--users simulated users, then drives a mix of status updates, channel moves
+and `whoami` PMs at --rate events per second. Reports how fast the bot
+drains events and the latency from each PM to the bot's reply.
+
+Usage: python benchmarks/load_test_fake_server.py [--users N] [--rate EPS] [--duration S] [--runtime threaded|asyncio] [--record FILE]
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from config_manager import DEFAULT_CONFIG
+from metrics import RollingStats
+
+
+def start_bot(args, channel_path):
+    from bot import MyTeamTalkBot
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    config['Database']['file'] = ':memory:'
+    config['Bot']['initial_channel_path'] = channel_path
+    config['Bot']['runtime'] = args.runtime
+    config['Bot']['event_record_file'] = args.record or ''
+    bot = MyTeamTalkBot(config)
+    bot.announce_join_leave = False
+    thread = threading.Thread(target=bot.start, name="BotUnderTest", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not bot._in_channel and time.monotonic() < deadline:
+        time.sleep(0.01)
+    if not bot._in_channel:
+        sys.exit("Bot did not log in to the fake server.")
+    return bot, thread
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--channels", type=int, default=20)
+    parser.add_argument("--rate", type=int, default=5000, help="events per second to inject")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--pm-share", type=float, default=0.05, help="fraction of events that are whoami PMs")
+    parser.add_argument("--commands-limit", type=int, default=0, help="server abuse limit per second (0 = unlimited)")
+    parser.add_argument("--runtime", choices=("threaded", "asyncio"), default="threaded")
+    parser.add_argument("--record", metavar="FILE", help="append the bot's events to FILE for benchmarks/replay_events.py")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = TeamTalk5.dll.server
+    server.commands_limit, server.commands_interval_msec = args.commands_limit, 1000 if args.commands_limit else 0
+    channel_ids = [server.add_channel(f"/Room{i}/") for i in range(args.channels)]
+    bot, thread = start_bot(args, "/Room0/")
+    logging.getLogger().setLevel(logging.WARNING)  # the bot resets it to INFO
+    rng = random.Random(1)
+
+    # Phase 1: mass login
+    started = time.perf_counter()
+    user_ids = [server.add_user(f"user{i}", f"user{i}", channel_id=rng.choice(channel_ids)) for i in range(args.users)]
+    injected = time.perf_counter() - started
+    wait_for(lambda: len(bot._user_cache) >= args.users + 1, 60)
+    drained = time.perf_counter() - started
+    print(f"Login: {args.users} users ({2 * args.users} events) injected in {injected:.2f}s, "
+          f"bot caught up after {drained:.2f}s ({2 * args.users / drained:,.0f} events/s)")
+
+    # Phase 2: steady churn with whoami probes
+    latencies = RollingStats(window=100000)
+    pending = {}
+    lock = threading.Lock()
+
+    def on_text_message(from_id, textmessage):
+        if textmessage.nMsgType != TeamTalk5.TextMsgType.MSGTYPE_USER or textmessage.bMore: return
+        with lock:
+            sent_at = pending.pop(textmessage.nToUserID, None)
+        if sent_at is not None:
+            latencies.add(time.perf_counter() - sent_at)
+    server.on_text_message = on_text_message
+
+    bot.event_batch_stats.__init__(window=100000)
+    events = probes = 0
+    interval = 1.0 / args.rate
+    started = time.perf_counter()
+    while time.perf_counter() - started < args.duration:
+        target = started + events * interval
+        now = time.perf_counter()
+        if target > now: time.sleep(target - now)
+        user_id = rng.choice(user_ids)
+        roll = rng.random()
+        if roll < args.pm_share:
+            with lock:
+                if user_id in pending: continue
+                pending[user_id] = time.perf_counter()
+            server.send_text(user_id, "whoami", to_user_id=bot._my_user_id)
+            probes += 1
+        elif roll < 0.6:
+            server.update_user(user_id, status_msg=f"busy {events}")
+        else:
+            server.move_user(user_id, rng.choice(channel_ids))
+        events += 1
+    elapsed = time.perf_counter() - started
+    wait_for(lambda: not pending, 10)
+    drained = time.perf_counter() - started
+
+    sizes = bot.event_batch_stats.sizes
+    lat = latencies.summary()
+    print(f"Churn: {events} events in {elapsed:.2f}s ({events / elapsed:,.0f}/s offered), "
+          f"bot handled {sizes.total:,.0f} events, drained after {drained:.2f}s ({sizes.total / drained:,.0f} events/s)")
+    print(f"Batches: avg {sizes.summary()['avg']:.1f} events, max {sizes.max:.0f}, budget hit {bot.event_batch_stats.budget_hits}x")
+    print(f"whoami replies: {lat['count']}/{probes}, latency avg {lat['avg'] * 1000:.1f}ms, "
+          f"p50 {lat['p50'] * 1000:.1f}ms, p95 {lat['p95'] * 1000:.1f}ms, max {lat['max'] * 1000:.1f}ms")
+    print(f"Server: {sum(server.text_counts.values())} text messages from clients, {server.abuse_violations} abuse-limit violations")
+
+    bot._running = False
+    thread.join(5)
+    if bot.event_recorder: bot.event_recorder.close()
+
+
+if __name__ == "__main__":
+    main()
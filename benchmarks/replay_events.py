@@ -0,0 +1,103 @@
+"""Replays a recorded TeamTalk event stream through MyTeamTalkBot's handlers.
+
+Record a stream by setting "event_record_file" in the Bot section of
+config.json (or with load_test_fake_server.py --record FILE), then replay it
+here at recorded or maximum speed. The bot runs on the fake TeamTalk backend,
+so nothing is sent to a real server. Reports per-event-type handler latency,
+outbound messages and database writes/commits.
+
+Usage: python benchmarks/replay_events.py FILE [--speed max|recorded] [--unthrottled]
+"""
+import argparse
+import collections
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+os.environ["TEAMTALK_BACKEND"] = "fake"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TeamTalk5
+from TeamTalk5 import ClientEvent, TextMsgType
+from config_manager import DEFAULT_CONFIG
+from event_recorder import read_events
+from metrics import RollingStats
+
+EVENT_NAMES = {v: k[len("CLIENTEVENT_"):] for k, v in vars(ClientEvent).items() if k.startswith("CLIENTEVENT_")}
+DB_WRITES = ("INSERT", "UPDATE", "DELETE", "REPLACE", "COMMIT")
+
+
+def make_bot():
+    from bot import MyTeamTalkBot
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    config['Database']['file'] = ':memory:'
+    bot = MyTeamTalkBot(config)
+    # Log the bot's fake client in so its replies reach the fake server, then
+    # drop the login events: the replay supplies the session's own.
+    bot.connect(bot.host, bot.tcp_port, bot.udp_port)
+    bot.doLogin(bot.nickname, bot.username, bot.password, bot.client_name)
+    while bot.getMessage(0).nClientEvent != ClientEvent.CLIENTEVENT_NONE: pass
+    bot._running = True
+    bot._event_thread_ident = threading.get_ident()
+    return bot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("--speed", choices=("max", "recorded"), default="max")
+    parser.add_argument("--unthrottled", action="store_true", help="ignore the recorded server's outbound rate limit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    bot = make_bot()
+    logging.getLogger().setLevel(logging.WARNING)  # the bot resets it to INFO
+    db_writes = collections.Counter()
+    bot.data_service.conn.set_trace_callback(
+        lambda sql: db_writes.update([sql.lstrip().split(None, 1)[0].upper()]) if sql.lstrip().upper().startswith(DB_WRITES) else None)
+
+    latencies = collections.defaultdict(lambda: RollingStats(window=1000000))
+    replay_start = time.perf_counter()
+    for offset, msg in read_events(args.file):
+        if args.speed == "recorded":
+            delay = replay_start + offset - time.perf_counter()
+            if delay > 0: time.sleep(delay)
+        started = time.perf_counter()
+        bot.dispatchMessage(msg)
+        if msg.nClientEvent == ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDIN and args.unthrottled:
+            bot.outbound_queue.configure(0, 0)
+        bot._housekeeping()
+        latencies[msg.nClientEvent].add(time.perf_counter() - started)
+    replay_time = time.perf_counter() - replay_start
+
+    # Let background handlers finish and the outbound queue empty.
+    deadline = time.monotonic() + 30
+    while (bot.background_runner.pending or bot.outbound_queue.depth or bot._event_thread_calls) and time.monotonic() < deadline:
+        delay = bot._housekeeping()
+        time.sleep(min(0.05, delay if delay is not None else 0.05))
+    drain_time = time.perf_counter() - replay_start - replay_time
+
+    total = sum(stats.count for stats in latencies.values())
+    print(f"Replayed {total} events in {replay_time:.2f}s ({total / replay_time:,.0f} events/s, {args.speed} speed), drained in {drain_time:.2f}s")
+    print(f"{'event':<28}{'count':>8}{'avg us':>10}{'p50 us':>10}{'p95 us':>10}{'max us':>10}")
+    for event, stats in sorted(latencies.items(), key=lambda item: -item[1].total):
+        s = stats.summary()
+        print(f"{EVENT_NAMES.get(event, event):<28}{s['count']:>8}{s['avg'] * 1e6:>10.1f}{s['p50'] * 1e6:>10.1f}{s['p95'] * 1e6:>10.1f}{s['max'] * 1e6:>10.1f}")
+
+    bot.data_service.flush()  # last-seen updates still buffered
+    server = TeamTalk5.dll.server
+    sent = server.text_counts
+    print(f"Outbound: {bot.outbound_queue.sent_count} chunks sent, {bot.outbound_queue.failed_count} failed, {bot.outbound_queue.depth} still queued "
+          f"(PM {sent[TextMsgType.MSGTYPE_USER]}, channel {sent[TextMsgType.MSGTYPE_CHANNEL]}, broadcast {sent[TextMsgType.MSGTYPE_BROADCAST]})")
+    print(f"Background jobs: {bot.background_runner.run_times.count} run, {bot.background_runner.rejected} rejected")
+    commits = db_writes.pop("COMMIT", 0)
+    print(f"DB writes: {sum(db_writes.values())} ({', '.join(f'{k} {v}' for k, v in sorted(db_writes.items())) or 'none'}) in {commits} commits")
+
+    bot.stop()
+
+
+if __name__ == "__main__":
+    main()
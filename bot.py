@@ -1,27 +1,74 @@
 
-import sys, time, logging, random, re, wx
+import os, sys, time, logging, random, re, threading, collections, heapq, itertools
 from TeamTalk5 import (
     TeamTalk, TeamTalkError, TextMsgType, UserRight, Subscription,
-    ttstr, ClientError, ClientFlags, TT_STRLEN, TextMessage, Channel
+    ttstr, ClientError, ClientFlags, ClientEvent, TextMessage, Channel
 )
 from config_manager import save_config
+from metrics import EventBatchStats, ReconnectStats
+from outbound_queue import OutboundQueue
+from text_chunker import chunk_text
 from handlers import command_handler
-from services.gemini_service import GeminiService
-from services.weather_service import WeatherService
-from services.time_service import TimeService
-from services.news_service import NewsService
-from services.url_shortener_service import URLShortenerService
-from services.reminder_service import ReminderService
+from handlers.executor import HandlerExecutor
+from event_recorder import EventRecorder
+from ui_sink import UISink
 from services.data_service import DataService
+from service_registry import ServiceRegistry, lazy_service
+from user_index import UserIndex
+from user_record import UserRecord
+from list_diff import diff_rows
+from channel_tree import ChannelTree
+from word_filter import WordFilter
 from context_history_manager import ContextHistoryManager
 
+def _new_gemini_service(config):
+    from services.gemini_service import GeminiService
+    bot_conf = config.get('Bot', {})
+    return GeminiService(bot_conf.get('gemini_api_key'), bot_conf.get('context_history_enabled', True),
+                         bot_conf.get('gemini_system_instruction', 'You are a helpful assistant.'),
+                         bot_conf.get('gemini_model_name', 'gemini-1.5-flash-latest'))
+
+def _new_weather_service(config):
+    from services.weather_service import WeatherService
+    return WeatherService(config.get('Bot', {}).get('weather_api_key'))
+
+def _new_news_service(config):
+    from services.news_service import NewsService
+    return NewsService(config.get('Bot', {}).get('news_api_key'))
+
+def _new_time_service(config):
+    from services.time_service import TimeService
+    return TimeService()
+
+def _new_url_shortener_service(config):
+    from services.url_shortener_service import URLShortenerService
+    return URLShortenerService()
+
+def _new_shared_reminder_service(config):
+    from services.reminder_service import ReminderService
+    service = ReminderService(None, config.get('Database', {}).get('reminders_file', 'reminders.sqlite'))
+    service.start()  # created on first use, i.e. by a running bot; bots attach themselves in _adopt_services
+    return service
+
+def shared_service_factories(config):
+    """Factories of MyTeamTalkBot.SHARED_SERVICE_NAMES for a registry several bots share (supervisor.py).
+
+    They depend on config only, never on a bot, so a shared service doesn't
+    belong to whichever session happened to create it; each bot hooks itself
+    up in _adopt_services.
+    """
+    return {'gemini_service': lambda: _new_gemini_service(config), 'weather_service': lambda: _new_weather_service(config),
+            'news_service': lambda: _new_news_service(config), 'time_service': lambda: _new_time_service(config),
+            'url_shortener_service': lambda: _new_url_shortener_service(config),
+            'reminder_service': lambda: _new_shared_reminder_service(config)}
+
 class MyTeamTalkBot(TeamTalk):
-    def __init__(self, config_dict, controller=None):
+    def __init__(self, config_dict, controller=None, services=None, session_name=''):
         super().__init__()
         self.config = config_dict
         self.controller = controller
+        self.session_name = session_name  # which server this bot is for when supervisor.py runs several
         conn_conf, bot_conf = self.config.get('Connection', {}), self.config.get('Bot', {})
-        db_conf = self.config.get('Database', {})
 
         self.host, self.tcp_port = ttstr(conn_conf.get('host')), int(conn_conf.get('port'))
         self.udp_port, self.nickname = self.tcp_port, ttstr(conn_conf.get('nickname'))
@@ -35,9 +82,37 @@ class MyTeamTalkBot(TeamTalk):
 
         self.reconnect_delay_min = int(bot_conf.get('reconnect_delay_min'))
         self.reconnect_delay_max = int(bot_conf.get('reconnect_delay_max'))
-
-        self.filtered_words = {w.strip().lower() for w in bot_conf.get('filtered_words','').split(',') if w.strip()}
-        self.admin_usernames_config = [n.strip().lower() for n in bot_conf.get('admin_usernames','').split(',') if n.strip()]
+        # Reconnecting happens in this session, on timers (see _handle_reconnect); nothing is rebuilt.
+        self._reconnect_attempt, self._reconnect_pending, self._disconnected_at = 0, False, None
+        self.reconnect_stats = ReconnectStats()
+
+        # Event queue draining: up to event_batch_max pending events are handled
+        # back to back, the loop only blocks (event_wait_msec) once the queue is empty.
+        self.event_batch_max = max(1, int(bot_conf.get('event_batch_max', 200)))
+        self.event_wait_msec = int(bot_conf.get('event_wait_msec', 100))
+        self.event_batch_stats = EventBatchStats()
+
+        # Slow (network-bound) handlers run here; anything they send is queued back to the event thread.
+        self.handler_executor = HandlerExecutor(int(bot_conf.get('handler_workers', 4)), int(bot_conf.get('handler_max_pending', 50)))
+        self._event_thread_calls = collections.deque()
+        self._event_thread_ident = None
+        self._wake_pending = False  # a wake-up event is queued for the threaded loop, see call_on_event_thread
+        self._timers, self._timer_seq = [], itertools.count()  # heap of (due, seq, func, args), see call_later
+        # Bot.runtime "asyncio" runs the event loop and background handlers on asyncio instead.
+        self.runtime = bot_conf.get('runtime', 'threaded')
+        self.async_runtime = None
+        if self.runtime == 'asyncio':
+            from async_runtime import AsyncBotRuntime
+            self.async_runtime = AsyncBotRuntime(self, int(bot_conf.get('async_max_inflight', 500)))
+        # Outgoing text is rate limited to stay under the server's abuse prevention limits (set at login).
+        self.outbound_queue = OutboundQueue(self._send_queued_chunk, float(bot_conf.get('outbound_headroom', 0.8)))
+        self._outbound_textmsg = TextMessage()
+        # Bot.event_record_file captures every dispatched event for benchmarks/replay_events.py.
+        record_file = bot_conf.get('event_record_file', '')
+        self.event_recorder = EventRecorder(record_file) if record_file else None
+
+        self.filtered_words = WordFilter(w.strip().lower() for w in bot_conf.get('filtered_words','').split(',') if w.strip())
+        self.admin_usernames_config = {n.strip().lower() for n in bot_conf.get('admin_usernames','').split(',') if n.strip()}
 
         self._logged_in = self._running = self._intentional_stop = self.bot_locked = False
         self._my_user_id = self._target_channel_id = self._join_cmd_id = -1
@@ -45,57 +120,143 @@ class MyTeamTalkBot(TeamTalk):
         
         self._in_channel_ids = set() 
         
-        self._user_cache = {}
+        self._user_cache = {}  # user_id -> UserRecord
+        self.user_index = UserIndex()  # nickname/username lookups over _user_cache
+        self.channel_tree = ChannelTree()  # channel id/path lookups, kept current from channel events
         self.admin_user_ids, self.blocked_commands = set(), set()
+        # Users joining before the cache knows them are fetched one by one; a full resync follows at most once per window.
+        self.user_resync_delay_sec = float(bot_conf.get('user_resync_delay_sec', 5.0))
+        self._user_resync_pending = False
         
         self._text_message_buffer, self.polls, self.warning_counts = {}, {}, {}
-        self.next_poll_id = 1; self.main_window = None
+        self.next_poll_id = 1; self.ui = UISink()
+        # User/channel list changes within gui_list_debounce_msec are sent to the UI together, as one row diff.
+        self.gui_list_debounce_sec = int(bot_conf.get('gui_list_debounce_msec', 200)) / 1000
+        self._gui_users, self._gui_user_list_pending = {}, False  # rows the UI has: id -> row
+        self._gui_channels, self._gui_channel_list_pending = {}, False
 
         self.announce_join_leave = self.allow_channel_messages = self.allow_broadcast = True
-        self.allow_gemini_pm = self.allow_gemini_channel = True
+        # Switched off when the Gemini service turns out to be unusable on first use.
+        self.allow_gemini_pm = self.allow_gemini_channel = bool(bot_conf.get('gemini_api_key'))
         self.welcome_message_mode, self.filter_enabled = "template", bool(self.filtered_words)
         self.UNBLOCKABLE_COMMANDS = {'h','q','rs','block','unblock','info','whoami','rights','lock','!tfilter','!tgmmode', 'health', 'afk', 'seen'}
 
         self.context_history_enabled = bot_conf.get('context_history_enabled', True)
         self.debug_logging_enabled = bot_conf.get('debug_logging_enabled', False)
         
-        # Initialize services
-        self.data_service = DataService(db_conf.get('file'))
-
-        gemini_system_instruction = bot_conf.get('gemini_system_instruction', 'You are a helpful assistant.')
-        gemini_model_name = bot_conf.get('gemini_model_name', 'gemini-1.5-flash-latest')
-        self.gemini_service = GeminiService(bot_conf.get('gemini_api_key'), self.context_history_enabled, gemini_system_instruction, gemini_model_name)
-        
-        self.weather_service = WeatherService(bot_conf.get('weather_api_key'))
-        self.news_service = NewsService(bot_conf.get('news_api_key'))
-        self.time_service = TimeService()
-        self.url_shortener_service = URLShortenerService()
-        self.reminder_service = ReminderService(self)
-        self.context_history_manager = ContextHistoryManager(bot_conf.get('context_history_retention_minutes', 60))
-        if not self.gemini_service.is_enabled(): self.allow_gemini_pm = self.allow_gemini_channel = False
+        # Initialize services. Everything but the database is created on first use (see the _create_* methods).
+        # A registry passed in by the controller outlives this session, so a restart keeps the database
+        # connection, the Gemini model, conversation history and the scheduler; it is closed by its owner.
+        self.services, self._owns_services = services or ServiceRegistry(), services is None
+        for name in self.SERVICE_NAMES:
+            if name in self.services.shared: continue  # registered once by the registry's owner, see shared_service_factories
+            self.services.register(name, getattr(self, f"_create_{name}"))
+        self.services.get('data_service')
+        self._adopt_services()
         self._apply_debug_logging_setting()
 
+    SERVICE_NAMES = ('data_service', 'context_history_manager', 'gemini_service', 'weather_service', 'news_service',
+                     'time_service', 'url_shortener_service', 'reminder_service')
+    # Services one instance of which can serve every server; the database and conversation
+    # history hold per-server user/channel ids and stay with each session.
+    SHARED_SERVICE_NAMES = ('gemini_service', 'weather_service', 'news_service', 'time_service',
+                            'url_shortener_service', 'reminder_service')
+    data_service = lazy_service()
+    context_history_manager = lazy_service()
+    gemini_service = lazy_service()
+    weather_service = lazy_service()
+    news_service = lazy_service()
+    time_service = lazy_service()
+    url_shortener_service = lazy_service()
+    reminder_service = lazy_service()
+
+    def _adopt_services(self):
+        """Hooks this session up to services an earlier session already created."""
+        gemini, reminders = self.services.peek('gemini_service'), self.services.peek('reminder_service')
+        if gemini and not gemini.is_enabled(): self.allow_gemini_pm = self.allow_gemini_channel = False
+        if reminders: reminders.attach(self)
+
+    def _create_data_service(self):
+        db_conf = self.config.get('Database', {})
+        return DataService(db_conf.get('file'), float(db_conf.get('last_seen_flush_sec', 2.0)), int(db_conf.get('last_seen_flush_max', 500)))
+
+    def _create_context_history_manager(self):
+        return ContextHistoryManager(self.config.get('Bot', {}).get('context_history_retention_minutes', 60))
+
+    def _create_gemini_service(self):
+        service = _new_gemini_service(self.config)
+        if not service.is_enabled(): self.allow_gemini_pm = self.allow_gemini_channel = False
+        return service
+
+    def _create_weather_service(self): return _new_weather_service(self.config)
+    def _create_news_service(self): return _new_news_service(self.config)
+    def _create_time_service(self): return _new_time_service(self.config)
+    def _create_url_shortener_service(self): return _new_url_shortener_service(self.config)
+
+    def _create_reminder_service(self):
+        from services.reminder_service import ReminderService
+        service = ReminderService(self, self.config.get('Database', {}).get('reminders_file', 'reminders.sqlite'))
+        if self._running: service.start()
+        return service
+
     @property
     def _in_channel(self):
         return self._target_channel_id in self._in_channel_ids
 
-    def set_main_window(self, window): self.main_window = window; self._log_to_gui("GUI window linked.")
-    def _log_to_gui(self, msg):
-        if self.main_window and hasattr(wx, 'CallAfter'):
-            wx.CallAfter(self.main_window.log_message, msg)
-        else:
-            logging.info(f"[Bot] {msg}")
+    @property
+    def background_runner(self):
+        return self.async_runtime or self.handler_executor
+
+    def set_ui(self, sink): self.ui = sink; self._log_to_gui("GUI window linked.")
+    def _log_to_gui(self, msg): self.ui.log_message(msg)
 
     def _send_pm(self, to_id, msg): self._send_text_message(msg, TextMsgType.MSGTYPE_USER, nToUserID=to_id)
     def _send_channel_message(self, chan_id, msg): return self._send_text_message(msg, TextMsgType.MSGTYPE_CHANNEL, nChannelID=chan_id)
     def _send_broadcast(self, msg): return self._send_text_message(msg, TextMsgType.MSGTYPE_BROADCAST)
 
+    def call_on_event_thread(self, func, *args, **kwargs):
+        """Runs func on the TeamTalk event thread: immediately if already there, otherwise on the next loop pass."""
+        if threading.get_ident() == self._event_thread_ident: return func(*args, **kwargs)
+        self._event_thread_calls.append((func, args, kwargs))
+        if self.async_runtime: self.async_runtime.wake()
+        elif not self._wake_pending and self._logged_in:
+            # The threaded loop sleeps in getMessage(); the SDK can only queue a user state change to end that early.
+            self._wake_pending = True
+            self.pumpMessage(ClientEvent.CLIENTEVENT_USER_STATECHANGE, self._my_user_id)
+
+    def call_later(self, delay, func, *args):
+        """Runs func(*args) on the event thread after delay seconds. Must be called on the event thread."""
+        heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), func, args))
+        if self.async_runtime: self.async_runtime.wake()
+
+    def _run_due_timers(self):
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, func, args = heapq.heappop(self._timers)
+            try: func(*args)
+            except Exception as e: logging.error(f"Error in timer {getattr(func, '__name__', func)}: {e}", exc_info=True)
+
+    def run_background(self, key, func, *args, **kwargs) -> bool:
+        """Runs a slow job (plain or async def) off the event thread, in order with other jobs for key."""
+        return self.background_runner.submit(key, func, *args, **kwargs)
+
+    def _run_event_thread_calls(self):
+        while self._event_thread_calls:
+            func, args, kwargs = self._event_thread_calls.popleft()
+            try: func(*args, **kwargs)
+            except Exception as e: logging.error(f"Error in event thread call {getattr(func, '__name__', func)}: {e}", exc_info=True)
+
     def _send_text_message(self, message: str, msg_type: int, **kwargs) -> bool:
+        """Queues message for sending. Returns False if it was refused (empty, bot locked, channel
+        messages or broadcasts turned off); True only means it was accepted. The chunks go out later
+        from the outbound queue, and a chunk the server refuses is logged and counted there."""
         if not message: return False
         is_chan = msg_type == TextMsgType.MSGTYPE_CHANNEL
         if (is_chan and (self.bot_locked or not self.allow_channel_messages)) or \
            (msg_type == TextMsgType.MSGTYPE_BROADCAST and (self.bot_locked or not self.allow_broadcast)):
             return False
+        if self._event_thread_ident is not None and threading.get_ident() != self._event_thread_ident:
+            self.call_on_event_thread(self._send_text_message, message, msg_type, **kwargs); return True
         
         user_id = None
         if msg_type == TextMsgType.MSGTYPE_USER and 'nToUserID' in kwargs:
@@ -103,51 +264,79 @@ class MyTeamTalkBot(TeamTalk):
         elif msg_type == TextMsgType.MSGTYPE_CHANNEL and 'nChannelID' in kwargs:
             user_id = str(kwargs['nChannelID'])
         
-        chunk_size = TT_STRLEN - 1
-        message_chunks = [message[i:i + chunk_size] for i in range(0, len(message), chunk_size)]
-
-        for i, chunk in enumerate(message_chunks):
-            textmsg = TextMessage()
-            textmsg.nMsgType = msg_type
-            textmsg.nToUserID = kwargs.get('nToUserID', 0)
-            textmsg.nChannelID = kwargs.get('nChannelID', 0)
-            textmsg.szMessage = ttstr(chunk)
-            textmsg.bMore = (i < len(message_chunks) - 1)
-            if self.doTextMessage(textmsg) == 0:
-                self._log_to_gui(f"[Error] Failed to send message part."); return False
+        message_chunks = chunk_text(message)
+        self.outbound_queue.enqueue(msg_type, kwargs.get('nToUserID', 0), kwargs.get('nChannelID', 0), message_chunks)
+        self.outbound_queue.pump()
+        if self.outbound_queue.depth and self.async_runtime: self.async_runtime.wake()
         
         if user_id:
             self.context_history_manager.add_message(user_id, message, is_bot=True)
         return True
 
+    def _send_queued_chunk(self, queued, index):
+        # Chunks are pre-encoded by chunk_text; the DLL copies the struct, so one instance is reused.
+        textmsg = self._outbound_textmsg
+        textmsg.nMsgType = queued.msg_type
+        textmsg.nToUserID = queued.to_user_id
+        textmsg.nChannelID = queued.channel_id
+        textmsg.szMessage = queued.chunks[index]
+        textmsg.bMore = (index < len(queued.chunks) - 1)
+        if self.doTextMessage(textmsg) == 0:
+            self._log_to_gui(f"[Error] Failed to send message part."); return False
+        return True
+
     def _populate_user_cache(self):
-        self._user_cache.clear()
+        self._user_cache.clear(); self.user_index.clear()
         try:
             all_users = self.getServerUsers() or []
             for user in all_users:
-                self._user_cache[user.nUserID] = user
+                record = self._user_cache[user.nUserID] = UserRecord.from_user(user)
+                self.user_index.add(record)
             logging.info(f"User cache populated with {len(self._user_cache)} users.")
             self._update_admin_ids()
         except TeamTalkError as e:
             logging.error(f"Error populating user cache: {e}")
 
+    def _fill_user(self, user):
+        """Caches one user that an event named before the cache knew it, and arms the coalesced resync."""
+        fetched = self.getUser(user.nUserID)
+        cached = self._user_cache[user.nUserID] = UserRecord.from_user(fetched if fetched.nUserID == user.nUserID else user)
+        self.user_index.add(cached)
+        self._track_admin(cached)
+        if not self._user_resync_pending:
+            self._user_resync_pending = True
+            self.call_later(self.user_resync_delay_sec, self._resync_user_cache)
+        return cached
+
+    def _resync_user_cache(self):
+        self._user_resync_pending = False
+        if self._logged_in: self._populate_user_cache()
+
     def _update_admin_ids(self):
+        """Rebuilds admin_user_ids from the whole cache; single events go through _track_admin."""
         self.admin_user_ids.clear()
         for user in self._user_cache.values():
-            if ttstr(user.szUsername).lower() in self.admin_usernames_config:
-                self.admin_user_ids.add(user.nUserID)
+            if user.username.lower() in self.admin_usernames_config:
+                self.admin_user_ids.add(user.user_id)
         if ttstr(self.username).lower() in self.admin_usernames_config:
             self.admin_user_ids.add(self._my_user_id)
         logging.debug(f"Admin IDs updated: {self.admin_user_ids or 'None'}")
 
+    def _track_admin(self, user):
+        if user.username.lower() in self.admin_usernames_config: self.admin_user_ids.add(user.user_id)
+        else: self.admin_user_ids.discard(user.user_id)
+
     def _is_admin(self, user_id): return user_id in self.admin_user_ids
     
-    def _find_user_by_nick(self, nick):
-        target_nick = ttstr(nick).lower()
-        for user in self._user_cache.values():
-            if ttstr(user.szNickname).lower() == target_nick:
-                return user
-        return None
+    def _find_user_by_nick(self, nick, channel_id=None):
+        """Cached user with exactly this nickname (case-insensitive), in channel_id if given.
+
+        Moderation commands act on exact matches only; near matches are offered as suggestions.
+        """
+        users = self.user_index.users_by_nick(nick)
+        # The cache doesn't track channel moves, so ask the client library where the user is now.
+        if channel_id is not None: users = [u for u in users if self.getUser(u.user_id).nChannelID == channel_id]
+        return users[0] if users else None
 
     def _save_runtime_config(self, save_gkey=False):
         self._log_to_gui("Saving runtime config...");
@@ -155,18 +344,24 @@ class MyTeamTalkBot(TeamTalk):
         self.config['Connection']['nickname'] = ttstr(self.nickname)
         self.config['Bot']['status_message'] = ttstr(self.status_message)
         self.config['Bot']['initial_channel_path'] = ttstr(self.initial_channel_path)
-        if save_gkey: self.config['Bot']['gemini_api_key'] = self.gemini_service.api_key
-        self.config['Bot']['gemini_system_instruction'] = self.gemini_service.system_instruction
-        self.config['Bot']['gemini_model_name'] = self.gemini_service.model_name
-        save_config(self.config)
+        gemini = self.services.peek('gemini_service')  # not created yet means the config values are still current
+        if gemini:
+            if save_gkey: self.config['Bot']['gemini_api_key'] = gemini.api_key
+            self.config['Bot']['gemini_system_instruction'] = gemini.system_instruction
+            self.config['Bot']['gemini_model_name'] = gemini.model_name
+        if self.controller: self.controller.save_session_config(self.config)
+        else: save_config(self.config)
         
     def _mark_stopped_intentionally(self): self._intentional_stop = True
 
     def stop(self):
         if not self._running: return
         self._log_to_gui("Stop requested."); self._running = False; time.sleep(0.1)
-        self.reminder_service.shutdown()
-        self.data_service.close()
+        self.handler_executor.shutdown()
+        data_service = self.services.peek('data_service')
+        if data_service: data_service.flush()  # buffered last-seen updates; a shared registry stays open
+        if self._owns_services: self.services.close()
+        if self.event_recorder: self.event_recorder.close()
         try:
             if self.getFlags() & ClientFlags.CLIENT_CONNECTED:
                 if self._logged_in: self.doLogout()
@@ -178,11 +373,16 @@ class MyTeamTalkBot(TeamTalk):
     def start(self):
         self._log_to_gui(f"Initializing bot session..."); self._start_time = time.time()
         self._intentional_stop = False; self._running = True
-        self.reminder_service.start()
+        # Reminders saved by an earlier session need the scheduler running; otherwise it starts on first use.
+        if os.path.exists(self.config.get('Database', {}).get('reminders_file', 'reminders.sqlite')): self.reminder_service.start()
         try:
-            if not self.connect(self.host, self.tcp_port, self.udp_port): self._running = False; return
-            self._log_to_gui("Connection started. Entering event loop.")
-            while self._running: self.runEventLoop(100)
+            if not self.connect(self.host, self.tcp_port, self.udp_port): return  # stop() below still closes the instance
+            self._log_to_gui(f"Connection started. Entering event loop ({self.runtime} runtime).")
+            if self.async_runtime:
+                self.async_runtime.run()
+            else:
+                self._event_thread_ident = threading.get_ident()
+                while self._running: self._process_event_batch()
         except Exception as e:
             logging.error(f"Bot `start` method caught an exception: {e}", exc_info=True)
         finally:
@@ -190,59 +390,122 @@ class MyTeamTalkBot(TeamTalk):
             if self.controller:
                 self.controller.on_bot_session_ended()
 
-    def _initiate_restart(self):
-        self._log_to_gui("--- BOT RESTART SEQUENCE INITIATED ---")
-        if self.controller:
-            self.controller.request_restart()
-        else:
-            self._log_to_gui("[CRITICAL] No controller found! Cannot restart.")
+    def dispatchMessage(self, msg):
+        if self.event_recorder: self.event_recorder.record(msg)
+        super().dispatchMessage(msg)
+
+    def _housekeeping(self):
+        """Event-thread chores between event batches. Returns seconds until it needs to run again, or None."""
+        self._wake_pending = False
+        self._run_event_thread_calls()
+        self._run_due_timers()
+        self.outbound_queue.pump()
+        if self._event_thread_calls: return 0.0
+        next_due = self.outbound_queue.next_send_delay()
+        if self._timers:
+            timer_due = max(0.0, self._timers[0][0] - time.monotonic())
+            next_due = timer_due if next_due is None else min(next_due, timer_due)
+        return next_due
+
+    def _process_event_batch(self):
+        next_due = self._housekeeping()
+        wait_msec = self.event_wait_msec if next_due is None else min(self.event_wait_msec, int(next_due * 1000) + 1)
+        msg = self.getMessage(wait_msec)
+        if msg.nClientEvent == ClientEvent.CLIENTEVENT_NONE: return
+        batch_start = time.perf_counter()
+        self.dispatchMessage(msg)
+        count = 1
+        while count < self.event_batch_max and self._running:
+            msg = self.getMessage(0)
+            if msg.nClientEvent == ClientEvent.CLIENTEVENT_NONE: break
+            self.dispatchMessage(msg)
+            count += 1
+        self.event_batch_stats.record(count, time.perf_counter() - batch_start, count >= self.event_batch_max)
 
     def _update_gui_channel_list(self):
-        if not self.main_window: return
-        try:
-            channels_raw = self.getServerChannels() or []
-            channels_data = []
-            for chan in sorted(channels_raw, key=lambda c: ttstr(c.szName).lower()):
-                path = ttstr(self.getChannelPath(chan.nChannelID))
-                channels_data.append({'id': chan.nChannelID, 'path': path})
-            self.main_window.update_channel_list(channels_data)
-        except TeamTalkError as e:
-            self._log_to_gui(f"[Error] Failed to get server channels: {e}")
+        """Schedules a channel list refresh; a burst of channel events ends up as one diff."""
+        if not self.ui.active or self._gui_channel_list_pending: return
+        self._gui_channel_list_pending = True
+        self.call_later(self.gui_list_debounce_sec, self._flush_gui_channel_list)
+
+    def _flush_gui_channel_list(self):
+        self._gui_channel_list_pending = False
+        if not self.ui.active or not self._logged_in: return
+        channels_data = {chan_id: {'id': chan_id, 'name': name, 'path': path} for chan_id, name, path in self.channel_tree.channels_by_name()}
+        removed, added, changed = diff_rows(self._gui_channels, channels_data)
+        self._gui_channels = channels_data
+        if removed or added or changed: self.ui.apply_channel_list_diff(removed, added, changed)
+
+    def _clear_gui_channel_list(self):
+        self._gui_channels = {}
+        self.ui.update_channel_list([])
 
     def _update_gui_user_list(self, channel_id):
-        if not self.main_window or channel_id != self._target_channel_id:
+        """Schedules a refresh of the target channel's user list (debounced, see _flush_gui_user_list)."""
+        if not self.ui.active or channel_id != self._target_channel_id or self._gui_user_list_pending:
             return
+        self._gui_user_list_pending = True
+        self.call_later(self.gui_list_debounce_sec, self._flush_gui_user_list)
+
+    def _flush_gui_user_list(self):
+        self._gui_user_list_pending = False
+        channel_id = self._target_channel_id
+        if not self.ui.active or channel_id not in self._in_channel_ids: return
         try:
             users_raw = self.getChannelUsers(channel_id) or []
-            users_data = []
-            for user in sorted(users_raw, key=lambda u: ttstr(u.szNickname).lower()):
-                users_data.append({
-                    'id': user.nUserID,
-                    'nick': ttstr(user.szNickname),
-                    'user': ttstr(user.szUsername)
-                })
-            self.main_window.update_user_list(users_data)
         except TeamTalkError as e:
-            self._log_to_gui(f"[Error] Failed to get users for channel {channel_id}: {e}")
+            self._log_to_gui(f"[Error] Failed to get users for channel {channel_id}: {e}"); return
+        users_data = {}
+        for user in users_raw:
+            users_data[user.nUserID] = {
+                'id': user.nUserID,
+                'nick': ttstr(user.szNickname),
+                'user': ttstr(user.szUsername)
+            }
+        # Status changes and the like leave the rows as they are; then nothing is sent.
+        removed, added, changed = diff_rows(self._gui_users, users_data)
+        self._gui_users = users_data
+        if removed or added or changed: self.ui.apply_user_list_diff(removed, added, changed)
+
+    def _clear_gui_user_list(self):
+        self._gui_users = {}
+        self.ui.update_user_list([])
 
     def onConnectSuccess(self): self._log_to_gui("Connected. Logging in..."); self.doLogin(self.nickname, self.username, self.password, self.client_name)
     def onConnectFailed(self): self._log_to_gui("[Error] Connection failed."); self._handle_reconnect()
     def onConnectionLost(self): 
         self._log_to_gui("[Error] Connection lost.")
         self._logged_in = False
-        self._in_channel_ids.clear()
-        if self.main_window:
-            wx.CallAfter(self.main_window.update_channel_list, [])
-            wx.CallAfter(self.main_window.update_user_list, [])
-            wx.CallAfter(self.main_window.update_feature_list)
+        self.reconnect_stats.losses += 1
+        self._in_channel_ids.clear(); self.channel_tree.clear()
+        self.outbound_queue.clear()
+        self._clear_gui_channel_list(); self._clear_gui_user_list()
+        self.ui.update_feature_list()
         self._handle_reconnect()
 
     def _handle_reconnect(self):
-        if self._running and not self._intentional_stop:
-            delay = random.randint(self.reconnect_delay_min, self.reconnect_delay_max)
-            self._log_to_gui(f"Reconnecting in {delay}s..."); time.sleep(delay)
-            if self._running and not self._intentional_stop:
-                self._initiate_restart()
+        """Schedules the next connection attempt: exponential backoff from reconnect_delay_min up to
+        reconnect_delay_max, with jitter. The same TeamTalk instance, caches and services are reused."""
+        if not self._running or self._intentional_stop or self._reconnect_pending: return
+        if self._disconnected_at is None: self._disconnected_at = time.monotonic()
+        backoff = min(self.reconnect_delay_max, self.reconnect_delay_min * 2 ** min(self._reconnect_attempt, 16))
+        delay = random.uniform(backoff / 2, backoff)
+        self._reconnect_attempt += 1; self._reconnect_pending = True
+        self._log_to_gui(f"Reconnecting in {delay:.1f}s (attempt {self._reconnect_attempt})...")
+        self.call_later(delay, self._reconnect)
+
+    def _reconnect(self):
+        self._reconnect_pending = False
+        if not self._running or self._intentional_stop: return
+        self.disconnect()
+        if not self.connect(self.host, self.tcp_port, self.udp_port):
+            self._log_to_gui("[Error] Could not start connecting."); self._handle_reconnect()
+
+    def _reconnected(self):
+        downtime = time.monotonic() - self._disconnected_at
+        self.reconnect_stats.record(downtime, self._reconnect_attempt)
+        self._log_to_gui(f"Reconnected after {downtime:.1f}s ({self._reconnect_attempt} attempt(s)).")
+        self._reconnect_attempt, self._disconnected_at = 0, None
 
     def onCmdError(self, cmd_id, err):
         self._log_to_gui(f"[Cmd Error {cmd_id}] {err.nErrorNo} - {ttstr(err.szErrorMsg)}")
@@ -251,20 +514,23 @@ class MyTeamTalkBot(TeamTalk):
     def onCmdMyselfLoggedIn(self, user_id, user_acc):
         self._logged_in, self._my_user_id = True, user_id
         self.my_rights = user_acc.uUserRights
+        self.outbound_queue.configure(user_acc.abusePrevent.nCommandsLimit, user_acc.abusePrevent.nCommandsIntervalMSec)
         self._log_to_gui(f"Login success! My ID: {user_id}, Rights: {self.my_rights:#010x}")
+        if self._disconnected_at is not None: self._reconnected()
 
         self.doSubscribe(0, Subscription.SUBSCRIBE_USER_MSG | Subscription.SUBSCRIBE_CHANNEL_MSG)
+        self.channel_tree.load(self.getServerChannels() or [])
         self._populate_user_cache()
+        self._adopt_services()  # shared services may have been created by another server's bot since __init__
         
         # Update last seen for myself
         self.data_service.update_last_seen(user_id, ttstr(self.nickname), "logging in")
 
-        if self.main_window:
-            wx.CallAfter(self.main_window.Show)
-            wx.CallAfter(self.main_window.SetTitle, f"Bot - {ttstr(self.nickname)}")
-            wx.CallAfter(self._update_gui_channel_list)
-            wx.CallAfter(self.main_window.update_user_list, []) # Clear user list initially
-            wx.CallAfter(self.main_window.update_feature_list)
+        self.ui.session_started(f"Bot - {ttstr(self.nickname)}")
+        # The window may still list an earlier session's rows; start both lists from empty.
+        self._clear_gui_channel_list(); self._clear_gui_user_list()
+        self._update_gui_channel_list()
+        self.ui.update_feature_list()
 
         if self.status_message: self.doChangeStatus(0, self.status_message)
         
@@ -272,11 +538,11 @@ class MyTeamTalkBot(TeamTalk):
         self.target_channel_path = self.initial_channel_path
         self._log_to_gui(f"Attempting to find initial channel: '{self.target_channel_path}'")
         
-        chan_id = self.getChannelIDFromPath(self.target_channel_path)
+        chan_id = self.channel_tree.id_from_path(self.target_channel_path)
         
         if chan_id <= 0:
             self._log_to_gui(f"Initial channel path not found immediately. Falling back to root channel.")
-            chan_id = self.getRootChannelID()
+            chan_id = self.channel_tree.root_id or self.getRootChannelID()
 
         if chan_id > 0:
             self._log_to_gui(f"Found channel ID {chan_id}. Attempting to join.")
@@ -288,74 +554,83 @@ class MyTeamTalkBot(TeamTalk):
     def onCmdMyselfLoggedOut(self):
         self._log_to_gui("Logged out.")
         self._logged_in = False
-        self._user_cache.clear()
-        self._in_channel_ids.clear()
-        if self.main_window:
-            wx.CallAfter(self.main_window.update_channel_list, [])
-            wx.CallAfter(self.main_window.update_user_list, [])
-            wx.CallAfter(self.main_window.update_feature_list)
+        self._user_cache.clear(); self.user_index.clear(); self.admin_user_ids.clear()
+        self._in_channel_ids.clear(); self.channel_tree.clear()
+        self.outbound_queue.clear()
+        self._clear_gui_channel_list(); self._clear_gui_user_list()
+        self.ui.update_feature_list()
     
     def onCmdUserLoggedIn(self, user):
-        self._user_cache[user.nUserID] = user
-        self._update_admin_ids()
-        self.data_service.update_last_seen(user.nUserID, ttstr(user.szNickname), "logging in")
-        logging.info(f"User logged in: {ttstr(user.szNickname)}. Cache updated.")
+        cached = self._user_cache[user.nUserID] = UserRecord.from_user(user)
+        self.user_index.add(cached)
+        self._track_admin(cached)
+        self.data_service.update_last_seen(user.nUserID, cached.nickname, "logging in")
+        logging.info(f"User logged in: {cached.nickname}. Cache updated.")
 
     def onCmdUserLoggedOut(self, user):
         cached_user_nick = "Unknown"
         if user.nUserID in self._user_cache:
-            cached_user_nick = ttstr(self._user_cache[user.nUserID].szNickname)
+            cached_user_nick = self._user_cache[user.nUserID].nickname
             del self._user_cache[user.nUserID]
-            self._update_admin_ids()
+            self.user_index.remove(user.nUserID)
+            self.admin_user_ids.discard(user.nUserID)
         
         self.data_service.update_last_seen(user.nUserID, cached_user_nick, "logging out")
         logging.info(f"User logged out: {cached_user_nick}. Cache updated.")
-        if self.main_window and user.nChannelID == self._target_channel_id:
+        if self.ui.active and user.nChannelID == self._target_channel_id:
             self._update_gui_user_list(self._target_channel_id)
             
     def onCmdUserJoinedChannel(self, user):
         user_nick = ttstr(user.szNickname)
-        self.data_service.update_last_seen(user.nUserID, user_nick, f"joining channel '{ttstr(self.getChannelPath(user.nChannelID))}'")
+        self.data_service.update_last_seen(user.nUserID, user_nick, f"joining channel '{self.channel_tree.path(user.nChannelID)}'")
 
         if user.nUserID == self._my_user_id:
             self._in_channel_ids.add(user.nChannelID)
             self._log_to_gui(f"Joined channel ID: {user.nChannelID}. Currently in: {self._in_channel_ids}")
             if user.nChannelID == self._target_channel_id:
                 self._update_gui_user_list(user.nChannelID)
-                if self.main_window: wx.CallAfter(self.main_window.update_bot_controls_status)
+                self.ui.update_bot_controls_status()
             return
             
         if user.nUserID not in self._user_cache:
-            logging.warning(f"User {user.nUserID} joined channel but not in cache yet. Refreshing cache.")
-            self._populate_user_cache()
+            logging.warning(f"User {user.nUserID} joined channel but not in cache yet. Fetching it.")
+            self._fill_user(user)
         
-        if self.main_window and user.nChannelID == self._target_channel_id:
+        if self.ui.active and user.nChannelID == self._target_channel_id:
             self._update_gui_user_list(user.nChannelID)
 
         if self.announce_join_leave and user.nChannelID in self._in_channel_ids:
             cached_user = self._user_cache.get(user.nUserID)
             if cached_user:
-                user_nick = ttstr(cached_user.szNickname)
+                user_nick = cached_user.nickname
                 logging.info(f"Announcing join for user '{user_nick}' in channel {user.nChannelID}")
-                welcome_msg = self.gemini_service.generate_welcome_message() if self.welcome_message_mode == "gemini" and self.gemini_service.is_enabled() else f"Welcome, {user_nick}!"
-                self._send_channel_message(user.nChannelID, welcome_msg)
+                if self.welcome_message_mode == "gemini" and self.gemini_service.is_enabled():
+                    welcome = self._send_gemini_welcome_async if self.async_runtime else self._send_gemini_welcome
+                    self.run_background(user.nUserID, welcome, user.nChannelID)
+                else:
+                    self._send_channel_message(user.nChannelID, f"Welcome, {user_nick}!")
             else:
                 logging.error(f"Could not announce join for UserID {user.nUserID}, not found in cache after refresh.")
     
+    def _send_gemini_welcome(self, chan_id):
+        self._send_channel_message(chan_id, self.gemini_service.generate_welcome_message())
+
+    async def _send_gemini_welcome_async(self, chan_id):
+        self._send_channel_message(chan_id, await self.gemini_service.generate_welcome_message_async())
+
     def onCmdUserLeftChannel(self, chan_id, user):
         user_nick = ttstr(user.szNickname)
-        self.data_service.update_last_seen(user.nUserID, user_nick, f"leaving channel '{ttstr(self.getChannelPath(chan_id))}'")
+        self.data_service.update_last_seen(user.nUserID, user_nick, f"leaving channel '{self.channel_tree.path(chan_id)}'")
 
         if user.nUserID == self._my_user_id:
             self._in_channel_ids.discard(chan_id)
             self._log_to_gui(f"Left channel ID: {chan_id}. Currently in: {self._in_channel_ids}")
             if chan_id == self._target_channel_id:
-                if self.main_window: 
-                    wx.CallAfter(self.main_window.update_user_list, [])
-                    wx.CallAfter(self.main_window.update_bot_controls_status)
+                self._clear_gui_user_list()
+                self.ui.update_bot_controls_status()
             return
 
-        if self.main_window and chan_id == self._target_channel_id:
+        if self.ui.active and chan_id == self._target_channel_id:
             self._update_gui_user_list(chan_id)
 
         if self.announce_join_leave and chan_id in self._in_channel_ids:
@@ -368,19 +643,21 @@ class MyTeamTalkBot(TeamTalk):
         self.data_service.update_last_seen(self._my_user_id, ttstr(self.nickname), f"being kicked from channel by {kicker_nick}")
         self._log_to_gui(f"Kicked from channel ID {channelid} by {kicker_nick}. Currently in: {self._in_channel_ids}")
         if channelid == self._target_channel_id:
-            if self.main_window:
-                wx.CallAfter(self.main_window.update_user_list, [])
-                wx.CallAfter(self.main_window.update_bot_controls_status)
+            self._clear_gui_user_list()
+            self.ui.update_bot_controls_status()
 
     def onCmdChannelNew(self, channel: Channel):
+        self.channel_tree.add(channel)
         self._log_to_gui(f"New channel created: {ttstr(channel.szName)}")
         self._update_gui_channel_list()
 
     def onCmdChannelUpdate(self, channel: Channel):
+        self.channel_tree.add(channel)
         self._log_to_gui(f"Channel updated: {ttstr(channel.szName)}")
         self._update_gui_channel_list()
 
     def onCmdChannelRemove(self, channel: Channel):
+        self.channel_tree.remove(channel.nChannelID)
         self._log_to_gui(f"Channel removed: {ttstr(channel.szName)}")
         self._update_gui_channel_list()
 
@@ -398,12 +675,12 @@ class MyTeamTalkBot(TeamTalk):
             self.context_history_manager.add_message(str(textmessage.nChannelID), full_msg, is_bot=False)
 
         log_prefix = ""
-        if textmessage.nMsgType == TextMsgType.MSGTYPE_CHANNEL: log_prefix=f"[{ttstr(self.getChannelPath(textmessage.nChannelID))}]"
+        if textmessage.nMsgType == TextMsgType.MSGTYPE_CHANNEL: log_prefix=f"[{self.channel_tree.path(textmessage.nChannelID)}]"
         elif textmessage.nMsgType == TextMsgType.MSGTYPE_USER: log_prefix="[PM]"
         
         sender_nick = "Unknown"
         if textmessage.nFromUserID in self._user_cache:
-            sender_nick = ttstr(self._user_cache[textmessage.nFromUserID].szNickname)
+            sender_nick = self._user_cache[textmessage.nFromUserID].nickname
         self._log_to_gui(f"{log_prefix} <{sender_nick}> {full_msg}")
         
         command_handler.handle_message(self, textmessage, full_msg)
@@ -411,11 +688,12 @@ class MyTeamTalkBot(TeamTalk):
     def onCmdUserUpdate(self, user):
         user_nick = ttstr(user.szNickname)
         if user.nUserID in self._user_cache:
-            old_nick = ttstr(self._user_cache[user.nUserID].szNickname)
+            old_nick = self._user_cache[user.nUserID].nickname
             if old_nick.lower() != user_nick.lower():
                 self.data_service.update_last_seen(user.nUserID, user_nick, f"changing nickname from '{old_nick}'")
-            self._user_cache[user.nUserID] = user
-            self._update_admin_ids()
+            cached = self._user_cache[user.nUserID] = UserRecord.from_user(user)
+            self.user_index.add(cached)
+            self._track_admin(cached)
         
         if user.nUserID == self._my_user_id:
             if user_nick != self.nickname or ttstr(user.szStatusMsg) != self.status_message:
@@ -424,7 +702,7 @@ class MyTeamTalkBot(TeamTalk):
                 self._log_to_gui(f"My info updated: Nick='{self.nickname}', Status='{self.status_message}'")
                 self._save_runtime_config()
         
-        if self.main_window and user.nChannelID == self._target_channel_id:
+        if self.ui.active and user.nChannelID == self._target_channel_id:
             self._update_gui_user_list(self._target_channel_id)
 
     def toggle_feature(self, attr_name, on_msg, off_msg):
@@ -0,0 +1,96 @@
+from TeamTalk5 import ttstr
+
+def _text(value) -> str:
+    # Struct fields are bytes on Linux and str on Windows; config values and arguments may be either.
+    return ttstr(value) if isinstance(value, bytes) else value
+
+def normalize_path(path) -> str:
+    """'/A/B/' form used by TeamTalk, whatever slashes the caller used."""
+    parts = [p for p in _text(path).strip().split('/') if p]
+    return '/' + ''.join(p + '/' for p in parts)
+
+class ChannelTree:
+    """The server's channels (id<->path, parent/children) kept in memory.
+
+    Loaded from getServerChannels() after login and updated from the
+    CHANNEL_NEW/UPDATE/REMOVE events, so path and ID lookups never call into
+    the client library. Paths are rebuilt lazily after a channel changes,
+    which is rare compared to lookups.
+    """
+    def __init__(self):
+        self._channels = {}   # id -> (parent_id, name)
+        self._children = {}   # id -> set of child ids
+        self.root_id = 0
+        self._paths = None    # id -> path, None when stale
+        self._ids = None      # lowercase path -> id
+
+    def __len__(self):
+        return len(self._channels)
+
+    def clear(self):
+        self._channels.clear(); self._children.clear(); self.root_id = 0; self._paths = self._ids = None
+
+    def load(self, channels):
+        self.clear()
+        for channel in channels: self.add(channel)
+
+    def add(self, channel):
+        """Adds a channel or applies an update (rename, move)."""
+        channel_id, parent_id = channel.nChannelID, channel.nParentID
+        old = self._channels.get(channel_id)
+        if old is not None and old[0] != parent_id:
+            self._children.get(old[0], set()).discard(channel_id)
+        self._channels[channel_id] = (parent_id, _text(channel.szName))
+        if parent_id: self._children.setdefault(parent_id, set()).add(channel_id)
+        else: self.root_id = channel_id
+        self._paths = self._ids = None
+
+    def remove(self, channel_id: int):
+        """Removes a channel and everything below it."""
+        entry = self._channels.pop(channel_id, None)
+        if entry is None: return
+        self._children.get(entry[0], set()).discard(channel_id)
+        for child_id in list(self._children.pop(channel_id, ())):
+            self.remove(child_id)
+        if channel_id == self.root_id: self.root_id = 0
+        self._paths = self._ids = None
+
+    def _rebuild(self):
+        paths = {}
+        def path_of(channel_id):
+            path = paths.get(channel_id)
+            if path is None:
+                parent_id, name = self._channels[channel_id]
+                if parent_id in self._channels: path = path_of(parent_id) + name + '/'
+                elif parent_id: path = '/' + name + '/'  # parent not seen yet, placed under the root for now
+                else: path = '/'
+                paths[channel_id] = path
+            return path
+        for channel_id in self._channels: path_of(channel_id)
+        self._paths, self._ids = paths, {path.lower(): channel_id for channel_id, path in paths.items()}
+
+    def path(self, channel_id: int) -> str:
+        """The channel's path, or '' if the channel is unknown."""
+        if self._paths is None: self._rebuild()
+        return self._paths.get(channel_id, '')
+
+    def id_from_path(self, path) -> int:
+        """The ID of the channel at path (any case, slashes optional), or 0."""
+        if self._ids is None: self._rebuild()
+        return self._ids.get(normalize_path(path).lower(), 0)
+
+    def parent(self, channel_id: int) -> int:
+        entry = self._channels.get(channel_id)
+        return entry[0] if entry else 0
+
+    def children(self, channel_id: int) -> list[int]:
+        return sorted(self._children.get(channel_id, ()), key=lambda c: self._channels[c][1].lower())
+
+    def name(self, channel_id: int) -> str:
+        entry = self._channels.get(channel_id)
+        return entry[1] if entry else ''
+
+    def channels_by_name(self) -> list[tuple[int, str, str]]:
+        """(id, name, path) for every channel, sorted by name."""
+        if self._paths is None: self._rebuild()
+        return sorted(((cid, name, self._paths[cid]) for cid, (_, name) in self._channels.items()), key=lambda c: c[1].lower())
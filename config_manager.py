@@ -29,10 +29,23 @@ DEFAULT_CONFIG = {
         'filtered_words': '',
         'context_history_retention_minutes': 60,
         'context_history_enabled': True,
-        'debug_logging_enabled': False
+        'debug_logging_enabled': False,
+        'event_batch_max': 200,
+        'event_wait_msec': 100,
+        'handler_workers': 4,
+        'handler_max_pending': 50,
+        'runtime': 'threaded',
+        'async_max_inflight': 500,
+        'outbound_headroom': 0.8,
+        'event_record_file': '',
+        'user_resync_delay_sec': 5.0,
+        'gui_list_debounce_msec': 200
     },
     'Database': {
-        'file': 'bot_data.db'
+        'file': 'bot_data.db',
+        'reminders_file': 'reminders.sqlite',
+        'last_seen_flush_sec': 2.0,
+        'last_seen_flush_max': 500
     }
 }
 
@@ -45,13 +58,35 @@ def _deep_update(d, u):
             d[k] = v
     return d
 
-def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        logging.warning(f"{CONFIG_FILE} not found. Will prompt for setup.")
+def normalize_config(config):
+    """Casts the values load_config validates to their expected types. Raises TypeError/ValueError."""
+    # Ensure numeric values are integers
+    config['Bot']['reconnect_delay_min'] = int(config['Bot']['reconnect_delay_min'])
+    config['Bot']['reconnect_delay_max'] = int(config['Bot']['reconnect_delay_max'])
+    config['Bot']['context_history_retention_minutes'] = int(config['Bot']['context_history_retention_minutes'])
+    config['Bot']['event_batch_max'] = int(config['Bot']['event_batch_max'])
+    config['Bot']['event_wait_msec'] = int(config['Bot']['event_wait_msec'])
+    config['Bot']['handler_workers'] = int(config['Bot']['handler_workers'])
+    config['Bot']['handler_max_pending'] = int(config['Bot']['handler_max_pending'])
+    config['Bot']['async_max_inflight'] = int(config['Bot']['async_max_inflight'])
+    config['Bot']['outbound_headroom'] = float(config['Bot']['outbound_headroom'])
+    config['Bot']['user_resync_delay_sec'] = float(config['Bot']['user_resync_delay_sec'])
+    config['Bot']['gui_list_debounce_msec'] = int(config['Bot']['gui_list_debounce_msec'])
+    config['Database']['last_seen_flush_sec'] = float(config['Database']['last_seen_flush_sec'])
+    config['Database']['last_seen_flush_max'] = int(config['Database']['last_seen_flush_max'])
+
+    # Ensure boolean values are booleans
+    config['Bot']['context_history_enabled'] = bool(config['Bot']['context_history_enabled'])
+    config['Bot']['debug_logging_enabled'] = bool(config['Bot']['debug_logging_enabled'])
+    return config
+
+def load_config(path=CONFIG_FILE):
+    if not os.path.exists(path):
+        logging.warning(f"{path} not found. Will prompt for setup.")
         return None
 
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        with open(path, 'r', encoding='utf-8') as f:
             loaded_config = json.load(f)
         
         # Create a deep copy of defaults and merge loaded config on top of it
@@ -60,36 +95,29 @@ def load_config():
         config = _deep_update(config, loaded_config)
 
         # --- Type and value validation ---
-        # Ensure numeric values are integers
-        config['Bot']['reconnect_delay_min'] = int(config['Bot']['reconnect_delay_min'])
-        config['Bot']['reconnect_delay_max'] = int(config['Bot']['reconnect_delay_max'])
-        config['Bot']['context_history_retention_minutes'] = int(config['Bot']['context_history_retention_minutes'])
-
-        # Ensure boolean values are booleans
-        config['Bot']['context_history_enabled'] = bool(config['Bot']['context_history_enabled'])
-        config['Bot']['debug_logging_enabled'] = bool(config['Bot']['debug_logging_enabled'])
+        normalize_config(config)
 
-        logging.info(f"Loaded configuration from {CONFIG_FILE}")
+        logging.info(f"Loaded configuration from {path}")
         return config
     except json.JSONDecodeError as e:
-        logging.error(f"Error decoding JSON from {CONFIG_FILE}: {e}. Please fix or delete it.")
+        logging.error(f"Error decoding JSON from {path}: {e}. Please fix or delete it.")
         return None
     except (TypeError, ValueError) as e:
-        logging.error(f"Invalid value in config file {CONFIG_FILE}: {e}. Please fix or delete it.")
+        logging.error(f"Invalid value in config file {path}: {e}. Please fix or delete it.")
         return None
     except Exception as e:
-        logging.error(f"Error reading config file {CONFIG_FILE}: {e}. Please fix or delete it.")
+        logging.error(f"Error reading config file {path}: {e}. Please fix or delete it.")
         return None
 
 
-def save_config(structured_config_data):
+def save_config(structured_config_data, path=CONFIG_FILE):
     # Ensure all default keys are present before saving
     config_to_save = json.loads(json.dumps(DEFAULT_CONFIG)) # Deep copy
     config_to_save = _deep_update(config_to_save, structured_config_data)
 
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as configfile:
+        with open(path, 'w', encoding='utf-8') as configfile:
             json.dump(config_to_save, configfile, indent=4)
-        logging.info(f"Configuration saved to {CONFIG_FILE}")
+        logging.info(f"Configuration saved to {path}")
     except IOError as e:
-        logging.error(f"Error saving configuration to {CONFIG_FILE}: {e}")
\ No newline at end of file
+        logging.error(f"Error saving configuration to {path}: {e}")
\ No newline at end of file
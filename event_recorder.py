@@ -0,0 +1,72 @@
+import gzip
+import logging
+import struct
+import threading
+import time
+from ctypes import sizeof
+
+from TeamTalk5 import TTMessage
+
+# File layout: MAGIC, the recording's sizeof(TTMessage), then one record per
+# event: (seconds since start, payload length) followed by the TTMessage bytes
+# with trailing zero bytes stripped. The whole stream is gzip compressed. Every
+# bot session appends its own MAGIC, header and records, so a restart doesn't
+# lose the capture of the sessions before it.
+MAGIC = b"TTEVENTS1\n"
+_HEADER = struct.Struct("<I")
+_RECORD = struct.Struct("<dI")
+
+class EventRecorder:
+    """Writes every TTMessage the bot dispatches to a compact file (Bot.event_record_file).
+
+    Replay it with benchmarks/replay_events.py. record() runs on the TeamTalk event
+    thread; close() may be called from another one (bot.stop()).
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "ab", compresslevel=1)
+        self._file.write(MAGIC + _HEADER.pack(sizeof(TTMessage)))
+        self._start = time.perf_counter()
+        logging.info(f"Recording TeamTalk events to {path}")
+
+    def record(self, msg: TTMessage):
+        payload = bytes(msg).rstrip(b"\0")
+        with self._lock:
+            if self._file is None: return  # closed by stop() while the event thread was still dispatching
+            self._file.write(_RECORD.pack(time.perf_counter() - self._start, len(payload)) + payload)
+            self.recorded += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is None: return
+            self._file.close(); self._file = None
+        logging.info(f"Recorded {self.recorded} TeamTalk events to {self.path}")
+
+def _check_header(path, header):
+    (msg_size,) = _HEADER.unpack(header)
+    if msg_size != sizeof(TTMessage):
+        raise ValueError(f"{path} was recorded with sizeof(TTMessage)={msg_size}, this build has {sizeof(TTMessage)}")
+    return msg_size
+
+def read_events(path: str):
+    """Yields (seconds since start, TTMessage) for each event in a recording.
+
+    Later sessions in the file continue where the one before ended.
+    """
+    with gzip.open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a TeamTalk event recording")
+        msg_size = _check_header(path, f.read(_HEADER.size))
+        base = last = 0.0
+        while True:
+            header = f.read(_RECORD.size)
+            if len(header) < _RECORD.size: return
+            if header.startswith(MAGIC):  # next session; MAGIC read as a record would be an offset of ~1e93 seconds
+                rest = header[len(MAGIC):] + f.read(len(MAGIC) + _HEADER.size - _RECORD.size)
+                msg_size, base = _check_header(path, rest), last
+                continue
+            offset, length = _RECORD.unpack(header)
+            last = base + offset
+            yield last, TTMessage.from_buffer_copy(f.read(length).ljust(msg_size, b"\0"))
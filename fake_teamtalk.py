@@ -0,0 +1,564 @@
+"""In-process stand-in for libTeamTalk5, selected with TEAMTALK_BACKEND=fake.
+
+FakeLibrary provides the TT_* functions the bot uses, backed by a simulated
+FakeServer. Load tests drive the server directly (add users, move them, send
+text) and every connected client gets the matching events from TT_GetMessage,
+so MyTeamTalkBot can run end to end without the SDK or a real server.
+Unimplemented TT_* functions return 0.
+"""
+import collections
+import ctypes
+import itertools
+import logging
+import threading
+import time
+
+_TeamTalk5 = None
+
+def _tt():
+    # Imported lazily: TeamTalk5 imports this module while it is still loading.
+    global _TeamTalk5
+    if _TeamTalk5 is None:
+        import TeamTalk5
+        _TeamTalk5 = TeamTalk5
+    return _TeamTalk5
+
+def _arg(value):
+    """Unwraps byref() arguments."""
+    return getattr(value, '_obj', value)
+
+def _text(value) -> str:
+    if value is None: return ""
+    if isinstance(value, bytes): return value.decode('utf-8', errors='replace')
+    if isinstance(value, ctypes.Array): return value.value.decode('utf-8', errors='replace')
+    return str(value)
+
+def _enc(value: str) -> bytes:
+    return value.encode('utf-8')[:_tt().TT_STRLEN - 1]
+
+class FakeUser:
+    __slots__ = ('user_id', 'nickname', 'username', 'channel_id', 'status_mode', 'status_msg', 'client_name', 'ip_address', 'user_type')
+
+    def __init__(self, user_id, nickname, username, client_name="FakeClient", ip_address="127.0.0.1", user_type=1):
+        self.user_id, self.nickname, self.username = user_id, nickname, username
+        self.channel_id, self.status_mode, self.status_msg = 0, 0, ""
+        self.client_name, self.ip_address, self.user_type = client_name, ip_address, user_type
+
+class FakeChannel:
+    __slots__ = ('channel_id', 'parent_id', 'name', 'topic', 'password')
+
+    def __init__(self, channel_id, parent_id, name, topic="", password=""):
+        self.channel_id, self.parent_id, self.name, self.topic, self.password = channel_id, parent_id, name, topic, password
+
+class FakeClient:
+    """One TT instance created by TT_InitTeamTalkPoll."""
+    def __init__(self, handle):
+        self.handle = handle
+        self.events = collections.deque()
+        self.ready = threading.Condition()
+        self.flags = 0
+        self.user = None
+        self.account_username = ""
+
+    def post(self, event, source=0, member=None, value=None):
+        with self.ready:
+            self.events.append((event, source, member, value))
+            self.ready.notify()
+
+class FakeServer:
+    """Simulated server state shared by all fake client instances.
+
+    All methods are thread-safe, so a load generator thread can inject
+    users and text while the bot polls TT_GetMessage.
+    """
+    def __init__(self, name="Fake TeamTalk Server", commands_limit=0, commands_interval_msec=0):
+        self.name = name
+        self.version = "5.99-fake"
+        self.commands_limit, self.commands_interval_msec = commands_limit, commands_interval_msec
+        self.lock = threading.RLock()
+        self.accepting_connections = True  # False makes TT_Connect attempts fail (server down)
+        self.channels = {1: FakeChannel(1, 0, "")}
+        self.users = {}
+        self.clients = {}
+        self.banned_usernames = set()
+        self._user_ids = itertools.count(1)
+        self._channel_ids = itertools.count(2)
+        self._cmd_ids = itertools.count(1)
+        # Text sent by clients: counters, a bounded log and an optional callback(from_id, textmessage)
+        self.text_counts = collections.Counter()
+        self.text_log = collections.deque(maxlen=1000)
+        self.on_text_message = None
+        self.command_times = collections.deque()
+        self.abuse_violations = 0
+
+    # --- Simulation API ---
+    def add_channel(self, path: str, password: str = "") -> int:
+        """Creates every missing channel along path and returns the ID of the last one."""
+        with self.lock:
+            parent_id = 1
+            for name in [p for p in path.split('/') if p]:
+                child = next((c for c in self.channels.values() if c.parent_id == parent_id and c.name == name), None)
+                if child is None:
+                    child = FakeChannel(next(self._channel_ids), parent_id, name)
+                    self.channels[child.channel_id] = child
+                    self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_CHANNEL_NEW, 0, 'channel', self._channel_struct(child))
+                parent_id = child.channel_id
+            self.channels[parent_id].password = password or self.channels[parent_id].password
+            return parent_id
+
+    def update_channel(self, channel_id: int, name: str = None, parent_id: int = None):
+        """Renames and/or moves a channel, like an admin reorganising the server."""
+        with self.lock:
+            channel = self.channels.get(channel_id)
+            if channel is None: return
+            if name is not None: channel.name = name
+            if parent_id is not None: channel.parent_id = parent_id
+            self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_CHANNEL_UPDATE, 0, 'channel', self._channel_struct(channel))
+
+    def remove_channel(self, channel_id: int):
+        with self.lock:
+            channel = self.channels.pop(channel_id, None)
+            if channel:
+                self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_CHANNEL_REMOVE, 0, 'channel', self._channel_struct(channel))
+
+    def add_user(self, nickname: str, username: str = "", channel_id: int = 0, **kwargs) -> int:
+        """Logs in a simulated user (and joins channel_id if given). Returns the user ID."""
+        with self.lock:
+            user = FakeUser(next(self._user_ids), nickname, username, **kwargs)
+            self.users[user.user_id] = user
+            self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN, 0, 'user', self._user_struct(user))
+            if channel_id: self.move_user(user.user_id, channel_id)
+            return user.user_id
+
+    def remove_user(self, user_id: int):
+        with self.lock:
+            user = self.users.get(user_id)
+            if user is None: return
+            if user.channel_id: self._leave(user)
+            del self.users[user_id]
+            self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDOUT, 0, 'user', self._user_struct(user))
+            client = self._client_for(user)
+            if client:
+                client.user = None
+                client.flags &= ~_tt().ClientFlags.CLIENT_AUTHORIZED
+                client.post(_tt().ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDOUT)
+
+    def move_user(self, user_id: int, channel_id: int, kicker_id: int = 0):
+        with self.lock:
+            user = self.users.get(user_id)
+            if user is None or channel_id not in self.channels: return False
+            if user.channel_id: self._leave(user, kicker_id)
+            user.channel_id = channel_id
+            self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_USER_JOINED, 0, 'user', self._user_struct(user))
+            return True
+
+    def update_user(self, user_id: int, nickname: str = None, status_msg: str = None, status_mode: int = None):
+        with self.lock:
+            user = self.users.get(user_id)
+            if user is None: return
+            if nickname is not None: user.nickname = nickname
+            if status_msg is not None: user.status_msg = status_msg
+            if status_mode is not None: user.status_mode = status_mode
+            self._broadcast(_tt().ClientEvent.CLIENTEVENT_CMD_USER_UPDATE, 0, 'user', self._user_struct(user))
+
+    def send_text(self, from_id: int, text: str, to_user_id: int = 0, channel_id: int = 0):
+        """Sends text from a simulated user as a PM (to_user_id) or channel message (channel_id)."""
+        tt = _tt()
+        from text_chunker import chunk_text
+        with self.lock:
+            user = self.users.get(from_id)
+            if user is None: return
+            msg_type = tt.TextMsgType.MSGTYPE_CHANNEL if channel_id else tt.TextMsgType.MSGTYPE_USER
+            chunks = chunk_text(text)
+            for i, chunk in enumerate(chunks):
+                textmsg = tt.TextMessage()
+                textmsg.nMsgType, textmsg.nFromUserID = msg_type, from_id
+                textmsg.szFromUsername = _enc(user.username)
+                textmsg.nToUserID, textmsg.nChannelID = to_user_id, channel_id
+                textmsg.szMessage, textmsg.bMore = chunk, i < len(chunks) - 1
+                self._deliver_text(textmsg)
+
+    def drop_clients(self):
+        """Drops every client's connection (CON_LOST), as when the server or the network goes away."""
+        tt = _tt()
+        with self.lock:
+            for client in list(self.clients.values()):
+                if not client.flags & tt.ClientFlags.CLIENT_CONNECTED: continue
+                user, client.user, client.flags = client.user, None, 0
+                if user: self.remove_user(user.user_id)
+                client.post(tt.ClientEvent.CLIENTEVENT_CON_LOST)
+
+    # --- Internals ---
+    def _client_for(self, user):
+        return next((c for c in self.clients.values() if c.user is user), None)
+
+    def _leave(self, user, kicker_id=0):
+        tt = _tt()
+        old_channel = user.channel_id
+        user.channel_id = 0
+        client = self._client_for(user)
+        if client and kicker_id:
+            kicker = self.users.get(kicker_id)
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_MYSELF_KICKED, old_channel, 'user', self._user_struct(kicker) if kicker else tt.User())
+        self._broadcast(tt.ClientEvent.CLIENTEVENT_CMD_USER_LEFT, old_channel, 'user', self._user_struct(user, channel_id=old_channel))
+
+    def _broadcast(self, event, source, member, value):
+        for client in self.clients.values():
+            if client.user is not None:
+                client.post(event, source, member, value)
+
+    def _deliver_text(self, textmsg):
+        tt = _tt()
+        for client in self.clients.values():
+            if client.user is None: continue
+            if textmsg.nMsgType == tt.TextMsgType.MSGTYPE_USER and client.user.user_id != textmsg.nToUserID: continue
+            if textmsg.nMsgType == tt.TextMsgType.MSGTYPE_CHANNEL and client.user.channel_id != textmsg.nChannelID: continue
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_USER_TEXTMSG, 0, 'textmessage', tt.TextMessage.from_buffer_copy(textmsg))
+
+    def _count_command(self):
+        if not self.commands_limit or not self.commands_interval_msec: return
+        now = time.monotonic()
+        self.command_times.append(now)
+        while self.command_times and now - self.command_times[0] > self.commands_interval_msec / 1000.0:
+            self.command_times.popleft()
+        if len(self.command_times) > self.commands_limit:
+            self.abuse_violations += 1
+
+    def _user_struct(self, user, channel_id=None):
+        struct = _tt().User()
+        struct.nUserID, struct.uUserType = user.user_id, user.user_type
+        struct.szUsername, struct.szNickname = _enc(user.username), _enc(user.nickname)
+        struct.szIPAddress, struct.szClientName = _enc(user.ip_address), _enc(user.client_name)
+        struct.nChannelID = user.channel_id if channel_id is None else channel_id
+        struct.nStatusMode, struct.szStatusMsg = user.status_mode, _enc(user.status_msg)
+        return struct
+
+    def _channel_struct(self, channel):
+        struct = _tt().Channel()
+        struct.nChannelID, struct.nParentID = channel.channel_id, channel.parent_id
+        struct.szName, struct.szTopic = _enc(channel.name), _enc(channel.topic)
+        struct.bPassword = bool(channel.password)
+        return struct
+
+    def channel_path(self, channel_id: int) -> str:
+        with self.lock:
+            names = []
+            channel = self.channels.get(channel_id)
+            if channel is None: return ""
+            while channel and channel.parent_id:
+                names.append(channel.name)
+                channel = self.channels.get(channel.parent_id)
+            return "/" + "".join(name + "/" for name in reversed(names))
+
+    def channel_id_from_path(self, path: str) -> int:
+        with self.lock:
+            channel_id = 1
+            for name in [p for p in path.split('/') if p]:
+                child = next((c for c in self.channels.values() if c.parent_id == channel_id and c.name.lower() == name.lower()), None)
+                if child is None: return 0
+                channel_id = child.channel_id
+            return channel_id
+
+class _FakeFunction:
+    """Callable with writable restype/argtypes, like a ctypes foreign function."""
+    def __init__(self, name, impl):
+        self.__name__, self.impl = name, impl
+        self.restype = self.argtypes = None
+
+    def __call__(self, *args):
+        return self.impl(*args)
+
+class FakeLibrary:
+    """Replaces the ctypes dll object: attribute TT_X is the fake implementation of TT_X."""
+    def __init__(self, server: FakeServer = None):
+        self.server = server or FakeServer()
+        self._handles = itertools.count(1)
+
+    def __getattr__(self, name):
+        if not name.startswith("TT_"): raise AttributeError(name)
+        impl = getattr(self, "_" + name[3:], None)
+        if impl is None:
+            impl = lambda *args: 0
+        func = _FakeFunction(name, impl)
+        setattr(self, name, func)
+        return func
+
+    def _client(self, handle) -> FakeClient:
+        return self.server.clients.get(handle)
+
+    def _command(self, client, ok=True, error=None):
+        """Mimics the async command protocol: returns a command ID, then posts success or an error."""
+        tt = _tt()
+        if client is None or client.user is None: return -1
+        self.server._count_command()
+        cmd_id = next(self.server._cmd_ids)
+        if ok:
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_SUCCESS, cmd_id)
+        else:
+            err = tt.ClientErrorMsg()
+            err.nErrorNo, err.szErrorMsg = error or tt.ClientError.CMDERR_USER_NOT_FOUND, _enc("Command failed")
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_ERROR, cmd_id, 'clienterrormsg', err)
+        return cmd_id
+
+    # --- Instance and connection ---
+    def _GetVersion(self):
+        return _enc(self.server.version)
+
+    def _InitTeamTalkPoll(self):
+        handle = next(self._handles)
+        with self.server.lock:
+            self.server.clients[handle] = FakeClient(handle)
+        return handle
+
+    def _CloseTeamTalk(self, handle):
+        with self.server.lock:
+            client = self.server.clients.get(handle)
+            if client and client.user: self.server.remove_user(client.user.user_id)
+            return self.server.clients.pop(handle, None) is not None
+
+    def _DBG_SIZEOF(self, tttype):
+        tt = _tt()
+        return next((ctypes.sizeof(struct) for struct, t in tt._STRUCT_TTTYPES if t == tttype), 0)
+
+    def _GetErrorMessage(self, code, buf):
+        _arg(buf).value = _enc(f"Fake client error {code}")
+
+    def _GetMessage(self, handle, msg_ref, wait_ref):
+        tt = _tt()
+        client = self._client(handle)
+        if client is None: return False
+        wait_msec = _arg(wait_ref).value if wait_ref is not None else 0
+        with client.ready:
+            if not client.events and wait_msec:
+                client.ready.wait(None if wait_msec < 0 else wait_msec / 1000.0)
+            if not client.events: return False
+            event, source, member, value = client.events.popleft()
+        msg = _arg(msg_ref)
+        msg.nClientEvent, msg.nSource = event, source
+        if member == 'bActive': msg.bActive = value
+        elif member is not None:
+            setattr(msg, member, value)
+            msg.ttType = getattr(tt.TTType, member.upper(), 0)
+        return True
+
+    def _PumpMessage(self, handle, event, identifier):
+        tt = _tt()
+        client = self._client(handle)
+        if client is None or client.user is None or event != tt.ClientEvent.CLIENTEVENT_USER_STATECHANGE: return False
+        with self.server.lock:
+            user = self.server.users.get(identifier)
+            if user is None: return False
+            client.post(event, 0, 'user', self.server._user_struct(user))
+        return True
+
+    def _GetFlags(self, handle):
+        client = self._client(handle)
+        return client.flags if client else 0
+
+    def _Connect(self, handle, host, tcp_port, udp_port, *args):
+        tt = _tt()
+        client = self._client(handle)
+        if client is None: return False
+        if not self.server.accepting_connections:
+            client.post(tt.ClientEvent.CLIENTEVENT_CON_FAILED)
+            return True
+        client.flags |= tt.ClientFlags.CLIENT_CONNECTED
+        client.post(tt.ClientEvent.CLIENTEVENT_CON_SUCCESS)
+        return True
+
+    def _Disconnect(self, handle):
+        client = self._client(handle)
+        if client is None: return False
+        if client.user: self.server.remove_user(client.user.user_id)
+        client.flags = 0
+        return True
+
+    def _DoLoginEx(self, handle, nickname, username, password, client_name):
+        tt = _tt()
+        server = self.server
+        client = self._client(handle)
+        if client is None: return -1
+        with server.lock:
+            if _text(username).lower() in server.banned_usernames:
+                err = tt.ClientErrorMsg()
+                err.nErrorNo, err.szErrorMsg = tt.ClientError.CMDERR_SERVER_BANNED, _enc("Banned from server")
+                cmd_id = next(server._cmd_ids)
+                client.post(tt.ClientEvent.CLIENTEVENT_CMD_ERROR, cmd_id, 'clienterrormsg', err)
+                return cmd_id
+            cmd_id = next(server._cmd_ids)
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_PROCESSING, cmd_id, 'bActive', True)
+            user = FakeUser(next(server._user_ids), _text(nickname), _text(username), client_name=_text(client_name), user_type=tt.UserType.USERTYPE_ADMIN)
+            server.users[user.user_id] = user
+            client.user, client.account_username = user, user.username
+            client.flags |= tt.ClientFlags.CLIENT_AUTHORIZED
+            account = tt.UserAccount()
+            account.szUsername, account.uUserType = _enc(user.username), user.user_type
+            account.uUserRights = self._all_rights()
+            account.abusePrevent.nCommandsLimit = server.commands_limit
+            account.abusePrevent.nCommandsIntervalMSec = server.commands_interval_msec
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_MYSELF_LOGGEDIN, user.user_id, 'useraccount', account)
+            for channel in list(server.channels.values()):
+                client.post(tt.ClientEvent.CLIENTEVENT_CMD_CHANNEL_NEW, 0, 'channel', server._channel_struct(channel))
+            for other in list(server.users.values()):
+                if other is user: continue
+                client.post(tt.ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN, 0, 'user', server._user_struct(other))
+                if other.channel_id:
+                    client.post(tt.ClientEvent.CLIENTEVENT_CMD_USER_JOINED, 0, 'user', server._user_struct(other))
+            server._broadcast(tt.ClientEvent.CLIENTEVENT_CMD_USER_LOGGEDIN, 0, 'user', server._user_struct(user))
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_SUCCESS, cmd_id)
+            client.post(tt.ClientEvent.CLIENTEVENT_CMD_PROCESSING, cmd_id, 'bActive', False)
+            return cmd_id
+
+    def _all_rights(self):
+        rights = 0
+        for name, value in vars(_tt().UserRight).items():
+            if name.startswith('USERRIGHT_') and isinstance(value, int): rights |= value
+        return rights
+
+    def _DoLogout(self, handle):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        cmd_id = self._command(client)
+        self.server.remove_user(client.user.user_id)
+        return cmd_id
+
+    # --- Commands ---
+    def _DoJoinChannelByID(self, handle, channel_id, password):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        channel = self.server.channels.get(channel_id)
+        if channel is None or (channel.password and channel.password != _text(password)):
+            return self._command(client, ok=False, error=_tt().ClientError.CMDERR_CHANNEL_NOT_FOUND if channel is None else _tt().ClientError.CMDERR_INCORRECT_CHANNEL_PASSWORD)
+        cmd_id = self._command(client)
+        self.server.move_user(client.user.user_id, channel_id)
+        return cmd_id
+
+    def _DoLeaveChannel(self, handle):
+        client = self._client(handle)
+        if client is None or client.user is None or not client.user.channel_id: return -1
+        cmd_id = self._command(client)
+        with self.server.lock: self.server._leave(client.user)
+        return cmd_id
+
+    def _DoTextMessage(self, handle, textmsg):
+        client = self._client(handle)
+        if client is None or client.user is None: return 0
+        server = self.server
+        textmsg = _tt().TextMessage.from_buffer_copy(_arg(textmsg))
+        textmsg.nFromUserID = client.user.user_id
+        textmsg.szFromUsername = _enc(client.user.username)
+        with server.lock:
+            server.text_counts[textmsg.nMsgType] += 1
+            server.text_log.append((textmsg.nFromUserID, textmsg.nMsgType, textmsg.nToUserID, textmsg.nChannelID, textmsg.szMessage, bool(textmsg.bMore)))
+            cmd_id = self._command(client)
+            server._deliver_text(textmsg)
+        if server.on_text_message: server.on_text_message(client.user.user_id, textmsg)
+        return cmd_id
+
+    def _DoChangeNickname(self, handle, nickname):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        cmd_id = self._command(client)
+        self.server.update_user(client.user.user_id, nickname=_text(nickname))
+        return cmd_id
+
+    def _DoChangeStatus(self, handle, status_mode, status_msg):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        cmd_id = self._command(client)
+        self.server.update_user(client.user.user_id, status_msg=_text(status_msg), status_mode=status_mode)
+        return cmd_id
+
+    def _DoSubscribe(self, handle, user_id, subscriptions):
+        return self._command(self._client(handle))
+
+    def _DoKickUser(self, handle, user_id, channel_id):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        server = self.server
+        with server.lock:
+            user = server.users.get(user_id)
+            if user is None: return self._command(client, ok=False)
+            cmd_id = self._command(client)
+            if channel_id and user.channel_id == channel_id: server._leave(user, client.user.user_id)
+            elif not channel_id: server.remove_user(user_id)
+            return cmd_id
+
+    def _DoMoveUser(self, handle, user_id, channel_id):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        with self.server.lock:
+            if user_id not in self.server.users or channel_id not in self.server.channels:
+                return self._command(client, ok=False)
+            cmd_id = self._command(client)
+            self.server.move_user(user_id, channel_id)
+            return cmd_id
+
+    def _DoBanUserEx(self, handle, user_id, ban_types):
+        client = self._client(handle)
+        if client is None or client.user is None: return -1
+        with self.server.lock:
+            user = self.server.users.get(user_id)
+            if user is None: return self._command(client, ok=False)
+            self.server.banned_usernames.add(user.username.lower())
+            return self._command(client)
+
+    # --- Queries ---
+    def _GetMyUserID(self, handle):
+        client = self._client(handle)
+        return client.user.user_id if client and client.user else 0
+
+    def _GetServerProperties(self, handle, props):
+        props = _arg(props)
+        props.szServerName, props.szServerVersion = _enc(self.server.name), _enc(self.server.version)
+        return True
+
+    def _GetRootChannelID(self, handle):
+        return 1
+
+    def _GetChannel(self, handle, channel_id, channel):
+        with self.server.lock:
+            found = self.server.channels.get(channel_id)
+            if found is None: return False
+            ctypes.pointer(_arg(channel))[0] = self.server._channel_struct(found)
+            return True
+
+    def _GetChannelPath(self, handle, channel_id, buf):
+        path = self.server.channel_path(channel_id)
+        _arg(buf).value = _enc(path)
+        return bool(path)
+
+    def _GetChannelIDFromPath(self, handle, path):
+        return self.server.channel_id_from_path(_text(path))
+
+    def _GetUser(self, handle, user_id, user):
+        with self.server.lock:
+            found = self.server.users.get(user_id)
+            if found is None: return False
+            ctypes.pointer(_arg(user))[0] = self.server._user_struct(found)
+            return True
+
+    def _GetServerUsers(self, handle, users, count_ref):
+        with self.server.lock:
+            return self._fill_array(users, count_ref, [self.server._user_struct(u) for u in self.server.users.values()])
+
+    def _GetChannelUsers(self, handle, channel_id, users, count_ref):
+        with self.server.lock:
+            return self._fill_array(users, count_ref, [self.server._user_struct(u) for u in self.server.users.values() if u.channel_id == channel_id])
+
+    def _GetServerChannels(self, handle, channels, count_ref):
+        with self.server.lock:
+            return self._fill_array(channels, count_ref, [self.server._channel_struct(c) for c in self.server.channels.values()])
+
+    def _fill_array(self, array, count_ref, items):
+        count = _arg(count_ref)
+        if array is None:
+            count.value = len(items)
+            return True
+        n = min(count.value, len(items))
+        for i in range(n):
+            array[i] = items[i]
+        count.value = n
+        return True
+
+logging.debug("fake_teamtalk backend loaded")
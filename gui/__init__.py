@@ -1 +1 @@
-from . import config_dialog, main_window
+from . import config_dialog, main_window, wx_ui_sink
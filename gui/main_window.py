@@ -1,12 +1,13 @@
 import wx
 from TeamTalk5 import ttstr, UserRight
+from gui.sorted_list import SortedListView
 
 class MainBotWindow(wx.Frame):
     def __init__(self, parent, title, controller):
         super(MainBotWindow, self).__init__(parent, title=title, size=(1024, 768))
         self.controller = controller
-        self.channel_map = {}
-        self.user_map = {}
+        self.channel_map = {}  # channel id -> row shown in channel_list
+        self.user_map = {}  # user id -> row shown in user_list
         self.feature_map = {}
         self.selected_user_id = -1
         self.selected_user_nick = ""
@@ -37,6 +38,10 @@ class MainBotWindow(wx.Frame):
         self.user_list.InsertColumn(1, "Username", width=150)
         self.user_list.SetHelpText("List of users in the bot's current primary channel. Double-click a user for options.")
         left_vbox.Add(self.user_list, 1, wx.EXPAND | wx.ALL, 5)
+        # The bot sends row diffs for both lists; these keep them sorted by name.
+        self.channel_view = SortedListView(self.channel_list, ('path',), lambda chan: chan['name'].lower())
+        self.user_view = SortedListView(self.user_list, ('nick', 'user'), lambda user: user['nick'].lower())
+        self.channel_map, self.user_map = self.channel_view.rows, self.user_view.rows
 
         left_panel.SetSizer(left_vbox)
 
@@ -135,25 +140,28 @@ class MainBotWindow(wx.Frame):
 
     def _update_channel_list_internal(self, channels):
         if not self.channel_list: return
-        self.channel_list.DeleteAllItems()
-        self.channel_map.clear()
-        for idx, chan in enumerate(channels):
-            self.channel_list.InsertItem(idx, chan['path'])
-            self.channel_list.SetItemData(idx, chan['id'])
-            self.channel_map[idx] = chan
+        self.channel_view.replace(channels)
+
+    def apply_channel_list_diff(self, removed, added, changed):
+        wx.CallAfter(self._apply_channel_list_diff_internal, removed, added, changed)
+
+    def _apply_channel_list_diff_internal(self, removed, added, changed):
+        if not self.channel_list: return
+        self.channel_view.apply_diff(removed, added, changed)
 
     def update_user_list(self, users):
         wx.CallAfter(self._update_user_list_internal, users)
 
     def _update_user_list_internal(self, users):
         if not self.user_list: return
-        self.user_list.DeleteAllItems()
-        self.user_map.clear()
-        for idx, user in enumerate(users):
-            self.user_list.InsertItem(idx, user['nick'])
-            self.user_list.SetItem(idx, 1, user['user'])
-            self.user_list.SetItemData(idx, user['id'])
-            self.user_map[idx] = user
+        self.user_view.replace(users)
+
+    def apply_user_list_diff(self, removed, added, changed):
+        wx.CallAfter(self._apply_user_list_diff_internal, removed, added, changed)
+
+    def _apply_user_list_diff_internal(self, removed, added, changed):
+        if not self.user_list: return
+        self.user_view.apply_diff(removed, added, changed)
 
     def update_feature_list(self):
         wx.CallAfter(self._update_feature_list_internal)
@@ -189,7 +197,7 @@ class MainBotWindow(wx.Frame):
     def OnChannelActivate(self, event):
         idx = event.GetIndex()
         channel_id = self.channel_list.GetItemData(idx)
-        channel_path = self.channel_map.get(idx, {}).get('path', 'N/A')
+        channel_path = self.channel_map.get(channel_id, {}).get('path', 'N/A')
         self.log_message(f"[GUI Action] Requesting join to channel '{channel_path}' (ID: {channel_id})")
         
         password = ""
@@ -205,7 +213,7 @@ class MainBotWindow(wx.Frame):
     def OnUserActivate(self, event):
         idx = event.GetIndex()
         self.selected_user_id = self.user_list.GetItemData(idx)
-        self.selected_user_nick = self.user_map.get(idx, {}).get('nick', 'N/A')
+        self.selected_user_nick = self.user_map.get(self.selected_user_id, {}).get('nick', 'N/A')
         self.ShowUserActionMenu()
     
     def ShowUserActionMenu(self):
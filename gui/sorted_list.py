@@ -0,0 +1,49 @@
+from list_diff import SortedRows
+
+class SortedListView:
+    """Keeps a report-style wx.ListCtrl sorted by key(row) and applies row diffs from the bot to it.
+
+    Rows are dicts with an 'id' (stored as item data) and one key per column.
+    Must be used on the GUI thread.
+    """
+    def __init__(self, list_ctrl, columns, key):
+        self.list_ctrl, self.columns = list_ctrl, columns
+        self.order = SortedRows(key)
+        self.rows = {}  # id -> row currently shown
+
+    def replace(self, rows):
+        self.list_ctrl.DeleteAllItems()
+        self.rows.clear(); self.order.clear()
+        for row in rows: self._insert(row)
+
+    def apply_diff(self, removed, added, changed):
+        list_ctrl = self.list_ctrl
+        list_ctrl.Freeze()
+        try:
+            for row_id in removed:
+                idx = self.order.remove(row_id)
+                if idx >= 0: list_ctrl.DeleteItem(idx)
+                self.rows.pop(row_id, None)
+            for row in changed:
+                old_idx = self.order.remove(row['id'])
+                if old_idx < 0: self._insert(row); continue
+                idx = self.order.insert(row)
+                if idx != old_idx:
+                    list_ctrl.DeleteItem(old_idx)
+                    list_ctrl.InsertItem(idx, row[self.columns[0]])
+                    list_ctrl.SetItemData(idx, row['id'])
+                for col, name in enumerate(self.columns): list_ctrl.SetItem(idx, col, row[name])
+                self.rows[row['id']] = row
+            for row in added: self._insert(row)
+        finally:
+            list_ctrl.Thaw()
+
+    def _insert(self, row):
+        if row['id'] in self.rows:  # already shown (e.g. a stale row): replace it
+            idx = self.order.remove(row['id'])
+            if idx >= 0: self.list_ctrl.DeleteItem(idx)
+        idx = self.order.insert(row)
+        self.list_ctrl.InsertItem(idx, row[self.columns[0]])
+        for col, name in enumerate(self.columns[1:], 1): self.list_ctrl.SetItem(idx, col, row[name])
+        self.list_ctrl.SetItemData(idx, row['id'])
+        self.rows[row['id']] = row
@@ -0,0 +1,25 @@
+import wx
+from ui_sink import UISink
+
+class WxUISink(UISink):
+    """Forwards bot notifications to MainBotWindow on the wx main thread."""
+    active = True
+
+    def __init__(self, window):
+        self.window = window
+
+    def log_message(self, message): wx.CallAfter(self.window.log_message, message)
+
+    def session_started(self, title):
+        wx.CallAfter(self.window.Show)
+        wx.CallAfter(self.window.SetTitle, title)
+
+    # MainBotWindow's list updates already hop to the GUI thread themselves.
+    def update_channel_list(self, channels): self.window.update_channel_list(channels)
+    def apply_channel_list_diff(self, removed, added, changed): self.window.apply_channel_list_diff(removed, added, changed)
+    def update_user_list(self, users): self.window.update_user_list(users)
+    def apply_user_list_diff(self, removed, added, changed): self.window.apply_user_list_diff(removed, added, changed)
+    def update_feature_list(self): self.window.update_feature_list()
+    def update_bot_controls_status(self): wx.CallAfter(self.window.update_bot_controls_status)
+
+    def call_on_ui_thread(self, func, *args): wx.CallAfter(func, *args)
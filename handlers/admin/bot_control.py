@@ -1,12 +1,11 @@
 
 import logging
-import wx
 
 def handle_lock(bot, msg_from_id, **kwargs):
     bot.toggle_bot_lock()
     new_state = "ON" if bot.bot_locked else "OFF"
     bot._send_pm(msg_from_id, f"Bot lock is now {new_state}.")
-    if bot.main_window: bot.main_window.update_feature_list()
+    bot.ui.update_feature_list()
 
 def handle_block_command(bot, msg_from_id, args_str, **kwargs):
     cmd_to_toggle = args_str.strip().lower()
@@ -29,11 +28,8 @@ def handle_block_command(bot, msg_from_id, args_str, **kwargs):
 def handle_restart(bot, msg_from_id, **kwargs):
     bot._send_pm(msg_from_id, "Acknowledged. Restarting bot...")
     if bot.controller:
-        # For GUI mode, schedule the restart on the main wx thread to avoid race conditions.
-        if bot.main_window:
-            wx.CallAfter(bot.controller.request_restart)
-        else:
-            bot.controller.request_restart()
+        # In GUI mode this runs on the main wx thread to avoid race conditions.
+        bot.ui.call_on_ui_thread(bot.controller.request_restart)
     else:
         logging.error("Cannot restart: Bot has no controller instance.")
 
@@ -41,10 +37,7 @@ def handle_restart(bot, msg_from_id, **kwargs):
 def handle_quit(bot, msg_from_id, **kwargs):
     bot._send_pm(msg_from_id, "Acknowledged. Quitting...")
     if bot.controller:
-        # For GUI mode, schedule the shutdown on the main wx thread to avoid race conditions.
-        if bot.main_window:
-            wx.CallAfter(bot.controller.request_shutdown)
-        else:
-            bot.controller.request_shutdown()
+        # In GUI mode this runs on the main wx thread to avoid race conditions.
+        bot.ui.call_on_ui_thread(bot.controller.request_shutdown)
     else:
         logging.error("Cannot quit: Bot has no controller instance.")
\ No newline at end of file
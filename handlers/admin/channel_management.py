@@ -7,7 +7,7 @@ def handle_join_channel(bot, msg_from_id, args_str, **kwargs):
 
     parts = args_str.split('|', 1)
     chan_path, chan_pass = ttstr(parts[0].strip()), ttstr(parts[1]) if len(parts) > 1 else ttstr("")
-    chan_id = bot.getChannelIDFromPath(chan_path)
+    chan_id = bot.channel_tree.id_from_path(chan_path)
     
     if chan_id <= 0:
         bot._send_pm(msg_from_id, f"Error: Channel '{chan_path}' not found."); return
@@ -1,6 +1,7 @@
 
 import logging
 from TeamTalk5 import ttstr
+from ..executor import slow_command
 
 def handle_set_channel_path(bot, msg_from_id, args_str, **kwargs):
     """Sets the bot's initial channel path for subsequent logins."""
@@ -35,7 +36,7 @@ def handle_set_gapi(bot, msg_from_id, args_str, **kwargs):
         bot._save_runtime_config(save_gkey=True)
     
     bot._send_pm(msg_from_id, feedback)
-    if bot.main_window: bot.main_window.update_feature_list()
+    bot.ui.update_feature_list()
 
 def handle_set_instruction(bot, msg_from_id, args_str, **kwargs):
     """Handles setting the system instruction for the Gemini model."""
@@ -77,6 +78,7 @@ def handle_set_model(bot, msg_from_id, args_str, **kwargs):
 
     bot._send_pm(msg_from_id, feedback)
 
+@slow_command
 def handle_list_models(bot, msg_from_id, **kwargs):
     """Lists available Gemini models."""
     bot._send_pm(msg_from_id, "Fetching available Gemini models...")
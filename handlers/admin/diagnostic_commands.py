@@ -44,15 +44,18 @@ def handle_health(bot, msg_from_id, **kwargs):
     if bot._in_channel_ids:
         health_report.append(f"Current Channels ({len(bot._in_channel_ids)}):")
         for chan_id in bot._in_channel_ids:
-            try:
-                path = ttstr(bot.getChannelPath(chan_id))
-                health_report.append(f"  - '{path}' (ID: {chan_id})")
-            except Exception:
-                health_report.append(f"  - (Error getting path for ID: {chan_id})")
+            path = bot.channel_tree.path(chan_id)
+            health_report.append(f"  - '{path}' (ID: {chan_id})" if path else f"  - (Unknown path for ID: {chan_id})")
     else:
         health_report.append("Current Channels: None")
     health_report.append(f"Target/Initial Channel: '{ttstr(bot.initial_channel_path)}'")
+    health_report.extend(bot.reconnect_stats.format_lines())
 
+    # --- Event Loop ---
+    health_report.append("\n[Event Loop]")
+    health_report.append(f"Batch Budget: {bot.event_batch_max} events, Wait: {bot.event_wait_msec}ms")
+    health_report.extend(bot.event_batch_stats.format_lines())
+    health_report.extend(bot.background_runner.format_lines() + bot.outbound_queue.format_lines() + bot.services.format_lines())
 
     # --- Bot State ---
     health_report.append(f"\n[Bot State]")
@@ -62,7 +65,7 @@ def handle_health(bot, msg_from_id, **kwargs):
     admin_nicks = []
     for admin_id in bot.admin_user_ids:
         if admin_id in bot._user_cache:
-            admin_nicks.append(ttstr(bot._user_cache[admin_id].szNickname))
+            admin_nicks.append(bot._user_cache[admin_id].nickname)
         else:
             admin_nicks.append(f"UserID_{admin_id} (Not in cache)")
     admin_list_str = ', '.join(sorted(admin_nicks)) or "None"
@@ -108,6 +111,6 @@ def handle_health(bot, msg_from_id, **kwargs):
 
     # Database
     db_status = "Connected" if bot.data_service.is_db_connected() else "Disconnected"
-    health_report.append(f"  - Database ({bot.data_service.db_file}): {db_status}")
+    health_report.append(f"  - Database ({bot.data_service.db_file}): {db_status}, {bot.data_service.pending_count} buffered write(s) pending")
 
     bot._send_pm(msg_from_id, "\n".join(health_report))
\ No newline at end of file
@@ -1,8 +1,16 @@
 from TeamTalk5 import ttstr, UserRight, BanType, BannedUser
 
+def _user_not_found(bot, nick, where="found", channel_id=None):
+    """Error for a nick without an exact match, suggesting (never picking) nicknames that start with or look like it."""
+    users = bot.user_index.candidates(nick)
+    if channel_id is not None: users = [u for u in users if bot.getUser(u.user_id).nChannelID == channel_id]
+    suggestions = list(dict.fromkeys(u.nickname for u in users))[:5]
+    hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+    return f"Error: User '{nick}' not {where}.{hint}"
+
 def handle_list_users(bot, msg_from_id, args_str, **kwargs):
     path_str = args_str.strip() or ttstr(bot.target_channel_path)
-    chan_id = bot.getChannelIDFromPath(ttstr(path_str)) if path_str else bot._target_channel_id
+    chan_id = bot.channel_tree.id_from_path(path_str) if path_str else bot._target_channel_id
     if chan_id <= 0: bot._send_pm(msg_from_id, f"Error: Channel not found."); return
 
     users = sorted(list(bot.getChannelUsers(chan_id) or []), key=lambda u: ttstr(u.szNickname).lower())
@@ -11,9 +19,9 @@ def handle_list_users(bot, msg_from_id, args_str, **kwargs):
     bot._send_pm(msg_from_id, "\n".join(user_list) if users else f"No users found in '{path_str}'.")
 
 def handle_list_channels(bot, msg_from_id, **kwargs):
-    channels = sorted(list(bot.getServerChannels() or []), key=lambda c: ttstr(c.szName).lower())
+    channels = bot.channel_tree.channels_by_name()
     chan_list = ["--- Server Channels ---"]
-    chan_list.extend(f"- {ttstr(c.szName)} (ID:{c.nChannelID}, Path:{ttstr(bot.getChannelPath(c.nChannelID))})" for c in channels)
+    chan_list.extend(f"- {name} (ID:{chan_id}, Path:{path})" for chan_id, name, path in channels)
     bot._send_pm(msg_from_id, "\n".join(chan_list) if channels else "No channels found.")
 
 def handle_move_user(bot, msg_from_id, args_str, **kwargs):
@@ -23,11 +31,11 @@ def handle_move_user(bot, msg_from_id, args_str, **kwargs):
     
     nick, chan_path = parts
     user = bot._find_user_by_nick(nick)
-    if not user: bot._send_pm(msg_from_id, f"Error: User '{nick}' not found."); return
-    chan_id = bot.getChannelIDFromPath(ttstr(chan_path))
+    if not user: bot._send_pm(msg_from_id, _user_not_found(bot, nick)); return
+    chan_id = bot.channel_tree.id_from_path(chan_path)
     if chan_id <= 0: bot._send_pm(msg_from_id, f"Error: Channel '{chan_path}' not found."); return
 
-    bot.doMoveUser(user.nUserID, chan_id)
+    bot.doMoveUser(user.user_id, chan_id)
     bot._send_pm(msg_from_id, f"Move command sent for '{nick}'.")
 
 def handle_kick_user(bot, msg_from_id, args_str, **kwargs):
@@ -35,10 +43,10 @@ def handle_kick_user(bot, msg_from_id, args_str, **kwargs):
     if not bot._in_channel: bot._send_pm(msg_from_id, "Error: Bot not in a channel to kick from."); return
     
     nick = args_str.strip()
-    user = next((u for u in bot.getChannelUsers(bot._target_channel_id) or [] if ttstr(u.szNickname).lower() == nick.lower()), None)
-    if not user: bot._send_pm(msg_from_id, f"Error: User '{nick}' not in my channel."); return
+    user = bot._find_user_by_nick(nick, bot._target_channel_id)
+    if not user: bot._send_pm(msg_from_id, _user_not_found(bot, nick, "in my channel", bot._target_channel_id)); return
 
-    bot.doKickUser(user.nUserID, bot._target_channel_id)
+    bot.doKickUser(user.user_id, bot._target_channel_id)
     bot._send_pm(msg_from_id, f"Kick command sent for '{nick}'.")
 
 def handle_ban_user(bot, msg_from_id, args_str, **kwargs):
@@ -46,10 +54,10 @@ def handle_ban_user(bot, msg_from_id, args_str, **kwargs):
     
     nick = args_str.strip()
     user = bot._find_user_by_nick(nick)
-    if not user: bot._send_pm(msg_from_id, f"Error: User '{nick}' not found."); return
+    if not user: bot._send_pm(msg_from_id, _user_not_found(bot, nick)); return
 
-    bot.doBanUserEx(user.nUserID, BanType.BANTYPE_USERNAME)
-    bot._send_pm(msg_from_id, f"Ban command sent for user '{ttstr(user.szUsername)}'.")
+    bot.doBanUserEx(user.user_id, BanType.BANTYPE_USERNAME)
+    bot._send_pm(msg_from_id, f"Ban command sent for user '{user.username}'.")
 
 def handle_unban_user(bot, msg_from_id, args_str, **kwargs):
     if not (bot.my_rights & UserRight.USERRIGHT_BAN_USERS): bot._send_pm(msg_from_id, "Error: Bot cannot unban users."); return
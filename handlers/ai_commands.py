@@ -1,39 +1,64 @@
 
 import logging
+from .executor import async_variant
 
-def handle_pm_ai(bot, msg_from_id, args_str, **kwargs):
+def _pm_ai_request(bot, msg_from_id, args_str):
+    """Checks a PM AI request and announces it. Returns (prompt, history), or None if it was refused."""
     logging.debug(f"handle_pm_ai called for user_id: {msg_from_id}, prompt: '{args_str}'")
     if not bot.allow_gemini_pm:
         logging.debug(f"Gemini PM disabled for user_id: {msg_from_id}")
-        bot._send_pm(msg_from_id, "[Bot] Gemini AI (PM) is disabled."); return
+        bot._send_pm(msg_from_id, "[Bot] Gemini AI (PM) is disabled."); return None
     if not bot.gemini_service.is_enabled():
         logging.debug(f"Gemini service not enabled for user_id: {msg_from_id}")
-        bot._send_pm(msg_from_id, "[Bot Error] Gemini AI is not available."); return
+        bot._send_pm(msg_from_id, "[Bot Error] Gemini AI is not available."); return None
 
     prompt = args_str.strip()
     if not prompt:
         logging.debug(f"Empty prompt from user_id: {msg_from_id}")
-        bot._send_pm(msg_from_id, "Usage: c <your question>"); return
+        bot._send_pm(msg_from_id, "Usage: c <your question>"); return None
 
     bot._send_pm(msg_from_id, "[Bot] Asking Gemini...")
     history = bot.context_history_manager.get_history(str(msg_from_id))
     logging.debug(f"Retrieved history for user_id {msg_from_id}: {history}")
-    reply = bot.gemini_service.generate_content(prompt, history=history)
+    return prompt, history
+
+def _pm_ai_reply(bot, msg_from_id, reply):
     logging.debug(f"Gemini reply for user_id {msg_from_id}: {reply}")
     bot._send_pm(msg_from_id, reply)
 
-def handle_channel_ai(bot, msg_from_id, sender_nick, channel_id, args_str, **kwargs):
-    if not bot.allow_gemini_channel: return
+def handle_pm_ai(bot, msg_from_id, args_str, **kwargs):
+    request = _pm_ai_request(bot, msg_from_id, args_str)
+    if request: _pm_ai_reply(bot, msg_from_id, bot.gemini_service.generate_content(*request))
+
+@async_variant(handle_pm_ai)
+async def handle_pm_ai_async(bot, msg_from_id, args_str, **kwargs):
+    request = _pm_ai_request(bot, msg_from_id, args_str)
+    if request: _pm_ai_reply(bot, msg_from_id, await bot.gemini_service.generate_content_async(*request))
+
+def _channel_ai_request(bot, sender_nick, channel_id, args_str):
+    """Checks a channel AI request and announces it. Returns (prompt, history), or None if it was refused."""
+    if not bot.allow_gemini_channel: return None
     if not bot.gemini_service.is_enabled():
-        bot._send_channel_message(channel_id, "[Bot Error] Gemini AI is not available."); return
+        bot._send_channel_message(channel_id, "[Bot Error] Gemini AI is not available."); return None
 
     prompt = args_str.strip()
     if not prompt:
-        bot._send_channel_message(channel_id, "Usage: /c <your question>"); return
+        bot._send_channel_message(channel_id, "Usage: /c <your question>"); return None
 
     bot._send_channel_message(channel_id, f"[Bot] Asking Gemini for {sender_nick}...")
     history = bot.context_history_manager.get_history(str(channel_id))
     logging.debug(f"Retrieved history for channel_id {channel_id}: {history}")
-    reply = bot.gemini_service.generate_content(prompt, history=history)
+    return prompt, history
+
+def _channel_ai_reply(bot, sender_nick, channel_id, reply):
     logging.debug(f"Gemini reply for channel_id {channel_id}: {reply}")
     bot._send_channel_message(channel_id, f"Answering {sender_nick}: {reply}")
+
+def handle_channel_ai(bot, msg_from_id, sender_nick, channel_id, args_str, **kwargs):
+    request = _channel_ai_request(bot, sender_nick, channel_id, args_str)
+    if request: _channel_ai_reply(bot, sender_nick, channel_id, bot.gemini_service.generate_content(*request))
+
+@async_variant(handle_channel_ai)
+async def handle_channel_ai_async(bot, msg_from_id, sender_nick, channel_id, args_str, **kwargs):
+    request = _channel_ai_request(bot, sender_nick, channel_id, args_str)
+    if request: _channel_ai_reply(bot, sender_nick, channel_id, await bot.gemini_service.generate_content_async(*request))
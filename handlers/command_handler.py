@@ -1,10 +1,10 @@
 
 import logging
-import re
 from TeamTalk5 import TextMsgType, ttstr, UserRight
 from datetime import datetime
 from utils import format_uptime
 
+from .executor import is_slow, call_blocking, call_async
 from . import user_commands, ai_commands, poll_commands, communication_commands, utility_commands
 from .admin import bot_control, config_management, feature_toggles, user_management, channel_management
 
@@ -27,11 +27,15 @@ def handle_message(bot, textmessage, full_message_text):
     msg_channel_id = textmessage.nChannelID
     
     sender_nick = f"UserID_{msg_from_id}"
-    try:
-        sender_user = bot.getUser(msg_from_id)
-        if sender_user and sender_user.nUserID == msg_from_id:
-            sender_nick = ttstr(sender_user.szNickname)
-    except Exception: pass
+    cached_sender = bot._user_cache.get(msg_from_id)
+    if cached_sender:
+        sender_nick = cached_sender.nickname
+    else:
+        try:
+            sender_user = bot.getUser(msg_from_id)
+            if sender_user and sender_user.nUserID == msg_from_id:
+                sender_nick = ttstr(sender_user.szNickname)
+        except Exception: pass
 
     # --- Last Seen and AFK Handling ---
     action_text = ""
@@ -111,17 +115,38 @@ def log_and_process(bot, msg_type, msg_from_id, msg_channel_id, sender_nick, ful
             logging.warning(f"Unauthorized admin command '{command_word}' by {sender_nick}.")
             return
         
-        try:
-            handler_func(bot=bot, msg_from_id=msg_from_id, args_str=args_str, channel_id=msg_channel_id, sender_nick=sender_nick, command=command_word, msg_type=msg_type)
-        except Exception as e:
-            logging.error(f"Error executing command '{command_word}': {e}", exc_info=True)
-            bot._send_pm(msg_from_id, f"An unexpected error occurred executing '{command_word}'.")
+        handler_kwargs = dict(bot=bot, msg_from_id=msg_from_id, args_str=args_str, channel_id=msg_channel_id, sender_nick=sender_nick, command=command_word, msg_type=msg_type)
+        if is_slow(handler_func):
+            # Network-bound and async handlers run in the background, serialized per user;
+            # replies are marshalled back to the event thread by bot._send_text_message.
+            job = execute_handler_async if bot.async_runtime else execute_handler
+            if not bot.run_background(msg_from_id, job, handler_func, handler_kwargs):
+                logging.warning(f"Handler pool saturated, rejecting '{command_word}' from {sender_nick}.")
+                bot._send_pm(msg_from_id, f"The bot is busy, please try '{command_word}' again in a moment.")
+            return
+        execute_handler(handler_func, handler_kwargs)
+
+def execute_handler(handler_func, handler_kwargs):
+    try:
+        call_blocking(handler_func, **handler_kwargs)
+    except Exception as e:
+        _report_handler_error(handler_kwargs, e)
+
+async def execute_handler_async(handler_func, handler_kwargs):
+    try:
+        await call_async(handler_func, **handler_kwargs)
+    except Exception as e:
+        _report_handler_error(handler_kwargs, e)
+
+def _report_handler_error(handler_kwargs, e):
+    command_word = handler_kwargs['command']
+    logging.error(f"Error executing command '{command_word}': {e}", exc_info=True)
+    handler_kwargs['bot']._send_pm(handler_kwargs['msg_from_id'], f"An unexpected error occurred executing '{command_word}'.")
 
 def check_word_filter(bot, user_id, channel_id, user_nick, message):
     if not bot.filter_enabled or not bot.filtered_words: return False
     
-    msg_lower = message.lower()
-    found_bad_word = next((word for word in bot.filtered_words if re.search(r'\b' + re.escape(word) + r'\b', msg_lower, re.IGNORECASE)), None)
+    found_bad_word = bot.filtered_words.find(message)
     
     if found_bad_word:
         bot.warning_counts[user_id] = bot.warning_counts.get(user_id, 0) + 1
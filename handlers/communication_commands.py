@@ -1,18 +1,24 @@
 import logging
 from TeamTalk5 import ttstr, TextMsgType
+from .executor import async_variant
 
-def handle_weather(bot, msg_from_id, channel_id, args_str, msg_type, **kwargs):
-    location = args_str.strip()
-    if not location:
-        reply = "Usage: w <location> OR /w <location>"
-    else:
-        reply = bot.weather_service.get_weather(location)
-    
+def _weather_reply(bot, msg_from_id, channel_id, msg_type, reply):
     if msg_type == TextMsgType.MSGTYPE_USER: # PM command
         bot._send_pm(msg_from_id, reply)
     else: # Channel command
         bot._send_channel_message(channel_id, reply)
 
+def handle_weather(bot, msg_from_id, channel_id, args_str, msg_type, **kwargs):
+    location = args_str.strip()
+    reply = bot.weather_service.get_weather(location) if location else "Usage: w <location> OR /w <location>"
+    _weather_reply(bot, msg_from_id, channel_id, msg_type, reply)
+
+@async_variant(handle_weather)
+async def handle_weather_async(bot, msg_from_id, channel_id, args_str, msg_type, **kwargs):
+    location = args_str.strip()
+    reply = await bot.weather_service.get_weather_async(location) if location else "Usage: w <location> OR /w <location>"
+    _weather_reply(bot, msg_from_id, channel_id, msg_type, reply)
+
 def handle_channel_text(bot, msg_from_id, sender_nick, args_str, **kwargs):
     if not bot._in_channel:
         bot._send_pm(msg_from_id, "Error: Bot is not in a channel."); return
@@ -20,7 +26,7 @@ def handle_channel_text(bot, msg_from_id, sender_nick, args_str, **kwargs):
         bot._send_pm(msg_from_id, "Usage: ct <message>"); return
 
     if bot._send_channel_message(bot._target_channel_id, f"<{sender_nick}> {args_str}"):
-        bot._send_pm(msg_from_id, "Message sent to channel.")
+        bot._send_pm(msg_from_id, "Message queued for the channel.")
     else:
         bot._send_pm(msg_from_id, "Failed to send message (check rights/lock status).")
 
@@ -28,6 +34,6 @@ def handle_broadcast_message(bot, msg_from_id, args_str, **kwargs):
     if not args_str:
         bot._send_pm(msg_from_id, "Usage: bm <message>"); return
     if bot._send_broadcast(ttstr(args_str)):
-        bot._send_pm(msg_from_id, "Broadcast sent.")
+        bot._send_pm(msg_from_id, "Broadcast queued.")
     else:
         bot._send_pm(msg_from_id, "Failed to send broadcast (check rights/lock status).")
\ No newline at end of file
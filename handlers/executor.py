@@ -0,0 +1,119 @@
+import asyncio
+import collections
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import RollingStats
+
+def slow_command(func):
+    """Marks a command handler as blocking (network I/O) so it runs on the handler pool."""
+    func.is_slow = True
+    return func
+
+def async_variant(sync_func):
+    """Decorates the async def version of the slow handler sync_func; AsyncBotRuntime awaits it instead.
+
+    The threaded runtime keeps calling sync_func (the services' blocking methods) on a
+    worker thread: a throwaway event loop per call would rebuild aiohttp sessions and
+    break clients bound to the first loop they ran on, like Gemini's async client.
+    """
+    def attach(async_func):
+        sync_func.is_slow = True
+        sync_func.async_variant = async_func
+        return async_func
+    return attach
+
+def is_slow(func):
+    """Slow handlers, and every async def handler, run off the event thread."""
+    return getattr(func, 'is_slow', False) or inspect.iscoroutinefunction(func)
+
+def call_blocking(func, *args, **kwargs):
+    """Runs func to completion on the calling thread.
+
+    An async def without a sync version gets its own event loop here, so it must not
+    rely on loop-bound clients; handlers using services should use @async_variant.
+    """
+    if inspect.iscoroutinefunction(func):
+        return asyncio.run(func(*args, **kwargs))
+    return func(*args, **kwargs)
+
+async def call_async(func, *args, **kwargs):
+    """Awaits async def functions (or func's @async_variant) directly and runs plain ones on a worker thread."""
+    func = getattr(func, 'async_variant', func)
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+class HandlerExecutor:
+    """Bounded worker pool for slow handlers.
+
+    Jobs submitted with the same key (the requesting user) run one at a time in
+    submission order; different keys run in parallel up to max_workers.
+    """
+    def __init__(self, max_workers: int = 4, max_pending: int = 50):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="HandlerWorker")
+        self._queues = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+        self.run_times = RollingStats()
+        self.wait_times = RollingStats()
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def submit(self, key, func, *args, **kwargs) -> bool:
+        """Queues func(*args, **kwargs) behind earlier jobs for key. Returns False if the pool is saturated."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                return False
+            self._pending += 1
+            job = (time.perf_counter(), func, args, kwargs)
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(job); return True
+            self._queues[key] = collections.deque([job])
+        try:
+            self._pool.submit(self._drain, key)
+        except RuntimeError:
+            # Pool already shut down; drop the job.
+            with self._lock:
+                self._queues.pop(key, None); self._pending -= 1
+            return False
+        return True
+
+    def _drain(self, key):
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]; return
+                queued_at, func, args, kwargs = queue[0]
+            started = time.perf_counter()
+            self.wait_times.add(started - queued_at)
+            try:
+                call_blocking(func, *args, **kwargs)
+            except Exception as e:
+                logging.error(f"Error in background handler {getattr(func, '__name__', func)}: {e}", exc_info=True)
+            finally:
+                self.run_times.add(time.perf_counter() - started)
+                with self._lock:
+                    queue.popleft(); self._pending -= 1
+
+    def shutdown(self, wait: bool = False):
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def format_lines(self) -> list[str]:
+        runs, waits = self.run_times.summary(), self.wait_times.summary()
+        return [
+            f"Handler Pool: {self.max_workers} workers, {self._pending}/{self.max_pending} pending, {self.rejected} rejected",
+            f"  - Run: {runs['count']} jobs, avg {runs['avg'] * 1000:.0f}ms, p95 {runs['p95'] * 1000:.0f}ms, max {runs['max'] * 1000:.0f}ms",
+            f"  - Queue Wait: avg {waits['avg'] * 1000:.0f}ms, p95 {waits['p95'] * 1000:.0f}ms",
+        ]
@@ -1,4 +1,5 @@
 from TeamTalk5 import TextMsgType
+from .executor import async_variant
 
 def handle_time(bot, msg_from_id, channel_id, args_str, msg_type, **kwargs):
     """Handles the !time command to get the current time for a location."""
@@ -16,20 +17,27 @@ def handle_time(bot, msg_from_id, channel_id, args_str, msg_type, **kwargs):
 def handle_news(bot, msg_from_id, args_str, **kwargs):
     """Handles the news command to fetch top headlines."""
     topic = args_str.strip() if args_str.strip() else "top"
-    reply = bot.news_service.get_news(topic)
-    bot._send_pm(msg_from_id, reply)
+    bot._send_pm(msg_from_id, bot.news_service.get_news(topic))
+
+@async_variant(handle_news)
+async def handle_news_async(bot, msg_from_id, args_str, **kwargs):
+    topic = args_str.strip() if args_str.strip() else "top"
+    bot._send_pm(msg_from_id, await bot.news_service.get_news_async(topic))
 
 def handle_shorten_url(bot, msg_from_id, args_str, **kwargs):
     """Handles the shorten command to shorten a URL."""
     url = args_str.strip()
-    if not url:
-        reply = "Usage: shorten <long_url>"
-    else:
-        reply = bot.url_shortener_service.shorten_url(url)
+    reply = bot.url_shortener_service.shorten_url(url) if url else "Usage: shorten <long_url>"
+    bot._send_pm(msg_from_id, reply)
+
+@async_variant(handle_shorten_url)
+async def handle_shorten_url_async(bot, msg_from_id, args_str, **kwargs):
+    url = args_str.strip()
+    reply = await bot.url_shortener_service.shorten_url_async(url) if url else "Usage: shorten <long_url>"
     bot._send_pm(msg_from_id, reply)
 
 def handle_remind_me(bot, msg_from_id, args_str, **kwargs):
     """Handles the remindme command to set a reminder."""
     reminder_text = args_str.strip()
-    reply = bot.reminder_service.parse_and_add_reminder(msg_from_id, reminder_text)
+    reply = bot.reminder_service.parse_and_add_reminder(msg_from_id, reminder_text, bot)
     bot._send_pm(msg_from_id, reply)
\ No newline at end of file
@@ -0,0 +1,44 @@
+import bisect
+
+def diff_rows(old: dict, new: dict):
+    """Row changes turning old into new (both id -> row dict): (removed ids, added rows, changed rows)."""
+    removed = [row_id for row_id in old if row_id not in new]
+    added, changed = [], []
+    for row_id, row in new.items():
+        previous = old.get(row_id)
+        if previous is None: added.append(row)
+        elif previous != row: changed.append(row)
+    return removed, added, changed
+
+class SortedRows:
+    """Positions of the rows of a list control kept sorted by key(row).
+
+    Lets a diff be applied as single-row inserts and deletes instead of
+    rebuilding the control. Rows are dicts with an 'id'; equal keys are
+    ordered by id.
+    """
+    def __init__(self, key):
+        self.key = key
+        self._order = []   # sorted (key, id)
+        self._keys = {}    # id -> (key, id)
+
+    def __len__(self):
+        return len(self._order)
+
+    def clear(self):
+        self._order.clear(); self._keys.clear()
+
+    def insert(self, row) -> int:
+        """Adds row and returns the index it goes to."""
+        sort_key = self._keys[row['id']] = (self.key(row), row['id'])
+        index = bisect.bisect_left(self._order, sort_key)
+        self._order.insert(index, sort_key)
+        return index
+
+    def remove(self, row_id) -> int:
+        """Drops the row and returns the index it had, or -1 if it wasn't there."""
+        sort_key = self._keys.pop(row_id, None)
+        if sort_key is None: return -1
+        index = bisect.bisect_left(self._order, sort_key)
+        del self._order[index]
+        return index
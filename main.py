@@ -4,13 +4,14 @@ import sys, threading, signal, logging, argparse, time, json, codecs
 from logging.handlers import RotatingFileHandler
 from config_manager import load_config, save_config, DEFAULT_CONFIG
 from bot import MyTeamTalkBot, TeamTalkError
+from service_registry import ServiceRegistry
 from TeamTalk5 import ttstr
 
 # This is the server-optimized entry point.
 # For GUI, run main_gui.py
 
-def setup_logging():
-    log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+def setup_logging(log_format='%(asctime)s - %(levelname)s - %(message)s'):
+    log_formatter = logging.Formatter(log_format)
     log_file = 'bot.log'
     # File handler should always use UTF-8
     file_handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=2, encoding='utf-8')
@@ -102,6 +103,8 @@ help                - Show this help message.""")
             print(f"{short_name:<15} | {full_name:<25} | {status}")
         print(f"Context Retention: {bot.context_history_manager.retention_minutes} minutes")
         print(f"Gemini Model:      {bot.gemini_service.model_name}")
+        for line in bot.reconnect_stats.format_lines() + bot.event_batch_stats.format_lines() + bot.background_runner.format_lines() + bot.outbound_queue.format_lines() + bot.services.format_lines():
+            print(line)
         print()
 
     def toggle_feature(self, args):
@@ -171,6 +174,11 @@ class ApplicationController:
         self.main_gui_window = None
         self.exit_event = threading.Event()
         self.restart_requested = threading.Event()
+        # Services (database, Gemini, conversation history, reminders) live as long as the controller;
+        # a bot restart only replaces the TeamTalk connection and per-session state. Under the asyncio
+        # runtime every session runs a new event loop, so these services must not keep loop-bound
+        # clients (GeminiService runs its async calls in a thread; async_http keeps one session per loop).
+        self.services = ServiceRegistry()
 
     def start(self):
         # Try to load config first.
@@ -302,9 +310,10 @@ class ApplicationController:
 
     def _bot_thread_func(self):
         try:
-            self.bot_instance = MyTeamTalkBot(self.config, self)
+            self.bot_instance = MyTeamTalkBot(self.config, self, self.services)
             if not self.nogui:
-                self.bot_instance.set_main_window(self.main_gui_window)
+                from gui.wx_ui_sink import WxUISink
+                self.bot_instance.set_ui(WxUISink(self.main_gui_window))
             self.bot_instance.start() # This is a blocking call that runs the bot's main loop
         except Exception as e:
             logging.critical(f"Bot thread failed with unhandled exception: {e}", exc_info=True)
@@ -372,6 +381,7 @@ class ApplicationController:
         if self.bot_thread and self.bot_thread.is_alive():
             logging.info("Waiting for bot thread to terminate...")
             self.bot_thread.join(5.0)
+        self.services.close()
         
         if not self.nogui and self.app_instance:
             # If we're in GUI mode, ensure the main loop exits.
@@ -380,12 +390,16 @@ class ApplicationController:
 
         logging.info("Cleanup complete. Exiting.")
 
+    def save_session_config(self, config):
+        """Called by the bot to persist settings changed at runtime."""
+        save_config(config)
+
     # --- New methods to bridge GUI actions to the bot ---
 
     def join_channel(self, channel_id, password):
         if self.bot_instance and self.bot_instance._logged_in:
             self.bot_instance._target_channel_id = channel_id
-            self.bot_instance.target_channel_path = ttstr(self.bot_instance.getChannelPath(channel_id))
+            self.bot_instance.target_channel_path = ttstr(self.bot_instance.channel_tree.path(channel_id))
             self.bot_instance.doJoinChannelByID(channel_id, ttstr(password))
         else:
             logging.warning("GUI: Cannot join channel, bot is not connected.")
@@ -0,0 +1,74 @@
+import collections
+import math
+
+class RollingStats:
+    """Keeps the most recent samples of a measurement for summary reporting."""
+    def __init__(self, window: int = 1000):
+        self.samples = collections.deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.max: self.max = value
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples: return 0.0
+        ordered = sorted(self.samples)
+        idx = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[idx]
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max,
+        }
+
+class EventBatchStats:
+    """Size and processing time of each batch drained from the TeamTalk event queue."""
+    def __init__(self, window: int = 1000):
+        self.sizes = RollingStats(window)
+        self.durations = RollingStats(window)
+        self.budget_hits = 0
+
+    def record(self, size: int, seconds: float, budget_exhausted: bool = False):
+        self.sizes.add(size)
+        self.durations.add(seconds)
+        if budget_exhausted: self.budget_hits += 1
+
+    def format_lines(self) -> list[str]:
+        sizes, times = self.sizes.summary(), self.durations.summary()
+        if not sizes['count']:
+            return ["Event Batches: none yet"]
+        return [
+            f"Event Batches: {sizes['count']} ({int(self.sizes.total)} events, budget reached {self.budget_hits}x)",
+            f"  - Size: avg {sizes['avg']:.1f}, p95 {sizes['p95']:.0f}, max {sizes['max']:.0f}",
+            f"  - Time: avg {times['avg'] * 1000:.2f}ms, p95 {times['p95'] * 1000:.2f}ms, max {times['max'] * 1000:.2f}ms",
+        ]
+
+class ReconnectStats:
+    """Connection losses and how long each took to recover from (loss until logged in again)."""
+    def __init__(self, window: int = 100):
+        self.downtimes = RollingStats(window)
+        self.attempts = RollingStats(window)
+        self.losses = 0
+
+    def record(self, seconds: float, attempts: int):
+        self.downtimes.add(seconds)
+        self.attempts.add(attempts)
+
+    def format_lines(self) -> list[str]:
+        if not self.losses:
+            return ["Reconnects: none"]
+        downtimes, attempts = self.downtimes.summary(), self.attempts.summary()
+        return [
+            f"Reconnects: {self.losses} connection losses, {downtimes['count']} recovered",
+            f"  - Time to reconnect: avg {downtimes['avg']:.1f}s, p95 {downtimes['p95']:.1f}s, max {downtimes['max']:.1f}s",
+            f"  - Attempts: avg {attempts['avg']:.1f}, max {attempts['max']:.0f}",
+        ]
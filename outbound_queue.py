@@ -0,0 +1,125 @@
+import collections
+import itertools
+import logging
+import time
+
+from metrics import RollingStats
+
+class QueuedMessage:
+    __slots__ = ('msg_type', 'to_user_id', 'channel_id', 'chunks', 'sent', 'queued_at', 'seq')
+
+    def __init__(self, msg_type, to_user_id, channel_id, chunks, seq=0):
+        self.msg_type, self.to_user_id, self.channel_id = msg_type, to_user_id, channel_id
+        self.chunks, self.sent, self.queued_at, self.seq = chunks, 0, time.monotonic(), seq
+
+    @property
+    def key(self):
+        return (self.msg_type, self.to_user_id, self.channel_id)
+
+class OutboundQueue:
+    """Token-bucket limited queue for outgoing text messages.
+
+    The bucket is sized from the server's abuse prevention settings
+    (nCommandsLimit commands per nCommandsIntervalMSec), scaled by `headroom`
+    so other commands the bot sends still fit. Single-chunk replies go ahead of
+    multi-chunk (bulk) output to other targets, but never ahead of a bulk
+    message queued earlier for the same target: messages to one target keep
+    their order, and the receiver joins a bulk message's chunks by sender and type.
+    Only touched from the TeamTalk event thread.
+    """
+    def __init__(self, send_chunk, headroom: float = 0.8):
+        self.send_chunk = send_chunk
+        self.headroom = headroom
+        self.rate = 0.0  # tokens per second, 0 = unlimited
+        self.capacity = 0.0
+        self.tokens = 0.0
+        self._last_refill = time.monotonic()
+        self._high = collections.deque()
+        self._low = collections.deque()
+        self._bulk = None
+        self._bulk_seqs = {}  # key -> deque of seq of the bulk messages queued for it, oldest first
+        self._seq = itertools.count()
+        self.depth = 0
+        self.max_depth = 0
+        self.sent_count = 0
+        self.failed_count = 0
+        self.wait_times = RollingStats()
+
+    def configure(self, commands_limit: int, interval_msec: int):
+        if commands_limit <= 0 or interval_msec <= 0:
+            self.rate = self.capacity = 0.0
+            logging.info("Outbound queue: server has no command limit, sending unthrottled.")
+            return
+        self.capacity = max(1.0, float(int(commands_limit * self.headroom)))
+        self.rate = self.capacity / (interval_msec / 1000.0)
+        self.tokens, self._last_refill = self.capacity, time.monotonic()
+        logging.info(f"Outbound queue: server allows {commands_limit} commands per {interval_msec}ms, sending at most {self.capacity:.0f} per interval.")
+
+    def enqueue(self, msg_type, to_user_id, channel_id, chunks):
+        if not chunks: return
+        msg = QueuedMessage(msg_type, to_user_id, channel_id, chunks, next(self._seq))
+        if len(chunks) == 1: self._high.append(msg)
+        else:
+            self._low.append(msg)
+            self._bulk_seqs.setdefault(msg.key, collections.deque()).append(msg.seq)
+        self.depth += len(chunks)
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def clear(self):
+        self._high.clear(); self._low.clear(); self._bulk = None; self._bulk_seqs.clear(); self.depth = 0
+
+    def pump(self):
+        """Sends queued chunks while tokens are available."""
+        if not self.depth: return
+        if self.rate: self._refill()
+        while self.depth and (not self.rate or self.tokens >= 1.0):
+            msg = self._next_message()
+            if msg is None: break
+            chunk_index = msg.sent
+            msg.sent += 1
+            self.depth -= 1
+            if self.rate: self.tokens -= 1.0
+            if self.send_chunk(msg, chunk_index): self.sent_count += 1
+            else: self.failed_count += 1
+            if msg.sent == len(msg.chunks):
+                self.wait_times.add(time.monotonic() - msg.queued_at)
+                if msg is self._bulk: self._bulk_done()
+
+    def next_send_delay(self):
+        """Seconds until the next chunk can go out, or None when the queue is empty."""
+        if not self.depth: return None
+        if not self.rate: return 0.0
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _bulk_done(self):
+        seqs = self._bulk_seqs[self._bulk.key]
+        seqs.popleft()
+        if not seqs: del self._bulk_seqs[self._bulk.key]
+        self._bulk = None
+
+    def _next_message(self):
+        for i, msg in enumerate(self._high):
+            earlier_bulk = self._bulk_seqs.get(msg.key)
+            if not earlier_bulk or earlier_bulk[0] > msg.seq:
+                del self._high[i]
+                return msg
+        if self._bulk is None and self._low:
+            self._bulk = self._low.popleft()
+        if self._bulk is not None:
+            return self._bulk
+        return None
+
+    def format_lines(self) -> list[str]:
+        waits = self.wait_times.summary()
+        limit = f"{self.rate:.1f} msg/s, burst {self.capacity:.0f}" if self.rate else "unlimited"
+        return [
+            f"Outbound Queue: {self.depth} pending (max {self.max_depth}), rate {limit}",
+            f"  - Sent: {self.sent_count} chunks, {self.failed_count} failed",
+            f"  - Wait: avg {waits['avg'] * 1000:.0f}ms, p95 {waits['p95'] * 1000:.0f}ms, max {waits['max'] * 1000:.0f}ms",
+        ]
@@ -0,0 +1,72 @@
+import logging
+import threading
+import time
+
+class ServiceRegistry:
+    """Creates each service on first use.
+
+    Factories run at most once, on whichever thread asks first, so heavy
+    optional imports (google.generativeai, apscheduler, requests, pytz) and
+    their memory are only paid for by features that actually get used.
+    A registry can outlive the bot that filled it: the controller keeps one
+    across bot sessions, and each new bot re-registers its factories for the
+    services that haven't been created yet. The names in `shared` are looked
+    up in `parent` instead, so several registries (one per server in
+    supervisor.py) use one instance of them. Their factories are registered
+    once, on the parent, by its owner; close() leaves those to the parent.
+    """
+    def __init__(self, parent=None, shared=()):
+        self._factories = {}
+        self._instances = {}
+        self._lock = threading.Lock()
+        self.build_times = {}
+        self.parent, self.shared = parent, frozenset(shared) if parent else frozenset()
+
+    def register(self, name: str, factory):
+        self._factories[name] = factory
+
+    def get(self, name: str):
+        if name in self.shared: return self.parent.get(name)
+        service = self._instances.get(name)
+        if service is not None: return service
+        with self._lock:
+            service = self._instances.get(name)
+            if service is None:
+                started = time.perf_counter()
+                service = self._instances[name] = self._factories[name]()
+                self.build_times[name] = time.perf_counter() - started
+                logging.debug(f"Service '{name}' created in {self.build_times[name] * 1000:.1f}ms")
+        return service
+
+    def peek(self, name: str):
+        """Returns the service if it has been created, without creating it."""
+        if name in self.shared: return self.parent.peek(name)
+        return self._instances.get(name)
+
+    def close(self):
+        """Shuts down the created services (their shutdown() or close()), newest first."""
+        with self._lock:
+            for name, service in reversed(list(self._instances.items())):
+                closer = getattr(service, 'shutdown', None) or getattr(service, 'close', None)
+                if closer is None: continue
+                try: closer()
+                except Exception as e: logging.error(f"Error closing service '{name}': {e}", exc_info=True)
+            self._instances.clear(); self.build_times.clear()
+
+    def format_lines(self) -> list[str]:
+        loaded = ", ".join(f"{name} ({self.build_times[name] * 1000:.0f}ms)" for name in self._instances) or "none"
+        idle = ", ".join(name for name in self._factories if name not in self._instances) or "none"
+        lines = [f"Services: loaded {loaded}", f"  - Not loaded: {idle}"]
+        if self.shared:
+            shared = ", ".join(f"{name} ({'loaded' if self.parent.peek(name) else 'not loaded'})" for name in sorted(self.shared))
+            lines.append(f"  - Shared with other servers: {shared}")
+        return lines
+
+class lazy_service:
+    """Class attribute that returns the owner's `services` entry of the same name."""
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None: return self
+        return obj.services.get(self.name)
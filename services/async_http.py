@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import threading
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+class RequestTimeout(Exception):
+    pass
+
+class RequestFailed(Exception):
+    pass
+
+# One pooled requests.Session for the blocking calls of every service and every bot in the
+# process (supervisor.py runs several); requests.get would open a new connection each time.
+_requests_session = None
+_requests_session_lock = threading.Lock()
+
+def requests_session():
+    """The process-wide requests.Session. Only call when 'requests' is installed."""
+    global _requests_session
+    if _requests_session is None:
+        with _requests_session_lock:
+            if _requests_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+                session.mount("http://", adapter); session.mount("https://", adapter)
+                _requests_session = session
+    return _requests_session
+
+# Shared session per bot asyncio runtime loop (see async_runtime.py); a session's
+# connection pool is bound to its loop, so each bot session under supervisor.py has its own.
+# Coroutines running on any other loop get a one-off session per request.
+_sessions = {}  # loop -> aiohttp.ClientSession
+
+async def open_session():
+    if not AIOHTTP_AVAILABLE:
+        logging.warning("aiohttp not found; async HTTP calls will run on worker threads via 'requests'.")
+        return
+    _sessions[asyncio.get_running_loop()] = aiohttp.ClientSession()
+
+async def close_session():
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+async def get(url: str, params: dict = None, timeout: float = 10) -> tuple[int, str]:
+    """GET a URL without blocking the event loop. Returns (status, body text)."""
+    if AIOHTTP_AVAILABLE:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        try:
+            session = _sessions.get(asyncio.get_running_loop())
+            if session is not None:
+                async with session.get(url, params=params, timeout=client_timeout) as response:
+                    return response.status, await response.text()
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, params=params, timeout=client_timeout) as response:
+                    return response.status, await response.text()
+        except asyncio.TimeoutError as e:
+            raise RequestTimeout(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise RequestFailed(str(e)) from e
+    if not REQUESTS_AVAILABLE:
+        raise RequestFailed("no HTTP library available")
+    try:
+        response = await asyncio.to_thread(requests_session().get, url, params=params, timeout=timeout)
+        return response.status_code, response.text
+    except requests.exceptions.Timeout as e:
+        raise RequestTimeout(str(e)) from e
+    except requests.exceptions.RequestException as e:
+        raise RequestFailed(str(e)) from e
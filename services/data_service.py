@@ -2,13 +2,40 @@
 import sqlite3
 import datetime
 import logging
+import threading
 from threading import Lock
 
+_UPSERT_LAST_SEEN = '''
+    INSERT INTO last_seen (user_id, nick, timestamp, action)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+    nick=excluded.nick, timestamp=excluded.timestamp, action=excluded.action
+'''
+_UPSERT_AFK = '''
+    INSERT INTO afk_status (user_id, nick, reason, timestamp)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+    nick=excluded.nick, reason=excluded.reason, timestamp=excluded.timestamp
+'''
+
 class DataService:
-    def __init__(self, db_file):
+    def __init__(self, db_file, flush_interval: float = 2.0, flush_max: int = 500):
         self.db_file = db_file
         self.conn = None
         self.lock = Lock()
+        # last_seen and afk_status changes are write-behind: the latest one per user waits here and
+        # a flusher thread writes them in one transaction every flush_interval seconds, or once
+        # flush_max users are pending. Lock order is self.lock, then _pending_lock.
+        self.flush_interval, self.flush_max = flush_interval, flush_max
+        self._pending_seen = {}  # user_id -> (nick, timestamp, action)
+        self._pending_afk = {}  # user_id -> (nick, reason, timestamp), or None to delete
+        # The whole afk_status table, so checking a message's sender/recipient needs no SQL.
+        self._afk = {}  # user_id -> {'nick', 'reason', 'timestamp'}
+        self._pending_lock = Lock()
+        self._flush_wake = threading.Event()
+        self._flusher = None
+        self._closed = False
+        self.flush_count = self.flushed_rows = 0
         try:
             # `check_same_thread=False` is safe here because we use our own lock
             self.conn = sqlite3.connect(db_file, check_same_thread=False)
@@ -40,38 +67,81 @@ class DataService:
                 )
             ''')
             self.conn.commit()
+            cursor.execute("SELECT user_id, nick, reason, timestamp FROM afk_status")
+            self._afk = {row[0]: {'nick': row[1], 'reason': row[2], 'timestamp': row[3]} for row in cursor}
             logging.info(f"Database '{self.db_file}' initialized successfully.")
 
     def close(self):
+        self._closed = True
+        if self._flusher:
+            self._flush_wake.set(); self._flusher.join(5)
+        self.flush()
         if self.conn:
-            self.conn.close()
+            self.conn.close(); self.conn = None
             logging.info("Database connection closed.")
 
     def update_last_seen(self, user_id: int, nick: str, action: str):
         if not self.conn: return
         timestamp = datetime.datetime.now().isoformat()
+        with self._pending_lock:
+            self._pending_seen[user_id] = (nick, timestamp, action)
+            self._start_flusher()
+        if len(self._pending_seen) >= self.flush_max: self._flush_wake.set()
+
+    def _start_flusher(self):
+        """Starts the flusher thread on the first buffered write. Called with _pending_lock held."""
+        if self._flusher is None and not self._closed:
+            self._flusher = threading.Thread(target=self._flush_loop, name="db-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._flush_wake.wait(self.flush_interval)
+            self._flush_wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Writes the pending last_seen and afk_status changes in one transaction."""
+        if not self.conn: return
         with self.lock:
+            with self._pending_lock:
+                if not self._pending_seen and not self._pending_afk: return
+                seen, self._pending_seen = self._pending_seen, {}
+                afk, self._pending_afk = self._pending_afk, {}
             try:
-                cursor = self.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO last_seen (user_id, nick, timestamp, action)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(user_id) DO UPDATE SET
-                    nick=excluded.nick, timestamp=excluded.timestamp, action=excluded.action
-                ''', (user_id, nick, timestamp, action))
+                if seen: self.conn.executemany(_UPSERT_LAST_SEEN, [(user_id, *row) for user_id, row in seen.items()])
+                afk_set = [(user_id, *row) for user_id, row in afk.items() if row is not None]
+                if afk_set: self.conn.executemany(_UPSERT_AFK, afk_set)
+                afk_removed = [(user_id,) for user_id, row in afk.items() if row is None]
+                if afk_removed: self.conn.executemany("DELETE FROM afk_status WHERE user_id = ?", afk_removed)
                 self.conn.commit()
+                self.flush_count += 1; self.flushed_rows += len(seen) + len(afk)
             except sqlite3.Error as e:
-                logging.error(f"Failed to update last_seen for {nick}: {e}")
+                logging.error(f"Failed to write {len(seen) + len(afk)} buffered update(s): {e}")
+                self.conn.rollback()
+                with self._pending_lock:  # retried on the next flush unless a newer change came in
+                    for user_id, row in seen.items(): self._pending_seen.setdefault(user_id, row)
+                    for user_id, row in afk.items(): self._pending_afk.setdefault(user_id, row)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_seen) + len(self._pending_afk)
 
     def get_last_seen(self, nick: str) -> dict | None:
         if not self.conn: return None
+        nick = nick.lower()
         with self.lock:
+            with self._pending_lock:
+                pending = dict(self._pending_seen)
+            for pending_nick, timestamp, action in pending.values():
+                if pending_nick.lower() == nick:
+                    return {'nick': pending_nick, 'timestamp': timestamp, 'action': action}
             try:
                 cursor = self.conn.cursor()
-                cursor.execute("SELECT nick, timestamp, action FROM last_seen WHERE lower(nick) = ?", (nick.lower(),))
-                row = cursor.fetchone()
-                if row:
-                    return {'nick': row[0], 'timestamp': row[1], 'action': row[2]}
+                cursor.execute("SELECT user_id, nick, timestamp, action FROM last_seen WHERE lower(nick) = ?", (nick,))
+                for row in cursor:
+                    if row[0] not in pending:  # a pending update of that user has a different nick now
+                        return {'nick': row[1], 'timestamp': row[2], 'action': row[3]}
                 return None
             except sqlite3.Error as e:
                 logging.error(f"Failed to get last_seen for {nick}: {e}")
@@ -80,45 +150,23 @@ class DataService:
     def set_afk(self, user_id: int, nick: str, reason: str):
         if not self.conn: return
         timestamp = datetime.datetime.now().isoformat()
-        with self.lock:
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO afk_status (user_id, nick, reason, timestamp)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(user_id) DO UPDATE SET
-                    nick=excluded.nick, reason=excluded.reason, timestamp=excluded.timestamp
-                ''', (user_id, nick, reason, timestamp))
-                self.conn.commit()
-            except sqlite3.Error as e:
-                logging.error(f"Failed to set AFK for {nick}: {e}")
+        with self._pending_lock:
+            self._afk[user_id] = {'nick': nick, 'reason': reason, 'timestamp': timestamp}
+            self._pending_afk[user_id] = (nick, reason, timestamp)
+            self._start_flusher()
 
     def remove_afk(self, user_id: int) -> bool:
-        if not self.conn: return False
-        with self.lock:
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("DELETE FROM afk_status WHERE user_id = ?", (user_id,))
-                self.conn.commit()
-                return cursor.rowcount > 0
-            except sqlite3.Error as e:
-                logging.error(f"Failed to remove AFK for user_id {user_id}: {e}")
-                return False
+        """Clears the user's AFK status. Returns whether they were AFK."""
+        if user_id not in self._afk: return False  # every message takes this path
+        with self._pending_lock:
+            if self._afk.pop(user_id, None) is None: return False
+            self._pending_afk[user_id] = None
+            self._start_flusher()
+        return True
 
     def get_afk_user(self, user_id: int) -> dict | None:
-        if not self.conn: return None
-        with self.lock:
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT nick, reason, timestamp FROM afk_status WHERE user_id = ?", (user_id,))
-                row = cursor.fetchone()
-                if row:
-                    return {'nick': row[0], 'reason': row[1], 'timestamp': row[2]}
-                return None
-            except sqlite3.Error as e:
-                logging.error(f"Failed to get AFK status for user_id {user_id}: {e}")
-                return None
-                
+        return self._afk.get(user_id)
+
     def is_db_connected(self) -> bool:
         """Checks if the database connection is alive."""
         if not self.conn:
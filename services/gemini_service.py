@@ -1,4 +1,5 @@
 
+import asyncio
 import logging
 import time
 try:
@@ -74,33 +75,51 @@ class GeminiService:
 
         start_time = time.time()
         try:
-            # Format history for Gemini chat
-            formatted_history = []
-            if history and self.context_history_enabled:
-                for msg in history:
-                    role = "model" if msg['is_bot'] else "user"
-                    formatted_history.append({'role': role, 'parts': [msg['message']]})
-            
-            chat = self.model.start_chat(history=formatted_history)
+            chat = self.model.start_chat(history=self._format_history(history))
             response = chat.send_message(prompt, stream=False, safety_settings=GEMINI_SAFETY_SETTINGS)
-            
-            if hasattr(response, 'text') and response.text.strip():
-                return response.text
-            elif hasattr(response, 'parts') and response.parts:
-                full_text = "".join(part.text for part in response.parts if hasattr(part, 'text'))
-                if full_text.strip(): return full_text
-            elif hasattr(response, 'prompt_feedback') and response.prompt_feedback.block_reason:
-                 return f"[Gemini Error] Request blocked: {response.prompt_feedback.block_reason.name}"
-            
-            return "[Gemini] (Received an empty response)"
+            return self._extract_text(response)
         except Exception as e:
             logging.error(f"Error during Gemini API call: {e}", exc_info=True)
             return f"[Bot Error] Error contacting Gemini. Check if model '{self.model_name}' supports chat."
         finally:
             self.last_latency = time.time() - start_time
 
+    async def generate_content_async(self, prompt, history=None):
+        """Same as generate_content, run in a worker thread so the event loop keeps going meanwhile.
+
+        The library's async client is bound to the loop it was first used on, but this
+        service outlives loops: it is shared by every server's session (supervisor.py)
+        and kept across bot restarts, each of which runs its own asyncio loop.
+        """
+        return await asyncio.to_thread(self.generate_content, prompt, history)
+
+    def _format_history(self, history):
+        # Format history for Gemini chat
+        formatted_history = []
+        if history and self.context_history_enabled:
+            for msg in history:
+                role = "model" if msg['is_bot'] else "user"
+                formatted_history.append({'role': role, 'parts': [msg['message']]})
+        return formatted_history
+
+    def _extract_text(self, response):
+        if hasattr(response, 'text') and response.text.strip():
+            return response.text
+        elif hasattr(response, 'parts') and response.parts:
+            full_text = "".join(part.text for part in response.parts if hasattr(part, 'text'))
+            if full_text.strip(): return full_text
+        elif hasattr(response, 'prompt_feedback') and response.prompt_feedback.block_reason:
+             return f"[Gemini Error] Request blocked: {response.prompt_feedback.block_reason.name}"
+
+        return "[Gemini] (Received an empty response)"
+
     def generate_welcome_message(self):
         if not self.is_enabled():
             return "Welcome!"
         # This function can now also be influenced by the system instruction.
-        return self.generate_content("Generate a short, friendly, and creative welcome message for a user who just joined a chat channel.")
\ No newline at end of file
+        return self.generate_content("Generate a short, friendly, and creative welcome message for a user who just joined a chat channel.")
+
+    async def generate_welcome_message_async(self):
+        if not self.is_enabled():
+            return "Welcome!"
+        return await self.generate_content_async("Generate a short, friendly, and creative welcome message for a user who just joined a chat channel.")
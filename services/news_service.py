@@ -1,4 +1,6 @@
 import logging
+import json
+from . import async_http
 try:
     import requests
     REQUESTS_AVAILABLE = True
@@ -21,6 +23,41 @@ class NewsService:
         if not self.is_enabled():
             return "[Bot] News feature is disabled (check News API key in config.json)."
 
+        params, search_term = self._build_params(topic, country, page_size)
+        try:
+            response = async_http.requests_session().get(self.base_url, params=params, timeout=10)
+            response.raise_for_status()
+            return self._format_articles(response.json(), search_term)
+
+        except requests.exceptions.Timeout:
+            return "[News Error] The request to the news service timed out."
+        except requests.exceptions.HTTPError as e:
+             return self._http_error_message(e.response.status_code)
+        except requests.exceptions.RequestException:
+            return "[News Error] Could not fetch news. Check your internet connection."
+        except Exception as e:
+            logging.error(f"Unexpected news error: {e}", exc_info=True)
+            return "[News Error] An unexpected error occurred while fetching news."
+
+    async def get_news_async(self, topic: str = None, country: str = 'us', page_size: int = 5) -> str:
+        if not self.is_enabled():
+            return "[Bot] News feature is disabled (check News API key in config.json)."
+
+        params, search_term = self._build_params(topic, country, page_size)
+        try:
+            status, body = await async_http.get(self.base_url, params=params, timeout=10)
+            if status >= 400:
+                return self._http_error_message(status)
+            return self._format_articles(json.loads(body), search_term)
+        except async_http.RequestTimeout:
+            return "[News Error] The request to the news service timed out."
+        except async_http.RequestFailed:
+            return "[News Error] Could not fetch news. Check your internet connection."
+        except Exception as e:
+            logging.error(f"Unexpected news error: {e}", exc_info=True)
+            return "[News Error] An unexpected error occurred while fetching news."
+
+    def _build_params(self, topic, country, page_size):
         params = {
             'apiKey': self.api_key,
             'pageSize': page_size
@@ -33,37 +70,27 @@ class NewsService:
         else:
             params['country'] = country
             search_term = "Top Stories"
+        return params, search_term
 
-        try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+    def _format_articles(self, data, search_term):
+        if data.get("status") != "ok":
+            return f"[News Error] API Error: {data.get('message', 'Unknown API error')}."
 
-            if data.get("status") != "ok":
-                return f"[News Error] API Error: {data.get('message', 'Unknown API error')}."
+        articles = data.get("articles", [])
+        if not articles:
+            return f"No news articles found for '{search_term}'. Try a different topic."
 
-            articles = data.get("articles", [])
-            if not articles:
-                return f"No news articles found for '{search_term}'. Try a different topic."
+        headlines = [f"--- Top {len(articles)} Headlines for '{search_term}' ---"]
+        for i, article in enumerate(articles):
+            title = article.get('title', 'No Title')
+            source = article.get('source', {}).get('name', 'Unknown Source')
+            headlines.append(f"{i+1}. {title} ({source})")
 
-            headlines = [f"--- Top {len(articles)} Headlines for '{search_term}' ---"]
-            for i, article in enumerate(articles):
-                title = article.get('title', 'No Title')
-                source = article.get('source', {}).get('name', 'Unknown Source')
-                headlines.append(f"{i+1}. {title} ({source})")
-            
-            return "\n".join(headlines)
+        return "\n".join(headlines)
 
-        except requests.exceptions.Timeout:
-            return "[News Error] The request to the news service timed out."
-        except requests.exceptions.HTTPError as e:
-             if e.response.status_code == 401:
-                 return "[News Error] Unauthorized. Your News API key may be invalid."
-             if e.response.status_code == 429:
-                 return "[News Error] Too many requests. You have been rate-limited by the news service."
-             return f"[News Error] Could not fetch news. HTTP Error: {e.response.status_code}"
-        except requests.exceptions.RequestException:
-            return "[News Error] Could not fetch news. Check your internet connection."
-        except Exception as e:
-            logging.error(f"Unexpected news error: {e}", exc_info=True)
-            return "[News Error] An unexpected error occurred while fetching news."
\ No newline at end of file
+    def _http_error_message(self, status_code):
+        if status_code == 401:
+            return "[News Error] Unauthorized. Your News API key may be invalid."
+        if status_code == 429:
+            return "[News Error] Too many requests. You have been rate-limited by the news service."
+        return f"[News Error] Could not fetch news. HTTP Error: {status_code}"
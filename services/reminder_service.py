@@ -10,24 +10,24 @@ except ImportError:
     SCHEDULER_AVAILABLE = False
 
 # --- Global objects to solve the pickling issue ---
-# The scheduler and bot reference are kept at the module level.
+# The scheduler and bot references are kept at the module level.
 # This prevents the scheduler from trying to pickle the live bot instance,
 # which contains un-pickleable thread locks.
 _scheduler = None
-_bot_ref = None
+_bot_refs = {}  # session name -> live bot; '' unless several servers share the scheduler (supervisor.py)
 
-def _send_reminder_job(user_id, message):
+def _send_reminder_job(user_id, message, session=''):
     """
     This is the actual function the scheduler calls.
     It's a top-level function, so it doesn't have a 'self' and is easily pickled.
-    It uses the global _bot_ref to access the live bot instance when it runs.
+    It uses _bot_refs to access the live bot instance of the session when it runs.
     """
-    global _bot_ref
+    bot = _bot_refs.get(session)
     try:
-        if _bot_ref and _bot_ref._logged_in:
-            _bot_ref._send_pm(user_id, f"[Reminder] {message}")
+        if bot and bot._logged_in:
+            bot._send_pm(user_id, f"[Reminder] {message}")
             logging.info(f"Sent reminder to user_id {user_id}.")
-        elif _bot_ref:
+        elif bot:
             logging.warning(f"Could not send reminder to user_id {user_id}: Bot is not logged in.")
         else:
             logging.error(f"Could not send reminder to user_id {user_id}: Bot reference is not set.")
@@ -37,9 +37,9 @@ def _send_reminder_job(user_id, message):
 # ----------------------------------------------------
 
 class ReminderService:
-    def __init__(self, bot_instance):
-        global _scheduler, _bot_ref
-        _bot_ref = bot_instance  # Set the global reference to the live bot
+    def __init__(self, bot_instance, db_file='reminders.sqlite'):
+        global _scheduler
+        if bot_instance: self.attach(bot_instance)  # Set the global reference to the live bot; None when shared (supervisor.py)
         self._enabled = SCHEDULER_AVAILABLE
         
         if not self.is_enabled():
@@ -49,7 +49,7 @@ class ReminderService:
         # Initialize the scheduler only once
         if _scheduler is None:
             jobstores = {
-                'default': SQLAlchemyJobStore(url='sqlite:///reminders.sqlite')
+                'default': SQLAlchemyJobStore(url=f'sqlite:///{db_file}')
             }
             _scheduler = BackgroundScheduler(jobstores=jobstores)
             logging.info("ReminderService initialized with persistent job store.")
@@ -57,6 +57,10 @@ class ReminderService:
     def is_enabled(self):
         return self._enabled
 
+    def attach(self, bot_instance):
+        """Points scheduled reminders of the bot's session at this bot."""
+        _bot_refs[bot_instance.session_name] = bot_instance
+
     def start(self):
         if self.is_enabled() and _scheduler and not _scheduler.running:
             _scheduler.start()
@@ -67,13 +71,18 @@ class ReminderService:
             _scheduler.shutdown()
             logging.info("Reminder scheduler shut down.")
 
-    def parse_and_add_reminder(self, user_id: int, reminder_str: str) -> str:
+    def parse_and_add_reminder(self, user_id: int, reminder_str: str, bot_instance=None) -> str:
         """
         Parses the user's reminder string and adds a job to the scheduler.
         Expected format: "message" in <number> <unit>
+        bot_instance is the bot asking; the reminder is sent through its session's bot.
         """
         if not self.is_enabled():
             return "[Bot] Reminder feature is disabled (required libraries not installed)."
+        session = ''
+        if bot_instance:
+            self.attach(bot_instance)  # this service may have been created after the bot logged in
+            session = bot_instance.session_name
 
         # Regex to capture the message and the time components
         match = re.match(r'^\s*"(.+?)"\s+in\s+(\d+)\s+(minutes?|hours?|days?)\s*$', reminder_str, re.IGNORECASE)
@@ -101,8 +110,8 @@ class ReminderService:
                 _send_reminder_job,  # Schedule the pickle-safe, top-level function
                 'date',
                 run_date=run_time,
-                args=[user_id, message],
-                id=f"reminder_{user_id}_{run_time.timestamp()}",
+                args=[user_id, message, session] if session else [user_id, message],
+                id=f"reminder_{session}{user_id}_{run_time.timestamp()}",
                 misfire_grace_time=3600
             )
             logging.info(f"Scheduled reminder for user_id {user_id} at {run_time.strftime('%Y-%m-%d %H:%M:%S')}")
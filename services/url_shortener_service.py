@@ -1,4 +1,5 @@
 import logging
+from . import async_http
 try:
     import requests
     REQUESTS_AVAILABLE = True
@@ -33,13 +34,34 @@ class URLShortenerService:
             return "[Bot Error] Invalid URL. Please provide a full URL starting with http:// or https://"
         
         try:
-            response = requests.get(self.api_url, params={'url': long_url}, timeout=10)
+            response = async_http.requests_session().get(self.api_url, params={'url': long_url}, timeout=10)
             response.raise_for_status()
-            if response.text == "Error":
-                return "[Bot Error] The TinyURL API returned an error. The URL may be invalid or blacklisted."
-            return f"Shortened URL: {response.text}"
+            return self._format_response(response.text)
         except requests.exceptions.Timeout:
             return f"[Bot Error] Request timed out while shortening URL."
         except requests.exceptions.RequestException as e:
             logging.error(f"Error shortening URL {long_url}: {e}")
-            return f"[Bot Error] Could not shorten URL. The service might be down or the URL is invalid."
\ No newline at end of file
+            return f"[Bot Error] Could not shorten URL. The service might be down or the URL is invalid."
+
+    async def shorten_url_async(self, long_url: str) -> str:
+        """Non-blocking variant of shorten_url for the asyncio runtime."""
+        if not self.is_enabled():
+            return "[Bot] URL shortener is disabled ('requests' library not installed)."
+        if not long_url.startswith(('http://', 'https://')):
+            return "[Bot Error] Invalid URL. Please provide a full URL starting with http:// or https://"
+
+        try:
+            status, body = await async_http.get(self.api_url, params={'url': long_url}, timeout=10)
+            if status >= 400:
+                raise async_http.RequestFailed(f"HTTP {status}")
+            return self._format_response(body)
+        except async_http.RequestTimeout:
+            return f"[Bot Error] Request timed out while shortening URL."
+        except async_http.RequestFailed as e:
+            logging.error(f"Error shortening URL {long_url}: {e}")
+            return f"[Bot Error] Could not shorten URL. The service might be down or the URL is invalid."
+
+    def _format_response(self, text: str) -> str:
+        if text == "Error":
+            return "[Bot Error] The TinyURL API returned an error. The URL may be invalid or blacklisted."
+        return f"Shortened URL: {text}"
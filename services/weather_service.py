@@ -1,6 +1,8 @@
 
 import logging
 import time
+import json
+from . import async_http
 try:
     import requests
     REQUESTS_AVAILABLE = True
@@ -21,35 +23,11 @@ class WeatherService:
         if not self.is_enabled():
             return "[Bot] Weather feature is disabled (check API key/library)."
 
-        complete_url = self.base_url + "appid=" + self.api_key + "&q=" + location + "&units=metric"
-        
         start_time = time.time()
         try:
-            response = requests.get(complete_url, timeout=10)
+            response = async_http.requests_session().get(self._build_url(location), timeout=10)
             response.raise_for_status()
-            data = response.json()
-
-            if data.get("cod") != 200 and data.get("cod") != "200":
-                return f"[Weather Error] {data.get('message', 'Unknown API error')}."
-
-            main = data.get("main", {})
-            weather = data.get("weather", [{}])[0]
-            wind = data.get("wind", {})
-            sys_info = data.get("sys", {})
-
-            temp = main.get("temp", "N/A")
-            feels_like = main.get("feels_like", "N/A")
-            humidity = main.get("humidity", "N/A")
-            description = weather.get("description", "N/A").capitalize()
-            wind_speed = wind.get("speed", "N/A")
-            city_name = data.get("name", location)
-            country = sys_info.get("country", "")
-
-            wind_kmh = f"{wind_speed * 3.6:.1f} km/h" if isinstance(wind_speed, (int, float)) else "N/A"
-
-            return (f"Weather in {city_name}, {country}: {description}. "
-                    f"Temp: {temp}°C (Feels like: {feels_like}°C). "
-                    f"Humidity: {humidity}%. Wind: {wind_kmh}.")
+            return self._format_weather(response.json(), location)
 
         except requests.exceptions.Timeout:
              return f"[Weather Error] Request timed out for '{location}'."
@@ -59,4 +37,50 @@ class WeatherService:
              logging.error(f"Unexpected weather error for {location}: {e}", exc_info=True)
              return f"[Weather Error] An unexpected error occurred."
         finally:
-            self.last_latency = time.time() - start_time
\ No newline at end of file
+            self.last_latency = time.time() - start_time
+
+    async def get_weather_async(self, location):
+        if not self.is_enabled():
+            return "[Bot] Weather feature is disabled (check API key/library)."
+
+        start_time = time.time()
+        try:
+            status, body = await async_http.get(self._build_url(location), timeout=10)
+            if status >= 400:
+                return f"[Weather Error] Could not fetch weather for '{location}'. Check location."
+            return self._format_weather(json.loads(body), location)
+        except async_http.RequestTimeout:
+            return f"[Weather Error] Request timed out for '{location}'."
+        except async_http.RequestFailed:
+            return f"[Weather Error] Could not fetch weather for '{location}'. Check location."
+        except Exception as e:
+            logging.error(f"Unexpected weather error for {location}: {e}", exc_info=True)
+            return f"[Weather Error] An unexpected error occurred."
+        finally:
+            self.last_latency = time.time() - start_time
+
+    def _build_url(self, location):
+        return self.base_url + "appid=" + self.api_key + "&q=" + location + "&units=metric"
+
+    def _format_weather(self, data, location):
+        if data.get("cod") != 200 and data.get("cod") != "200":
+            return f"[Weather Error] {data.get('message', 'Unknown API error')}."
+
+        main = data.get("main", {})
+        weather = data.get("weather", [{}])[0]
+        wind = data.get("wind", {})
+        sys_info = data.get("sys", {})
+
+        temp = main.get("temp", "N/A")
+        feels_like = main.get("feels_like", "N/A")
+        humidity = main.get("humidity", "N/A")
+        description = weather.get("description", "N/A").capitalize()
+        wind_speed = wind.get("speed", "N/A")
+        city_name = data.get("name", location)
+        country = sys_info.get("country", "")
+
+        wind_kmh = f"{wind_speed * 3.6:.1f} km/h" if isinstance(wind_speed, (int, float)) else "N/A"
+
+        return (f"Weather in {city_name}, {country}: {description}. "
+                f"Temp: {temp}°C (Feels like: {feels_like}°C). "
+                f"Humidity: {humidity}%. Wind: {wind_kmh}.")
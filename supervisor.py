@@ -0,0 +1,219 @@
+"""Runs the bot on several TeamTalk servers from one process.
+
+Every server gets its own bot session: its own TeamTalk connection, event
+thread, database file and conversation history, restarted on its own when it
+ends unexpectedly (with a backoff, so a crash-looping server only costs its
+own thread). The Gemini client, the weather/news/time/URL services with their
+caches and the reminder scheduler are created once and shared.
+
+servers.json maps a server name to the settings that differ from config.json:
+
+    {
+        "main": {},
+        "eu": {"Connection": {"host": "eu.example.org", "nickname": "PyBot EU"}},
+        "us": {"Connection": {"host": "us.example.org"}, "Bot": {"initial_channel_path": "/Bots/"}}
+    }
+
+Gemini, weather and news settings are shared and always come from config.json.
+Unless a server sets Database.file, it gets its own copy of the configured one
+(bot_data.db -> bot_data-eu.db), since last-seen/AFK rows use the server's user ids.
+
+Usage: python supervisor.py [--config config.json] [--servers servers.json]
+"""
+import sys, os, threading, signal, logging, argparse, time, json, random
+from config_manager import load_config, save_config, normalize_config, _deep_update, CONFIG_FILE
+from bot import MyTeamTalkBot, shared_service_factories
+from service_registry import ServiceRegistry
+from main import setup_logging
+
+SERVERS_FILE = "servers.json"
+# Bot settings of the shared services; a per-server value would silently lose to whichever session created them.
+SHARED_BOT_KEYS = ('gemini_api_key', 'gemini_system_instruction', 'gemini_model_name', 'weather_api_key', 'news_api_key')
+
+def load_servers(path=SERVERS_FILE):
+    """Returns {server name: config overrides} from path, or None if it is missing or invalid."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            servers = json.load(f)
+    except FileNotFoundError:
+        logging.error(f"{path} not found. It lists the servers to run, see supervisor.py.")
+        return None
+    except (json.JSONDecodeError, OSError) as e:
+        logging.error(f"Error reading servers file {path}: {e}. Please fix it.")
+        return None
+    if not isinstance(servers, dict) or not servers or not all(isinstance(o, dict) for o in servers.values()):
+        logging.error(f"{path} must map each server name to an object of config overrides.")
+        return None
+    return servers
+
+def _overrides(config, base):
+    """The parts of config that differ from base, as nested dicts."""
+    diff = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            nested = _overrides(value, base.get(key, {}))
+            if nested: diff[key] = nested
+        elif base.get(key) != value:
+            diff[key] = value
+    return diff
+
+
+class BotSession:
+    """One server's bot, run and restarted on its own thread. It is the controller its bots see."""
+    def __init__(self, supervisor, name, config):
+        self.supervisor, self.name, self.config = supervisor, name, config
+        # Per-server services here; the shared ones are created and kept by the supervisor's registry.
+        self.services = ServiceRegistry(supervisor.services, MyTeamTalkBot.SHARED_SERVICE_NAMES)
+        self.bot_instance = None
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.restart_requested = threading.Event()
+        self.failures = 0  # unexpected endings in a row
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name=f"bot-{self.name}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        supervisor = self.supervisor
+        while not self.stop_event.is_set():
+            self.restart_requested.clear()
+            started = time.monotonic()
+            try:
+                self.bot_instance = MyTeamTalkBot(self.config, self, self.services, self.name)
+                if self.stop_event.is_set(): break
+                self.bot_instance.start()  # blocks until the session ends
+            except Exception as e:
+                logging.critical(f"[{self.name}] Bot session failed with unhandled exception: {e}", exc_info=True)
+            if self.stop_event.is_set(): break
+            if self.restart_requested.is_set():
+                logging.info(f"[{self.name}] Bot session ended for a requested restart.")
+                continue
+            if time.monotonic() - started >= supervisor.stable_after: self.failures = 0
+            backoff = min(supervisor.restart_delay_max, supervisor.restart_delay_min * 2 ** self.failures)
+            delay = random.uniform(backoff / 2, backoff)
+            self.failures += 1
+            logging.warning(f"[{self.name}] Bot session ended unexpectedly ({self.failures} in a row). Restarting in {delay:.1f} seconds.")
+            self.stop_event.wait(delay)
+        self.services.close()
+        logging.info(f"[{self.name}] Bot session stopped.")
+
+    def stop(self):
+        self.stop_event.set()
+        bot = self.bot_instance
+        if bot:
+            bot._mark_stopped_intentionally()
+            bot.stop()
+
+    # --- Controller interface used by MyTeamTalkBot and the admin commands ---
+
+    def on_bot_session_ended(self):
+        """Called by the bot thread right before it terminates; _run decides what happens next."""
+
+    def request_restart(self):
+        logging.info(f"[{self.name}] Restart requested.")
+        if not self.restart_requested.is_set():
+            self.restart_requested.set()
+            if self.bot_instance:
+                self.bot_instance._mark_stopped_intentionally()
+                self.bot_instance.stop()
+
+    def request_shutdown(self):
+        logging.info(f"[{self.name}] Quit requested; stopping this server's session, the others keep running.")
+        self.stop()
+
+    def save_session_config(self, config):
+        self.supervisor.save_session_config(self.name, config)
+
+
+class BotSupervisor:
+    """Hosts one BotSession per configured server and the services they share."""
+    # A session that ends unexpectedly is restarted after a backoff that doubles with every
+    # failure in a row, with jitter; one that had been up for stable_after seconds starts over.
+    restart_delay_min, restart_delay_max, stable_after = 15, 300, 60
+
+    def __init__(self, config, servers, config_file=CONFIG_FILE, servers_file=SERVERS_FILE):
+        self.config, self.servers = config, servers
+        self.config_file, self.servers_file = config_file, servers_file
+        self.services = ServiceRegistry()
+        for name, factory in shared_service_factories(config).items(): self.services.register(name, factory)
+        self.exit_event = threading.Event()
+        self._save_lock = threading.Lock()
+        self.sessions = [BotSession(self, name, self.session_config(name)) for name in servers]
+
+    def session_config(self, name):
+        """config.json with the server's overrides applied."""
+        overrides = self.servers[name]
+        config = _deep_update(json.loads(json.dumps(self.config)), json.loads(json.dumps(overrides)))
+        for key in SHARED_BOT_KEYS:
+            if key in overrides.get('Bot', {}):
+                logging.warning(f"[{name}] Bot.{key} is shared by all servers; using the value from {self.config_file}.")
+            config['Bot'][key] = self.config['Bot'][key]
+        config['Database']['reminders_file'] = self.config['Database']['reminders_file']  # one scheduler for all
+        db_file = self.config['Database']['file']
+        if 'file' not in overrides.get('Database', {}) and db_file != ':memory:':
+            stem, ext = os.path.splitext(db_file)
+            config['Database']['file'] = f"{stem}-{name}{ext}"
+        return normalize_config(config)
+
+    def save_session_config(self, name, config):
+        """Persists runtime changes of one server: shared settings to config.json, the rest to servers.json."""
+        with self._save_lock:
+            if any(config['Bot'][key] != self.config['Bot'][key] for key in SHARED_BOT_KEYS):
+                for key in SHARED_BOT_KEYS: self.config['Bot'][key] = config['Bot'][key]
+                save_config(self.config, self.config_file)
+            self.servers[name] = _overrides(config, self.config)
+            try:
+                with open(self.servers_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.servers, f, indent=4)
+                logging.info(f"[{name}] Configuration saved to {self.servers_file}")
+            except IOError as e:
+                logging.error(f"Error saving configuration to {self.servers_file}: {e}")
+
+    def run(self):
+        """Starts every session and blocks until shutdown is requested or all sessions have stopped."""
+        logging.info(f"Starting {len(self.sessions)} bot session(s): {', '.join(s.name for s in self.sessions)}")
+        for session in self.sessions: session.start()
+        while not self.exit_event.wait(1):
+            if not any(session.thread.is_alive() for session in self.sessions): break
+        self.shutdown()
+
+    def request_shutdown(self):
+        logging.info("Shutdown requested.")
+        self.exit_event.set()
+
+    def shutdown(self):
+        logging.info("Shutdown sequence started.")
+        self.exit_event.set()
+        for session in self.sessions: session.stop()
+        for session in self.sessions:
+            if session.thread and session.thread.is_alive():
+                session.thread.join(5.0)
+        self.services.close()
+        logging.info("Cleanup complete. Exiting.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default=CONFIG_FILE, help="settings shared by all servers")
+    parser.add_argument("--servers", default=SERVERS_FILE, help="server name -> config overrides")
+    args = parser.parse_args()
+    setup_logging('%(asctime)s - %(levelname)s - %(threadName)s - %(message)s')
+
+    config, servers = load_config(args.config), load_servers(args.servers)
+    if not config or not servers:
+        logging.critical("Configuration missing or invalid. Run main.py once to create config.json. Exiting.")
+        return 1
+    try:
+        supervisor = BotSupervisor(config, servers, args.config, args.servers)
+    except (TypeError, ValueError) as e:
+        logging.critical(f"Invalid value in {args.servers}: {e}. Exiting.")
+        return 1
+    signal.signal(signal.SIGINT, lambda sig, frame: supervisor.request_shutdown())
+    signal.signal(signal.SIGTERM, lambda sig, frame: supervisor.request_shutdown())
+    supervisor.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+from ctypes import c_char
+from TeamTalk5 import TTCHAR, TT_STRLEN
+
+# TextMessage.szMessage holds TT_STRLEN TTCHARs including the terminator. On
+# Linux a TTCHAR is one byte of UTF-8, on Windows one UTF-16 code unit.
+MAX_CHUNK_UNITS = TT_STRLEN - 1
+BYTE_CHARS = TTCHAR is c_char
+
+def chunk_text(message: str, limit: int = MAX_CHUNK_UNITS, slack: float = 0.15) -> list:
+    """Splits message into pieces that fit TextMessage.szMessage, already encoded for it.
+
+    Each piece is filled to at least (1 - slack) of the limit. Within that window
+    the split goes after the last newline, else after the last sentence end,
+    else after the last space, else at the limit (never inside a character).
+    Joining the pieces gives back the original message.
+    """
+    if BYTE_CHARS:
+        return _split(message.encode('utf-8'), limit, slack, _utf8_cut, b'\n', (b'. ', b'! ', b'? '), b' ')
+    return _split(message, limit, slack, _utf16_cut, '\n', ('. ', '! ', '? '), ' ')
+
+def _split(data, limit, slack, fit_cut, newline, sentence_ends, space):
+    chunks = []
+    pos, end = 0, len(data)
+    min_fill = max(1, int(limit * (1 - slack)))
+    while True:
+        hard_cut = fit_cut(data, pos, end, limit)
+        if hard_cut >= end:
+            break
+        lo = pos + min_fill
+        cut = data.rfind(newline, lo, hard_cut) + 1
+        if not cut:
+            best = max(data.rfind(sep, lo, hard_cut - 1) for sep in sentence_ends)
+            cut = best + 2 if best >= 0 else data.rfind(space, lo, hard_cut) + 1
+        if not cut:
+            cut = hard_cut
+        chunks.append(data[pos:cut])
+        pos = cut
+    if pos < end:
+        chunks.append(data[pos:])
+    return chunks
+
+def _utf8_cut(data: bytes, pos: int, end: int, limit: int) -> int:
+    # Step back off UTF-8 continuation bytes so a character is never split
+    cut = min(end, pos + limit)
+    while cut < len(data) and cut > pos and (data[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return cut
+
+def _utf16_cut(text: str, pos: int, end: int, limit: int) -> int:
+    # Characters outside the BMP take two UTF-16 units
+    cut = min(end, pos + limit)
+    units = len(text[pos:cut].encode('utf-16-le')) // 2
+    while units > limit:
+        cut -= 1
+        units -= 2 if ord(text[cut]) > 0xFFFF else 1
+    return cut
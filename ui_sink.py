@@ -0,0 +1,25 @@
+import logging
+
+class UISink:
+    """Front end notifications from the bot.
+
+    This base class is the headless sink used by main.py: log lines go to the
+    logging module and list/control updates are dropped, so the console bot
+    never imports wx. gui/wx_ui_sink.py forwards everything to the main window.
+    Methods may be called from any thread.
+    """
+    # Whether anything displays the user/channel lists; the bot skips building them otherwise.
+    active = False
+
+    def log_message(self, message): logging.info(f"[Bot] {message}")
+    def session_started(self, title): pass
+    def update_channel_list(self, channels): pass
+    def apply_channel_list_diff(self, removed, added, changed): pass
+    def update_user_list(self, users): pass
+    def apply_user_list_diff(self, removed, added, changed): pass
+    def update_feature_list(self): pass
+    def update_bot_controls_status(self): pass
+
+    def call_on_ui_thread(self, func, *args):
+        """Runs func on the UI thread (here: right away, on the calling thread)."""
+        func(*args)
@@ -0,0 +1,87 @@
+import bisect
+import difflib
+from TeamTalk5 import ttstr
+
+def _text(value) -> str:
+    # Lookups may be given TTCHAR strings (bytes on Linux) as well as str.
+    return ttstr(value) if isinstance(value, bytes) else value
+
+def _key(value) -> str:
+    return _text(value).lower()
+
+class UserIndex:
+    """Lowercase nickname and username lookups over the bot's user cache (UserRecords).
+
+    Kept up to date from the login/update/logout events, so lookups never scan
+    the cache. Several users may share a nickname; exact lookups return the
+    one indexed first. Nicknames are also kept sorted for prefix search.
+    """
+    def __init__(self):
+        self._by_nick = {}       # lowercase nick -> {user_id: UserRecord}
+        self._by_username = {}   # lowercase username -> {user_id: UserRecord}
+        self._keys = {}          # user_id -> (nick key, username key)
+        self._sorted_nicks = []
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        self._by_nick.clear(); self._by_username.clear(); self._keys.clear(); self._sorted_nicks.clear()
+
+    def add(self, user):
+        """Adds user, or re-indexes it when its nickname or username changed."""
+        self.remove(user.user_id)
+        nick, username = user.nickname.lower(), user.username.lower()
+        self._keys[user.user_id] = (nick, username)
+        if nick not in self._by_nick:
+            self._by_nick[nick] = {}
+            bisect.insort(self._sorted_nicks, nick)
+        self._by_nick[nick][user.user_id] = user
+        self._by_username.setdefault(username, {})[user.user_id] = user
+
+    def remove(self, user_id: int):
+        keys = self._keys.pop(user_id, None)
+        if keys is None: return
+        nick, username = keys
+        users = self._by_nick[nick]
+        del users[user_id]
+        if not users:
+            del self._by_nick[nick]
+            del self._sorted_nicks[bisect.bisect_left(self._sorted_nicks, nick)]
+        users = self._by_username[username]
+        del users[user_id]
+        if not users: del self._by_username[username]
+
+    def by_nick(self, nick):
+        users = self._by_nick.get(_key(nick))
+        return next(iter(users.values())) if users else None
+
+    def by_username(self, username):
+        users = self._by_username.get(_key(username))
+        return next(iter(users.values())) if users else None
+
+    def by_prefix(self, prefix, limit: int = 10) -> list:
+        """Users whose nickname starts with prefix, in nickname order."""
+        prefix, nicks = _key(prefix), self._sorted_nicks
+        result = []
+        i = bisect.bisect_left(nicks, prefix)
+        while i < len(nicks) and len(result) < limit and nicks[i].startswith(prefix):
+            result.extend(self._by_nick[nicks[i]].values())
+            i += 1
+        return result[:limit]
+
+    def users_by_nick(self, nick) -> list:
+        """Every user with exactly this nickname (case-insensitive)."""
+        return list(self._by_nick.get(_key(nick), {}).values())
+
+    def similar_nicks(self, nick, limit: int = 3, cutoff: float = 0.6) -> list[str]:
+        """Nicknames that look like nick (typos, partial names), best match first."""
+        matches = difflib.get_close_matches(_key(nick), self._by_nick.keys(), n=limit, cutoff=cutoff)
+        return [self.by_nick(match).nickname for match in matches]
+
+    def candidates(self, nick, limit: int = 10) -> list:
+        """Users whose nickname starts with or looks like nick, prefix matches first. Meant as suggestions only."""
+        users = {user.user_id: user for user in self.by_prefix(nick, limit)} if nick else {}
+        for similar in self.similar_nicks(nick, limit):
+            for user in self._by_nick[similar.lower()].values(): users.setdefault(user.user_id, user)
+        return list(users.values())[:limit]
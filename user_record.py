@@ -0,0 +1,28 @@
+from TeamTalk5 import ttstr
+
+class UserRecord:
+    """The fields of a TeamTalk User that the bot uses, decoded once when the event arrives.
+
+    A copied ctypes User carries a dozen TT_STRLEN character arrays (several KB
+    per user) and every read goes through ttstr(); a record holds plain str/int
+    attributes. Records are immutable, an update replaces the cached record.
+    """
+    __slots__ = ('user_id', 'nickname', 'username', 'channel_id', 'status_msg')
+
+    def __init__(self, user_id: int, nickname: str, username: str, channel_id: int = 0, status_msg: str = ''):
+        set_field = object.__setattr__
+        set_field(self, 'user_id', user_id); set_field(self, 'nickname', nickname); set_field(self, 'username', username)
+        set_field(self, 'channel_id', channel_id); set_field(self, 'status_msg', status_msg)
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(user.nUserID, ttstr(user.szNickname), ttstr(user.szUsername), user.nChannelID, ttstr(user.szStatusMsg))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"UserRecord(user_id={self.user_id}, nickname={self.nickname!r}, username={self.username!r}, channel_id={self.channel_id})"
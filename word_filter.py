@@ -0,0 +1,57 @@
+import re
+
+_TOKEN = re.compile(r'\w+')
+
+def _trie_pattern(words) -> str:
+    """Regex alternation of words with shared prefixes factored out, e.g. ab|ac|a -> a(?:b|c)?"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word: node = node.setdefault(char, {})
+        node[''] = {}
+    return _node_pattern(trie)
+
+def _node_pattern(node) -> str:
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches: return ''
+    if '' in node: return f"(?:{'|'.join(branches)})?"
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+class WordFilter:
+    """The bot's filtered words (a lowercase set) and a matcher that checks a message against all of them at once.
+
+    A word matches where re.search(r'\\b' + re.escape(word) + r'\\b') would. Words made
+    of word characters only are whole \\w+ tokens of the message, so they are found by
+    looking its tokens up in a set; the rest (phrases, punctuation) go into one compiled
+    trie-shaped alternation. The matcher is rebuilt on the first check after a change.
+    """
+    def __init__(self, words=()):
+        self._words = set(words)
+        self._tokens = None  # set of plain-token words, None when stale
+        self._pattern = None  # compiled pattern for the rest, or None if there are none
+
+    def __len__(self): return len(self._words)
+    def __iter__(self): return iter(self._words)
+    def __contains__(self, word): return word in self._words
+
+    def add(self, word):
+        if word not in self._words: self._words.add(word); self._tokens = None
+
+    def discard(self, word):
+        if word in self._words: self._words.discard(word); self._tokens = None
+
+    def _build(self):
+        self._tokens = {word for word in self._words if _TOKEN.fullmatch(word)}
+        others = self._words - self._tokens
+        self._pattern = re.compile(rf"\b{_trie_pattern(others)}\b", re.IGNORECASE) if others else None
+
+    def find(self, message: str) -> str | None:
+        """Returns a filtered word found in message, or None."""
+        if not self._words: return None
+        if self._tokens is None: self._build()
+        message = message.lower()
+        if self._tokens:
+            word = next((token for token in _TOKEN.findall(message) if token in self._tokens), None)
+            if word: return word
+        match = self._pattern.search(message) if self._pattern else None
+        return match.group().lower() if match else None